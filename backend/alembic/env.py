@@ -14,6 +14,7 @@ from config import settings
 from core.Base import Base
 from core.enums import SafeEnum
 from user.User import User
+from auth.MaintenanceRun import MaintenanceRun
 from auth.RefreshToken import RefreshToken
 from project.Project import Project
 from experience.Experience import Experience
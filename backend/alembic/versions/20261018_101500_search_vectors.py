@@ -0,0 +1,73 @@
+"""search vectors
+
+Stored tsvector columns with GIN indexes for full-text search.
+Tables that do not exist yet are skipped, Base.metadata.create_all
+builds them with the columns and indexes already in place.
+
+Revision ID: 3f1c9a7e5b20
+Revises: dd8dcd51358d
+Create Date: 2026-10-18 10:15:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '3f1c9a7e5b20'
+down_revision: Union[str, None] = 'dd8dcd51358d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTORS = {
+    "projects": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(technical_details, '')), 'C')"
+    ),
+    "experiences": (
+        "setweight(to_tsvector('english', coalesce(company, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(role, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ),
+    "certifications": (
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(issuer, '')), 'B')"
+    ),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, expression in SEARCH_VECTORS.items():
+        if not inspector.has_table(table):
+            continue
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        if "search_vector" in columns:
+            continue
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in SEARCH_VECTORS:
+        if not inspector.has_table(table):
+            continue
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
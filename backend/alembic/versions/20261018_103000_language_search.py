@@ -0,0 +1,148 @@
+"""language search
+
+Rebuild the stored tsvector columns with the text search configuration
+of each row language, add a trigram search_text column for languages
+without a stemmer, and replace the single GIN index with per language
+partial indexes. Configurations are frozen here so later changes to
+core.fts need their own migration.
+
+Revision ID: 7b2e4d91c6a8
+Revises: 3f1c9a7e5b20
+Create Date: 2026-10-18 10:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '7b2e4d91c6a8'
+down_revision: Union[str, None] = '3f1c9a7e5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_CONFIGS = {
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "pt": "portuguese",
+    "ar": "arabic",
+}
+TRIGRAM_LANGUAGES = ("zh", "hi")
+
+SEARCH_COLUMNS = {
+    "projects": (
+        ("title", "A"),
+        ("description", "B"),
+        ("technical_details", "C"),
+    ),
+    "experiences": (
+        ("company", "A"),
+        ("role", "A"),
+        ("description", "B"),
+    ),
+    "certifications": (
+        ("name", "A"),
+        ("issuer", "B"),
+    ),
+}
+
+ENGLISH_VECTORS = {
+    table: " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+    for table, columns in SEARCH_COLUMNS.items()
+}
+
+
+def _vector_expression(columns) -> str:
+    branches = " ".join(
+        f"WHEN '{language}' THEN '{config}'::regconfig"
+        for language, config in SEARCH_CONFIGS.items()
+    )
+    config = f"CASE language {branches} ELSE 'simple'::regconfig END"
+    return " || ".join(
+        f"setweight(to_tsvector({config}, coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def _text_expression(columns) -> str:
+    languages = ", ".join(f"'{language}'" for language in TRIGRAM_LANGUAGES)
+    body = " || ' ' || ".join(f"coalesce({column}, '')" for column, _ in columns)
+    return f"CASE WHEN language IN ({languages}) THEN {body} END"
+
+
+def _add_vector(table: str, expression: str) -> None:
+    op.add_column(
+        table,
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(expression, persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    inspector = sa.inspect(op.get_bind())
+    for table, columns in SEARCH_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table)}
+        if "search_text" in existing:
+            continue
+
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        _add_vector(table, _vector_expression(columns))
+        op.add_column(
+            table,
+            sa.Column(
+                "search_text",
+                sa.Text(),
+                sa.Computed(_text_expression(columns), persisted=True),
+                nullable=True,
+            ),
+        )
+
+        for language in SEARCH_CONFIGS:
+            op.create_index(
+                f"ix_{table}_search_vector_{language}",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_where=sa.text(f"language = '{language}'"),
+            )
+        op.create_index(
+            f"ix_{table}_search_text_trgm",
+            table,
+            ["search_text"],
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+            postgresql_where=sa.text("search_text IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in SEARCH_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_text_trgm")
+        for language in SEARCH_CONFIGS:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector_{language}")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_text")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        _add_vector(table, ENGLISH_VECTORS[table])
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
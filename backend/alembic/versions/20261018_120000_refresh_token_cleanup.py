@@ -0,0 +1,37 @@
+"""refresh token cleanup
+
+Partial index on revoked_at for the batched pruning of revoked refresh
+tokens, expires_at is already indexed. Skipped while the table does not
+exist yet, Base.metadata.create_all builds it with the index in place.
+
+Revision ID: 5d8f2a6c1e47
+Revises: 7b2e4d91c6a8
+Create Date: 2026-10-18 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d8f2a6c1e47'
+down_revision: Union[str, None] = '7b2e4d91c6a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("refresh_tokens"):
+        return
+    op.create_index(
+        "ix_refresh_tokens_revoked_at",
+        "refresh_tokens",
+        ["revoked_at"],
+        postgresql_where=sa.text("is_revoked"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_refresh_tokens_revoked_at")
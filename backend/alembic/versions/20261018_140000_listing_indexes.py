@@ -0,0 +1,51 @@
+"""listing indexes
+
+Composite (language, display_order, id) indexes matching the keyset
+pagination of the content lists, partial on is_visible where the lists
+filter on it. Users page on the primary key alone. Tables that do not
+exist yet are skipped, Base.metadata.create_all builds them with the
+indexes already in place.
+
+Revision ID: 9c3e7a1f5b28
+Revises: 5d8f2a6c1e47
+Create Date: 2026-10-18 14:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9c3e7a1f5b28'
+down_revision: Union[str, None] = '5d8f2a6c1e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VISIBLE_TABLES = ("experiences", "certifications", "blogs")
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("projects"):
+        op.create_index(
+            "ix_projects_language_display_order",
+            "projects",
+            ["language", "display_order", "id"],
+            if_not_exists=True,
+        )
+    for table in VISIBLE_TABLES:
+        if not inspector.has_table(table):
+            continue
+        op.create_index(
+            f"ix_{table}_language_display_order",
+            table,
+            ["language", "display_order", "id"],
+            postgresql_where=sa.text("is_visible"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for table in VISIBLE_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_language_display_order")
+    op.execute("DROP INDEX IF EXISTS ix_projects_language_display_order")
@@ -0,0 +1,36 @@
+"""maintenance runs
+
+Last start of each periodic maintenance job, so the app workers run a
+job once per interval between them. Skipped when create_all already
+built the table.
+
+Revision ID: 2a7d5e9c4b16
+Revises: 9c3e7a1f5b28
+Create Date: 2026-10-18 16:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '2a7d5e9c4b16'
+down_revision: Union[str, None] = '9c3e7a1f5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("maintenance_runs"):
+        return
+    op.create_table(
+        "maintenance_runs",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_maintenance_runs")),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS maintenance_runs")
@@ -14,29 +14,33 @@ from fastapi import (
 )
 
 from config import (
+    PAGINATION_CURSOR_MAX_LENGTH,
     settings,
     UserRole,
 )
 from core.dependencies import RequireRole
+from core.principal import Principal
 from core.responses import (
     AUTH_401,
     CONFLICT_409,
     FORBIDDEN_403,
     NOT_FOUND_404,
+    FastJSONResponse,
 )
+from search.cache import searchcache
+from search.schemas import SearchCacheStatsResponse
 from user.schemas import (
     AdminUserCreate,
     UserListResponse,
     UserResponse,
     UserUpdateAdmin,
 )
-from user.User import User
 from user.dependencies import UserServiceDep
 
 
 router = APIRouter(prefix = "/admin", tags = ["admin"])
 
-AdminOnly = Annotated[User, Depends(RequireRole(UserRole.ADMIN))]
+AdminOnly = Annotated[Principal, Depends(RequireRole(UserRole.ADMIN))]
 
 
 @router.get(
@@ -57,11 +61,21 @@ async def list_users(
         ge = 1,
         le = settings.PAGINATION_MAX_SIZE
     ),
-) -> UserListResponse:
+    cursor: str | None = Query(
+        default = None,
+        max_length = PAGINATION_CURSOR_MAX_LENGTH
+    ),
+) -> FastJSONResponse:
     """
     List all users (admin only)
+
+    Pass next_cursor back as cursor to fetch the following page
     """
-    return await user_service.list_users(page, size)
+    return FastJSONResponse(
+        await user_service.list_users(page,
+                                      size,
+                                      cursor)
+    )
 
 
 @router.post(
@@ -145,3 +159,25 @@ async def delete_user(
     Delete user (admin only, hard delete)
     """
     await user_service.admin_delete_user(user_id)
+
+
+@router.get(
+    "/cache/search",
+    response_model = SearchCacheStatsResponse,
+    responses = {
+        **AUTH_401,
+        **FORBIDDEN_403
+    },
+)
+async def search_cache_stats(_: AdminOnly) -> SearchCacheStatsResponse:
+    """
+    Search result cache hit and miss counters of this worker (admin only)
+    """
+    stats = searchcache.stats
+    return SearchCacheStatsResponse(
+        local_hits = stats.local_hits,
+        redis_hits = stats.redis_hits,
+        misses = stats.misses,
+        hit_ratio = stats.hit_ratio,
+        local_size = searchcache.local_size,
+    )
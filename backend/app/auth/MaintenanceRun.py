@@ -0,0 +1,31 @@
+"""
+ⒸAngelaMos | 2025
+MaintenanceRun.py
+"""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    String,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+import config
+from core.Base import Base
+
+
+class MaintenanceRun(Base):
+    """
+    Last start of a periodic maintenance job, shared by every worker
+    """
+    __tablename__ = "maintenance_runs"
+
+    name: Mapped[str] = mapped_column(
+        String(config.MAINTENANCE_JOB_NAME_MAX_LENGTH),
+        primary_key = True,
+    )
+    last_run_at: Mapped[datetime] = mapped_column(DateTime(timezone = True))
@@ -13,7 +13,9 @@ import uuid6
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     String,
+    text,
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -84,6 +86,14 @@ class RefreshToken(Base, UUIDMixin, TimestampMixin):
 
     user: Mapped[User] = relationship(back_populates = "refresh_tokens")
 
+    __table_args__ = (
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where = text("is_revoked"),
+        ),
+    )
+
     def revoke(self) -> None:
         """
         Revoke this token
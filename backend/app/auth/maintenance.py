@@ -0,0 +1,183 @@
+"""
+ⒸAngelaMos | 2025
+maintenance.py
+
+Prune expired and long revoked refresh tokens
+
+Runs hourly inside the app on whichever worker first finds it due,
+or on demand from backend/app:
+    python -m auth.maintenance [--batch-size N] [--retention-days N]
+"""
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+
+import config
+from config import settings
+from core.database import sessionmanager
+from core.logging import (
+    configure_logging,
+    get_logger,
+)
+from .repository import (
+    MaintenanceRunRepository,
+    RefreshTokenRepository,
+)
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen = True, slots = True)
+class CleanupResult:
+    """
+    Rows deleted by one cleanup run
+    """
+    expired: int
+    revoked: int
+
+
+async def cleanup_refresh_tokens(
+    batch_size: int = config.TOKEN_CLEANUP_BATCH_SIZE,
+    retention_days: int = settings.REFRESH_TOKEN_REVOKED_RETENTION_DAYS,
+) -> CleanupResult | None:
+    """
+    Delete expired tokens, then tokens revoked before the retention window
+
+    Every batch commits on its own so locks stay short and a crash keeps
+    the progress made. None when another process holds the cleanup lock
+    """
+    async with sessionmanager.advisory_lock(
+            config.TOKEN_CLEANUP_LOCK_KEY) as leader:
+        if not leader:
+            return None
+
+        expired = 0
+        while True:
+            async with sessionmanager.session() as session:
+                deleted = await RefreshTokenRepository.cleanup_expired(
+                    session,
+                    batch_size,
+                )
+            expired += deleted
+            if deleted < batch_size:
+                break
+
+        revoked_before = datetime.now(UTC) - timedelta(days = retention_days)
+        revoked = 0
+        while True:
+            async with sessionmanager.session() as session:
+                deleted = await RefreshTokenRepository.cleanup_revoked(
+                    session,
+                    revoked_before,
+                    batch_size,
+                )
+            revoked += deleted
+            if deleted < batch_size:
+                break
+
+    logger.info(
+        "refresh_token_cleanup_completed",
+        expired = expired,
+        revoked = revoked,
+    )
+    return CleanupResult(expired = expired, revoked = revoked)
+
+
+class TokenCleanupTask:
+    """
+    Periodic cleanup inside the app
+
+    Every worker checks a few times per interval whether the job is due.
+    The last run is recorded in the database, so the first worker past
+    the interval claims the run and the rest skip until the next one
+    """
+    def __init__(self) -> None:
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """
+        Start the periodic loop
+        """
+        self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        """
+        Cancel the loop, waiting for a run in progress to unwind
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_if_due(self) -> CleanupResult | None:
+        """
+        Clean up unless a worker already did within the interval
+        """
+        async with sessionmanager.session() as session:
+            due = await MaintenanceRunRepository.claim(
+                session,
+                config.TOKEN_CLEANUP_JOB,
+                timedelta(seconds = config.TOKEN_CLEANUP_INTERVAL_SECONDS),
+            )
+        if not due:
+            return None
+        return await cleanup_refresh_tokens()
+
+    async def _run_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(config.TOKEN_CLEANUP_CHECK_SECONDS)
+            try:
+                await self.run_if_due()
+            except Exception:
+                logger.exception("refresh_token_cleanup_failed")
+
+
+tokencleanup = TokenCleanupTask()
+
+
+async def main(batch_size: int, retention_days: int) -> None:
+    """
+    One cleanup run from the command line
+    """
+    configure_logging()
+    sessionmanager.init(str(settings.DATABASE_URL))
+    try:
+        result = await cleanup_refresh_tokens(batch_size, retention_days)
+    finally:
+        await sessionmanager.close()
+
+    if result is None:
+        print("Cleanup already running in another process, skipped")
+        return
+    print(
+        f"Deleted {result.expired} expired and "
+        f"{result.revoked} revoked refresh tokens"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description = "Prune expired and revoked refresh tokens"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type = int,
+        default = config.TOKEN_CLEANUP_BATCH_SIZE,
+    )
+    parser.add_argument(
+        "--retention-days",
+        type = int,
+        default = settings.REFRESH_TOKEN_REVOKED_RETENTION_DAYS,
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size, args.retention_days))
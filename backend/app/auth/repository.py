@@ -3,14 +3,36 @@
 repository.py
 """
 
+from typing import NamedTuple
 from uuid import UUID
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select, update
+import uuid6
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .MaintenanceRun import MaintenanceRun
 from .RefreshToken import RefreshToken
 from core.base_repository import BaseRepository
+from user.User import User
+
+
+class RotatedToken(NamedTuple):
+    """
+    Owner of a refresh token that was rotated
+    """
+    user_id: UUID
+    family_id: UUID
+    token_version: int
 
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
@@ -77,9 +99,83 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         )
         session.add(token)
         await session.flush()
-        await session.refresh(token)
         return token
 
+    @classmethod
+    async def rotate(
+        cls,
+        session: AsyncSession,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+        device_id: str | None = None,
+        device_name: str | None = None,
+        ip_address: str | None = None,
+    ) -> RotatedToken | None:
+        """
+        Revoke a valid token and issue its successor in one statement
+
+        An UPDATE ... FROM users RETURNING CTE revokes the token only
+        while its owner is active and feeds an INSERT of the new token in
+        the same family. The row lock of the UPDATE serializes concurrent
+        rotations of one token, the loser re-checks is_revoked and matches
+        nothing
+
+        Returns None when the token is unknown, revoked, expired or its
+        user inactive, the caller looks it up again to tell which
+        """
+        now = datetime.now(UTC)
+        revoked = (
+            update(RefreshToken).where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.is_revoked == False,
+                RefreshToken.expires_at > now,
+                User.id == RefreshToken.user_id,
+                User.is_active == True,
+            ).values(
+                is_revoked = True,
+                revoked_at = now,
+                updated_at = now,
+            ).returning(
+                RefreshToken.user_id,
+                RefreshToken.family_id,
+                User.token_version,
+            ).cte("revoked")
+        )
+
+        columns = RefreshToken.__table__.c
+        successor = {
+            "id": literal(uuid6.uuid7(), columns.id.type),
+            "token_hash": literal(new_token_hash, columns.token_hash.type),
+            "user_id": revoked.c.user_id,
+            "family_id": revoked.c.family_id,
+            "expires_at": literal(expires_at, columns.expires_at.type),
+            "device_id": literal(device_id, columns.device_id.type),
+            "device_name": literal(device_name, columns.device_name.type),
+            "ip_address": literal(ip_address, columns.ip_address.type),
+            "is_revoked": literal(False, columns.is_revoked.type),
+            "created_at": literal(now, columns.created_at.type),
+        }
+        inserted = (
+            insert(RefreshToken).from_select(
+                list(successor),
+                select(*successor.values()),
+            ).returning(
+                RefreshToken.user_id,
+                RefreshToken.family_id,
+            ).cte("inserted")
+        )
+
+        result = await session.execute(
+            select(
+                inserted.c.user_id,
+                inserted.c.family_id,
+                revoked.c.token_version,
+            ).select_from(inserted.join(revoked, true()))
+        )
+        row = result.first()
+        return RotatedToken(*row) if row is not None else None
+
     @classmethod
     async def revoke_token(
         cls,
@@ -91,7 +187,6 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         """
         token.revoke()
         await session.flush()
-        await session.refresh(token)
         return token
 
     @classmethod
@@ -158,19 +253,84 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
     async def cleanup_expired(
         cls,
         session: AsyncSession,
+        batch_size: int,
     ) -> int:
         """
-        Delete expired tokens (for maintenance job)
+        Delete one batch of expired tokens (for maintenance job)
+
+        Set based, rows never load into memory. Postgres has no
+        DELETE ... LIMIT so the batch is picked by a subquery, skipping
+        rows locked by concurrent rotations
 
         Returns count of deleted tokens
         """
-        result = await session.execute(
-            select(RefreshToken).where(
+        batch = (
+            select(RefreshToken.id).where(
                 RefreshToken.expires_at < datetime.now(UTC)
-            )
+            ).limit(batch_size).with_for_update(skip_locked = True)
         )
-        tokens = result.scalars().all()
-        for token in tokens:
-            await session.delete(token)
-        await session.flush()
-        return len(tokens)
+        result = await session.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch))
+        )
+        return result.rowcount or 0
+
+    @classmethod
+    async def cleanup_revoked(
+        cls,
+        session: AsyncSession,
+        revoked_before: datetime,
+        batch_size: int,
+    ) -> int:
+        """
+        Delete one batch of tokens revoked before a cutoff
+
+        Revoked tokens are kept for a while so replaying them still
+        revokes their family, after the retention window they only
+        take space
+
+        Returns count of deleted tokens
+        """
+        batch = (
+            select(RefreshToken.id).where(
+                RefreshToken.is_revoked == True,
+                RefreshToken.revoked_at < revoked_before,
+            ).limit(batch_size).with_for_update(skip_locked = True)
+        )
+        result = await session.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch))
+        )
+        return result.rowcount or 0
+
+
+class MaintenanceRunRepository(BaseRepository[MaintenanceRun]):
+    """
+    Repository for MaintenanceRun model database operations
+    """
+    model = MaintenanceRun
+
+    @classmethod
+    async def claim(
+        cls,
+        session: AsyncSession,
+        name: str,
+        interval: timedelta,
+    ) -> bool:
+        """
+        Record a run of a job unless one started within the interval
+
+        A single upsert, whose conditional DO UPDATE lets exactly one of
+        the workers checking at the same time win. Times come from the
+        database clock so workers never disagree on them
+        """
+        now = func.now()
+        result = await session.execute(
+            pg_insert(MaintenanceRun).values(
+                name = name,
+                last_run_at = now,
+            ).on_conflict_do_update(
+                index_elements = [MaintenanceRun.name],
+                set_ = {"last_run_at": now},
+                where = MaintenanceRun.last_run_at <= now - interval,
+            ).returning(MaintenanceRun.name)
+        )
+        return result.first() is not None
@@ -20,7 +20,7 @@ from fastapi.security import (
 from config import settings
 from core.dependencies import (
     ClientIP,
-    CurrentUser,
+    CurrentUserModel,
 )
 from core.security import (
     clear_refresh_cookie,
@@ -36,7 +36,10 @@ from .schemas import (
 from user.schemas import UserResponse
 from .dependencies import AuthServiceDep
 from user.dependencies import UserServiceDep
-from core.responses import AUTH_401
+from core.responses import (
+    AUTH_401,
+    BUSY_503,
+)
 
 
 router = APIRouter(prefix = "/auth", tags = ["auth"])
@@ -45,7 +48,10 @@ router = APIRouter(prefix = "/auth", tags = ["auth"])
 @router.post(
     "/login",
     response_model = TokenWithUserResponse,
-    responses = {**AUTH_401}
+    responses = {
+        **AUTH_401,
+        **BUSY_503
+    }
 )
 @limiter.limit(settings.RATE_LIMIT_AUTH)
 async def login(
@@ -115,7 +121,7 @@ async def logout(
 async def logout_all(
     response: Response,
     auth_service: AuthServiceDep,
-    current_user: CurrentUser,
+    current_user: CurrentUserModel,
 ) -> dict[str,
           int]:
     """
@@ -127,7 +133,7 @@ async def logout_all(
 
 
 @router.get("/me", response_model = UserResponse, responses = {**AUTH_401})
-async def get_current_user(current_user: CurrentUser) -> UserResponse:
+async def get_current_user(current_user: CurrentUserModel) -> UserResponse:
     """
     Get current authenticated user
     """
@@ -141,7 +147,7 @@ async def get_current_user(current_user: CurrentUser) -> UserResponse:
 )
 async def change_password(
     user_service: UserServiceDep,
-    current_user: CurrentUser,
+    current_user: CurrentUserModel,
     data: PasswordChange,
 ) -> None:
     """
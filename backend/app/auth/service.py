@@ -3,6 +3,8 @@
 service.py
 """
 
+from typing import NoReturn
+
 import uuid6
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -68,7 +70,7 @@ class AuthService:
         access_token = create_access_token(user.id, user.token_version)
 
         family_id = uuid6.uuid7()
-        raw_refresh, token_hash, expires_at = create_refresh_token(user.id, family_id)
+        raw_refresh, token_hash, expires_at = create_refresh_token()
 
         await RefreshTokenRepository.create_token(
             self.session,
@@ -120,9 +122,37 @@ class AuthService:
         """
         Refresh access token using refresh token
 
-        Implements token rotation with replay attack detection
+        Implements token rotation with replay attack detection. The
+        happy path is a single statement, failures are diagnosed with a
+        second lookup
         """
         token_hash = hash_token(refresh_token)
+        new_raw_token, new_hash, expires_at = create_refresh_token()
+
+        rotated = await RefreshTokenRepository.rotate(
+            self.session,
+            token_hash,
+            new_hash,
+            expires_at,
+            device_id = device_id,
+            device_name = device_name,
+            ip_address = ip_address,
+        )
+        if rotated is None:
+            await self._reject_refresh(token_hash)
+
+        access_token = create_access_token(
+            rotated.user_id,
+            rotated.token_version,
+        )
+        return TokenResponse(access_token = access_token), new_raw_token
+
+    async def _reject_refresh(self, token_hash: str) -> NoReturn:
+        """
+        Raise the reason a refresh token could not be rotated
+
+        Reuse of a revoked token revokes its whole family
+        """
         stored_token = await RefreshTokenRepository.get_by_hash(
             self.session,
             token_hash
@@ -141,33 +171,7 @@ class AuthService:
         if stored_token.is_expired:
             raise TokenError(message = "Refresh token expired")
 
-        user = await UserRepository.get_by_id(
-            self.session,
-            stored_token.user_id
-        )
-        if user is None or not user.is_active:
-            raise TokenError(message = "User not found or inactive")
-
-        await RefreshTokenRepository.revoke_token(self.session, stored_token)
-
-        access_token = create_access_token(user.id, user.token_version)
-
-        new_raw_token, new_hash, expires_at = create_refresh_token(
-            user.id, stored_token.family_id
-        )
-
-        await RefreshTokenRepository.create_token(
-            self.session,
-            user_id = user.id,
-            token_hash = new_hash,
-            family_id = stored_token.family_id,
-            expires_at = expires_at,
-            device_id = device_id,
-            device_name = device_name,
-            ip_address = ip_address,
-        )
-
-        return TokenResponse(access_token = access_token), new_raw_token
+        raise TokenError(message = "User not found or inactive")
 
     async def logout(
         self,
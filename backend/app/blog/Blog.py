@@ -7,7 +7,9 @@ from datetime import date
 
 from sqlalchemy import (
     Date,
+    Index,
     String,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import (
@@ -87,3 +89,13 @@ class Blog(Base, UUIDMixin, TimestampMixin):
     is_featured: Mapped[bool] = mapped_column(
         default = False,
     )
+
+    __table_args__ = (
+        Index(
+            "ix_blogs_language_display_order",
+            "language",
+            "display_order",
+            "id",
+            postgresql_where = text("is_visible"),
+        ),
+    )
@@ -4,12 +4,20 @@ repository.py
 """
 
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
-from core.base_repository import BaseRepository
+from core.base_repository import (
+    BaseRepository,
+    Page,
+)
 from .Blog import Blog
 
 
@@ -18,25 +26,62 @@ class BlogRepository(BaseRepository[Blog]):
     Repository for Blog model database operations.
     """
     model = Blog
+    cache_namespace = config.CACHE_NS_BLOGS
+    cursor_keys = (Blog.display_order, Blog.id)
+    brief_columns = (
+        Blog.title,
+        Blog.external_url,
+        Blog.category,
+        Blog.is_featured,
+    )
 
     @classmethod
-    async def get_visible_by_language(
+    def _visible_by_language(
+        cls,
+        language: config.Language,
+    ) -> Select[tuple[Blog]]:
+        return select(Blog).where(Blog.language == language).where(
+            Blog.is_visible == True
+        )
+
+    @classmethod
+    async def get_visible_page_by_language(
         cls,
         session: AsyncSession,
         language: config.Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
-    ) -> Sequence[Blog]:
+        cursor: str | None = None,
+    ) -> Page[Blog]:
         """
-        Get all visible blog posts for a language.
-        Ordered by display_order for consistent listing.
+        Get a page of visible blog posts with the total for pagination.
         """
-        result = await session.execute(
-            select(Blog).where(Blog.language == language).where(
-                Blog.is_visible == True
-            ).order_by(Blog.display_order).offset(skip).limit(limit)
+        return await cls.paginate(
+            session,
+            cls._visible_by_language(language),
+            skip,
+            limit,
+            cursor,
+            count_parts = ("visible", language),
+        )
+
+    @classmethod
+    async def get_visible_brief_by_language(
+        cls,
+        session: AsyncSession,
+        language: config.Language,
+        limit: int = config.PAGINATION_DEFAULT_LIMIT,
+    ) -> Sequence[Row[Any]]:
+        """
+        Nav columns of visible blog posts, as plain rows.
+        """
+        return await cls.select_columns(
+            session,
+            cls._visible_by_language(language).order_by(
+                *cls.cursor_keys
+            ).limit(limit),
+            *cls.brief_columns,
         )
-        return result.scalars().all()
 
     @classmethod
     async def get_featured_by_language(
@@ -73,19 +118,3 @@ class BlogRepository(BaseRepository[Blog]):
             ).where(Blog.is_visible == True).order_by(Blog.display_order)
         )
         return result.scalars().all()
-
-    @classmethod
-    async def count_visible_by_language(
-        cls,
-        session: AsyncSession,
-        language: config.Language,
-    ) -> int:
-        """
-        Count visible blog posts for pagination.
-        """
-        result = await session.execute(
-            select(func.count()).select_from(Blog).where(
-                Blog.language == language
-            ).where(Blog.is_visible == True)
-        )
-        return result.scalar_one()
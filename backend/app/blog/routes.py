@@ -5,13 +5,22 @@ routes.py
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import (
+    APIRouter,
+    Query,
+    Response,
+)
 
 import config
 from config import BlogCategory
-from core.dependencies import QueryLanguage
+from core.cache import cached_response
+from core.dependencies import (
+    DBSessionFactory,
+    IfNoneMatch,
+    QueryLanguage,
+)
 from core.responses import NOT_FOUND_404
-from .dependencies import BlogServiceDep
+from .service import BlogService
 from .schemas import (
     BlogBriefResponse,
     BlogListResponse,
@@ -27,8 +36,9 @@ router = APIRouter(prefix = "/blogs", tags = ["blogs"])
     response_model = BlogListResponse,
 )
 async def list_blogs(
-    service: BlogServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     skip: int = Query(default = config.PAGINATION_DEFAULT_SKIP,
                       ge = 0),
     limit: int = Query(
@@ -36,11 +46,23 @@ async def list_blogs(
         ge = 1,
         le = config.PAGINATION_MAX_LIMIT
     ),
-) -> BlogListResponse:
+    cursor: str | None = Query(
+        default = None,
+        max_length = config.PAGINATION_CURSOR_MAX_LENGTH
+    ),
+) -> Response:
     """
     List all visible blog posts for the specified language.
+    Pass next_cursor back as cursor to fetch the following page.
     """
-    return await service.list_visible(lang, skip, limit)
+    return await cached_response(
+        config.CACHE_NS_BLOGS,
+        config.CACHE_TTL_BLOGS,
+        ("list", lang, skip, limit, cursor),
+        lambda db: BlogService(db).list_visible(lang, skip, limit, cursor),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -48,18 +70,26 @@ async def list_blogs(
     response_model = list[BlogResponse],
 )
 async def list_featured_blogs(
-    service: BlogServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     limit: int = Query(
         default = config.PAGINATION_FEATURED_LIMIT,
         ge = 1,
         le = config.PAGINATION_FEATURED_MAX_LIMIT
     ),
-) -> list[BlogResponse]:
+) -> Response:
     """
     List featured blog posts for the overview page.
     """
-    return await service.list_featured(lang, limit)
+    return await cached_response(
+        config.CACHE_NS_BLOGS,
+        config.CACHE_TTL_BLOGS,
+        ("featured", lang, limit),
+        lambda db: BlogService(db).list_featured(lang, limit),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -67,13 +97,21 @@ async def list_featured_blogs(
     response_model = list[BlogBriefResponse],
 )
 async def get_blog_nav(
-    service: BlogServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> list[BlogBriefResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get brief blog data for sidebar navigation.
     """
-    return await service.get_nav_items(lang)
+    return await cached_response(
+        config.CACHE_NS_BLOGS,
+        config.CACHE_TTL_BLOGS,
+        ("nav", lang),
+        lambda db: BlogService(db).get_nav_items(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -81,14 +119,22 @@ async def get_blog_nav(
     response_model = list[BlogResponse],
 )
 async def list_blogs_by_category(
-    service: BlogServiceDep,
+    sessions: DBSessionFactory,
     category: BlogCategory,
     lang: QueryLanguage,
-) -> list[BlogResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     List blog posts by category.
     """
-    return await service.list_by_category(category, lang)
+    return await cached_response(
+        config.CACHE_NS_BLOGS,
+        config.CACHE_TTL_BLOGS,
+        ("category", category, lang),
+        lambda db: BlogService(db).list_by_category(category, lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -97,10 +143,18 @@ async def list_blogs_by_category(
     responses = {**NOT_FOUND_404},
 )
 async def get_blog(
-    service: BlogServiceDep,
+    sessions: DBSessionFactory,
     blog_id: UUID,
-) -> BlogResponse:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get a single blog post by ID.
     """
-    return await service.get_by_id(blog_id)
+    return await cached_response(
+        config.CACHE_NS_BLOGS,
+        config.CACHE_TTL_BLOGS,
+        ("detail", blog_id),
+        lambda db: BlogService(db).get_by_id(blog_id),
+        sessions,
+        if_none_match,
+    )
@@ -52,3 +52,4 @@ class BlogListResponse(BaseSchema):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
@@ -13,6 +13,7 @@ from config import (
     Language,
 )
 from core.exceptions import BlogNotFound
+from snapshot import snapshotstore
 from .repository import BlogRepository
 from .schemas import (
     BlogBriefResponse,
@@ -32,6 +33,13 @@ class BlogService:
         """
         Get blog post by ID.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            cached = snapshot.blogs.by_id.get(blog_id)
+            if cached is None:
+                raise BlogNotFound(str(blog_id))
+            return cached
+
         blog = await BlogRepository.get_by_id(self.session, blog_id)
         if not blog:
             raise BlogNotFound(str(blog_id))
@@ -42,25 +50,36 @@ class BlogService:
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
+        cursor: str | None = None,
     ) -> BlogListResponse:
         """
         List visible blog posts for a language.
         """
-        blogs = await BlogRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.blogs.language(language)
+            items, next_cursor = view.paginate(skip, limit, cursor)
+            return BlogListResponse(
+                items = items,
+                total = len(view.visible),
+                skip = skip,
+                limit = limit,
+                next_cursor = next_cursor,
+            )
+
+        page = await BlogRepository.get_visible_page_by_language(
             self.session,
             language,
             skip,
             limit,
-        )
-        total = await BlogRepository.count_visible_by_language(
-            self.session,
-            language,
+            cursor,
         )
         return BlogListResponse(
-            items = [BlogResponse.model_validate(b) for b in blogs],
-            total = total,
+            items = [BlogResponse.model_validate(b) for b in page.items],
+            total = page.total,
             skip = skip,
             limit = limit,
+            next_cursor = page.next_cursor,
         )
 
     async def list_featured(
@@ -72,6 +91,10 @@ class BlogService:
         List featured blog posts for a language.
         Used for overview page highlights.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return list(snapshot.blogs.language(language).featured[:limit])
+
         blogs = await BlogRepository.get_featured_by_language(
             self.session,
             language,
@@ -87,6 +110,10 @@ class BlogService:
         """
         List blog posts by category and language.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return snapshot.blogs.language(language).category(category)
+
         blogs = await BlogRepository.get_by_category_and_language(
             self.session,
             category,
@@ -101,8 +128,16 @@ class BlogService:
         """
         Get brief blog data for sidebar navigation.
         """
-        blogs = await BlogRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.blogs.language(language)
+            return [
+                BlogBriefResponse.model_validate(b)
+                for b in view.page(0, config.PAGINATION_DEFAULT_LIMIT)
+            ]
+
+        rows = await BlogRepository.get_visible_brief_by_language(
             self.session,
             language,
         )
-        return [BlogBriefResponse.model_validate(b) for b in blogs]
+        return [BlogBriefResponse.model_validate(r) for r in rows]
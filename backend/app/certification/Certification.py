@@ -6,9 +6,14 @@ Certification.py
 from datetime import date
 
 from sqlalchemy import (
+    Computed,
     Date,
+    Index,
     String,
+    Text,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -25,9 +30,17 @@ from core.Base import (
     TimestampMixin,
     UUIDMixin,
 )
+from core.fts import (
+    SEARCH_WEIGHT_PRIMARY,
+    SEARCH_WEIGHT_SECONDARY,
+    SearchableMixin,
+    search_indexes,
+    search_text_sql,
+    search_vector_sql,
+)
 
 
-class Certification(Base, UUIDMixin, TimestampMixin):
+class Certification(SearchableMixin, Base, UUIDMixin, TimestampMixin):
     """
     Professional certification model with i18n support.
     Each row represents one certification in one language.
@@ -94,3 +107,37 @@ class Certification(Base, UUIDMixin, TimestampMixin):
     is_visible: Mapped[bool] = mapped_column(
         default = True,
     )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            search_vector_sql(
+                ("name", SEARCH_WEIGHT_PRIMARY),
+                ("issuer", SEARCH_WEIGHT_SECONDARY),
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            search_text_sql(
+                "name",
+                "issuer",
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_certifications_language_display_order",
+            "language",
+            "display_order",
+            "id",
+            postgresql_where = text("is_visible"),
+        ),
+        *search_indexes(__tablename__),
+    )
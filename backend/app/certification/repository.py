@@ -4,12 +4,20 @@ repository.py
 """
 
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
-from core.base_repository import BaseRepository
+from core.base_repository import (
+    BaseRepository,
+    Page,
+)
 from .Certification import Certification
 
 
@@ -18,27 +26,54 @@ class CertificationRepository(BaseRepository[Certification]):
     Repository for Certification model database operations.
     """
     model = Certification
+    cache_namespace = config.CACHE_NS_CERTIFICATIONS
+    cursor_keys = (Certification.display_order, Certification.id)
+    brief_columns = (
+        Certification.name,
+        Certification.issuer,
+        Certification.badge_image_url,
+        Certification.category,
+        Certification.is_expired,
+    )
 
     @classmethod
-    async def get_visible_by_language(
+    def _visible_by_language(
+        cls,
+        language: config.Language,
+    ) -> Select[tuple[Certification]]:
+        return select(Certification).where(
+            Certification.language == language
+        ).where(Certification.is_visible == True)
+
+    @classmethod
+    async def get_visible_page_by_language(
         cls,
         session: AsyncSession,
         language: config.Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
-    ) -> Sequence[Certification]:
+        cursor: str | None = None,
+    ) -> Page[Certification]:
         """
-        Get all visible certifications for a language.
-        Ordered by display_order for consistent listing.
+        Get a page of visible certifications with the total for pagination.
         """
-        result = await session.execute(
-            select(Certification).where(
-                Certification.language == language
-            ).where(Certification.is_visible == True).order_by(
-                Certification.display_order
-            ).offset(skip).limit(limit)
+        return await cls.paginate(
+            session,
+            cls._visible_by_language(language),
+            skip,
+            limit,
+            cursor,
+            count_parts = ("visible", language),
         )
-        return result.scalars().all()
+
+    @classmethod
+    def _active_by_language(
+        cls,
+        language: config.Language,
+    ) -> Select[tuple[Certification]]:
+        return cls._visible_by_language(language).where(
+            Certification.is_expired == False
+        ).order_by(Certification.display_order)
 
     @classmethod
     async def get_active_by_language(
@@ -49,15 +84,24 @@ class CertificationRepository(BaseRepository[Certification]):
         """
         Get non-expired certifications for a language.
         """
-        result = await session.execute(
-            select(Certification).where(
-                Certification.language == language
-            ).where(Certification.is_visible == True).where(
-                Certification.is_expired == False
-            ).order_by(Certification.display_order)
-        )
+        result = await session.execute(cls._active_by_language(language))
         return result.scalars().all()
 
+    @classmethod
+    async def get_active_brief_by_language(
+        cls,
+        session: AsyncSession,
+        language: config.Language,
+    ) -> Sequence[Row[Any]]:
+        """
+        Badge columns of non-expired certifications, as plain rows.
+        """
+        return await cls.select_columns(
+            session,
+            cls._active_by_language(language),
+            *cls.brief_columns,
+        )
+
     @classmethod
     async def get_by_category_and_language(
         cls,
@@ -76,19 +120,3 @@ class CertificationRepository(BaseRepository[Certification]):
             ).order_by(Certification.display_order)
         )
         return result.scalars().all()
-
-    @classmethod
-    async def count_visible_by_language(
-        cls,
-        session: AsyncSession,
-        language: config.Language,
-    ) -> int:
-        """
-        Count visible certifications for pagination.
-        """
-        result = await session.execute(
-            select(func.count()).select_from(Certification).where(
-                Certification.language == language
-            ).where(Certification.is_visible == True)
-        )
-        return result.scalar_one()
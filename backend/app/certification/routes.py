@@ -5,13 +5,22 @@ routes.py
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import (
+    APIRouter,
+    Query,
+    Response,
+)
 
 import config
 from config import CertificationCategory
-from core.dependencies import QueryLanguage
+from core.cache import cached_response
+from core.dependencies import (
+    DBSessionFactory,
+    IfNoneMatch,
+    QueryLanguage,
+)
 from core.responses import NOT_FOUND_404
-from .dependencies import CertificationServiceDep
+from .service import CertificationService
 from .schemas import (
     CertificationBriefResponse,
     CertificationListResponse,
@@ -27,8 +36,9 @@ router = APIRouter(prefix = "/certifications", tags = ["certifications"])
     response_model = CertificationListResponse,
 )
 async def list_certifications(
-    service: CertificationServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     skip: int = Query(default = config.PAGINATION_DEFAULT_SKIP,
                       ge = 0),
     limit: int = Query(
@@ -36,11 +46,28 @@ async def list_certifications(
         ge = 1,
         le = config.PAGINATION_MAX_LIMIT
     ),
-) -> CertificationListResponse:
+    cursor: str | None = Query(
+        default = None,
+        max_length = config.PAGINATION_CURSOR_MAX_LENGTH
+    ),
+) -> Response:
     """
     List all visible certifications for the specified language.
+    Pass next_cursor back as cursor to fetch the following page.
     """
-    return await service.list_visible(lang, skip, limit)
+    return await cached_response(
+        config.CACHE_NS_CERTIFICATIONS,
+        config.CACHE_TTL_CERTIFICATIONS,
+        ("list", lang, skip, limit, cursor),
+        lambda db: CertificationService(db).list_visible(
+            lang,
+            skip,
+            limit,
+            cursor,
+        ),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -48,13 +75,21 @@ async def list_certifications(
     response_model = list[CertificationResponse],
 )
 async def list_active_certifications(
-    service: CertificationServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> list[CertificationResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     List non-expired certifications.
     """
-    return await service.list_active(lang)
+    return await cached_response(
+        config.CACHE_NS_CERTIFICATIONS,
+        config.CACHE_TTL_CERTIFICATIONS,
+        ("active", lang),
+        lambda db: CertificationService(db).list_active(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -62,13 +97,21 @@ async def list_active_certifications(
     response_model = list[CertificationBriefResponse],
 )
 async def get_certification_badges(
-    service: CertificationServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> list[CertificationBriefResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get brief certification data for overview badges.
     """
-    return await service.get_badges(lang)
+    return await cached_response(
+        config.CACHE_NS_CERTIFICATIONS,
+        config.CACHE_TTL_CERTIFICATIONS,
+        ("badges", lang),
+        lambda db: CertificationService(db).get_badges(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -76,14 +119,22 @@ async def get_certification_badges(
     response_model = list[CertificationResponse],
 )
 async def list_certifications_by_category(
-    service: CertificationServiceDep,
+    sessions: DBSessionFactory,
     category: CertificationCategory,
     lang: QueryLanguage,
-) -> list[CertificationResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     List certifications by category.
     """
-    return await service.list_by_category(category, lang)
+    return await cached_response(
+        config.CACHE_NS_CERTIFICATIONS,
+        config.CACHE_TTL_CERTIFICATIONS,
+        ("category", category, lang),
+        lambda db: CertificationService(db).list_by_category(category, lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -92,10 +143,18 @@ async def list_certifications_by_category(
     responses = {**NOT_FOUND_404},
 )
 async def get_certification(
-    service: CertificationServiceDep,
+    sessions: DBSessionFactory,
     certification_id: UUID,
-) -> CertificationResponse:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get a single certification by ID.
     """
-    return await service.get_by_id(certification_id)
+    return await cached_response(
+        config.CACHE_NS_CERTIFICATIONS,
+        config.CACHE_TTL_CERTIFICATIONS,
+        ("detail", certification_id),
+        lambda db: CertificationService(db).get_by_id(certification_id),
+        sessions,
+        if_none_match,
+    )
@@ -54,3 +54,4 @@ class CertificationListResponse(BaseSchema):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
@@ -13,6 +13,7 @@ from config import (
     Language,
 )
 from core.exceptions import CertificationNotFound
+from snapshot import snapshotstore
 from .repository import CertificationRepository
 from .schemas import (
     CertificationBriefResponse,
@@ -35,6 +36,13 @@ class CertificationService:
         """
         Get certification by ID.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            cached = snapshot.certifications.by_id.get(certification_id)
+            if cached is None:
+                raise CertificationNotFound(str(certification_id))
+            return cached
+
         certification = await CertificationRepository.get_by_id(
             self.session,
             certification_id,
@@ -48,27 +56,38 @@ class CertificationService:
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
+        cursor: str | None = None,
     ) -> CertificationListResponse:
         """
         List visible certifications for a language.
         """
-        certifications = await CertificationRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.certifications.language(language)
+            items, next_cursor = view.paginate(skip, limit, cursor)
+            return CertificationListResponse(
+                items = items,
+                total = len(view.visible),
+                skip = skip,
+                limit = limit,
+                next_cursor = next_cursor,
+            )
+
+        page = await CertificationRepository.get_visible_page_by_language(
             self.session,
             language,
             skip,
             limit,
-        )
-        total = await CertificationRepository.count_visible_by_language(
-            self.session,
-            language,
+            cursor,
         )
         return CertificationListResponse(
             items = [
-                CertificationResponse.model_validate(c) for c in certifications
+                CertificationResponse.model_validate(c) for c in page.items
             ],
-            total = total,
+            total = page.total,
             skip = skip,
             limit = limit,
+            next_cursor = page.next_cursor,
         )
 
     async def list_active(
@@ -78,6 +97,10 @@ class CertificationService:
         """
         List non-expired certifications for a language.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return list(snapshot.certifications.language(language).featured)
+
         certifications = await CertificationRepository.get_active_by_language(
             self.session,
             language,
@@ -92,6 +115,12 @@ class CertificationService:
         """
         List certifications by category and language.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return snapshot.certifications.language(language).category(
+                category
+            )
+
         certifications = await CertificationRepository.get_by_category_and_language(
             self.session,
             category,
@@ -106,10 +135,15 @@ class CertificationService:
         """
         Get brief certification data for overview badges.
         """
-        certifications = await CertificationRepository.get_active_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return [
+                CertificationBriefResponse.model_validate(c)
+                for c in snapshot.certifications.language(language).featured
+            ]
+
+        rows = await CertificationRepository.get_active_brief_by_language(
             self.session,
             language,
         )
-        return [
-            CertificationBriefResponse.model_validate(c) for c in certifications
-        ]
+        return [CertificationBriefResponse.model_validate(r) for r in rows]
@@ -10,6 +10,7 @@ from functools import lru_cache
 from pydantic import (
     EmailStr,
     Field,
+    HttpUrl,
     RedisDsn,
     SecretStr,
     PostgresDsn,
@@ -26,25 +27,36 @@ from core.constants import (
     BLOG_CATEGORY_MAX_LENGTH,
     BLOG_DESCRIPTION_MAX_LENGTH,
     BLOG_TITLE_MAX_LENGTH,
+    CACHE_FILL_LOCK_TTL,
+    CACHE_FILL_POLL_SECONDS,
+    CACHE_GENERATION_SEED_LIMIT,
     CACHE_NS_BLOGS,
     CACHE_NS_CERTIFICATIONS,
     CACHE_NS_EXPERIENCES,
     CACHE_NS_GITHUB,
+    CACHE_NS_PRINCIPALS,
     CACHE_NS_PROJECTS,
+    CACHE_NS_SEARCH,
     CACHE_PREFIX,
     CACHE_TTL_BLOGS,
     CACHE_TTL_CERTIFICATIONS,
     CACHE_TTL_EXPERIENCES,
     CACHE_TTL_GITHUB,
+    CACHE_TTL_PAGE_COUNT,
+    CACHE_TTL_PRINCIPAL,
     CACHE_TTL_PROJECTS,
+    CACHE_TTL_SEARCH,
     CACHE_VERSION,
     CERTIFICATION_CATEGORY_MAX_LENGTH,
     CERTIFICATION_CREDENTIAL_ID_MAX_LENGTH,
     CERTIFICATION_ISSUER_MAX_LENGTH,
     CERTIFICATION_NAME_MAX_LENGTH,
+    CONTENT_LISTENER_RECONNECT_SECONDS,
+    CONTENT_NOTIFY_CHANNEL,
     DEFAULT_DISPLAY_ORDER,
     DEVICE_ID_MAX_LENGTH,
     DEVICE_NAME_MAX_LENGTH,
+    EDGE_PURGE_TIMEOUT_SECONDS,
     EMAIL_MAX_LENGTH,
     EXPERIENCE_COMPANY_MAX_LENGTH,
     EXPERIENCE_DEPARTMENT_MAX_LENGTH,
@@ -52,16 +64,24 @@ from core.constants import (
     EXPERIENCE_LOCATION_MAX_LENGTH,
     EXPERIENCE_ROLE_MAX_LENGTH,
     FULL_NAME_MAX_LENGTH,
+    HTTP_CACHE_MAX_AGE,
+    HTTP_CACHE_STALE_WHILE_REVALIDATE,
     IP_ADDRESS_MAX_LENGTH,
     LANGUAGE_CODE_MAX_LENGTH,
+    MAINTENANCE_JOB_NAME_MAX_LENGTH,
+    METRICS_FLUSH_SECONDS,
+    PAGINATION_CURSOR_MAX_LENGTH,
     PAGINATION_DEFAULT_LIMIT,
     PAGINATION_DEFAULT_SKIP,
     PAGINATION_FEATURED_LIMIT,
     PAGINATION_FEATURED_MAX_LIMIT,
     PAGINATION_MAX_LIMIT,
     PASSWORD_HASH_MAX_LENGTH,
+    PASSWORD_HASH_RETRY_AFTER,
     PASSWORD_MAX_LENGTH,
     PASSWORD_MIN_LENGTH,
+    PRINCIPAL_CACHE_LOCAL_SIZE,
+    PRINCIPAL_CACHE_LOCAL_TTL,
     PROJECT_CODE_FILENAME_MAX_LENGTH,
     PROJECT_CODE_LANGUAGE_MAX_LENGTH,
     PROJECT_DESCRIPTION_MAX_LENGTH,
@@ -69,7 +89,17 @@ from core.constants import (
     PROJECT_STATUS_MAX_LENGTH,
     PROJECT_SUBTITLE_MAX_LENGTH,
     PROJECT_TITLE_MAX_LENGTH,
+    SEARCH_CACHE_LOCAL_SIZE,
+    SEARCH_CACHE_LOCAL_TTL,
+    SUGGEST_DEFAULT_LIMIT,
+    SUGGEST_MAX_LIMIT,
+    SUGGEST_QUERY_MAX_LENGTH,
     TAG_MAX_LENGTH,
+    TOKEN_CLEANUP_BATCH_SIZE,
+    TOKEN_CLEANUP_CHECK_SECONDS,
+    TOKEN_CLEANUP_INTERVAL_SECONDS,
+    TOKEN_CLEANUP_JOB,
+    TOKEN_CLEANUP_LOCK_KEY,
     TOKEN_HASH_LENGTH,
     URL_MAX_LENGTH,
 )
@@ -93,25 +123,36 @@ __all__ = [
     "BLOG_CATEGORY_MAX_LENGTH",
     "BLOG_DESCRIPTION_MAX_LENGTH",
     "BLOG_TITLE_MAX_LENGTH",
+    "CACHE_FILL_LOCK_TTL",
+    "CACHE_FILL_POLL_SECONDS",
+    "CACHE_GENERATION_SEED_LIMIT",
     "CACHE_NS_BLOGS",
     "CACHE_NS_CERTIFICATIONS",
     "CACHE_NS_EXPERIENCES",
     "CACHE_NS_GITHUB",
+    "CACHE_NS_PRINCIPALS",
     "CACHE_NS_PROJECTS",
+    "CACHE_NS_SEARCH",
     "CACHE_PREFIX",
     "CACHE_TTL_BLOGS",
     "CACHE_TTL_CERTIFICATIONS",
     "CACHE_TTL_EXPERIENCES",
     "CACHE_TTL_GITHUB",
+    "CACHE_TTL_PAGE_COUNT",
+    "CACHE_TTL_PRINCIPAL",
     "CACHE_TTL_PROJECTS",
+    "CACHE_TTL_SEARCH",
     "CACHE_VERSION",
     "CERTIFICATION_CATEGORY_MAX_LENGTH",
     "CERTIFICATION_CREDENTIAL_ID_MAX_LENGTH",
     "CERTIFICATION_ISSUER_MAX_LENGTH",
     "CERTIFICATION_NAME_MAX_LENGTH",
+    "CONTENT_LISTENER_RECONNECT_SECONDS",
+    "CONTENT_NOTIFY_CHANNEL",
     "DEFAULT_DISPLAY_ORDER",
     "DEVICE_ID_MAX_LENGTH",
     "DEVICE_NAME_MAX_LENGTH",
+    "EDGE_PURGE_TIMEOUT_SECONDS",
     "EMAIL_MAX_LENGTH",
     "EXPERIENCE_COMPANY_MAX_LENGTH",
     "EXPERIENCE_DEPARTMENT_MAX_LENGTH",
@@ -119,16 +160,24 @@ __all__ = [
     "EXPERIENCE_LOCATION_MAX_LENGTH",
     "EXPERIENCE_ROLE_MAX_LENGTH",
     "FULL_NAME_MAX_LENGTH",
+    "HTTP_CACHE_MAX_AGE",
+    "HTTP_CACHE_STALE_WHILE_REVALIDATE",
     "IP_ADDRESS_MAX_LENGTH",
     "LANGUAGE_CODE_MAX_LENGTH",
+    "MAINTENANCE_JOB_NAME_MAX_LENGTH",
+    "METRICS_FLUSH_SECONDS",
+    "PAGINATION_CURSOR_MAX_LENGTH",
     "PAGINATION_DEFAULT_LIMIT",
     "PAGINATION_DEFAULT_SKIP",
     "PAGINATION_FEATURED_LIMIT",
     "PAGINATION_FEATURED_MAX_LIMIT",
     "PAGINATION_MAX_LIMIT",
     "PASSWORD_HASH_MAX_LENGTH",
+    "PASSWORD_HASH_RETRY_AFTER",
     "PASSWORD_MAX_LENGTH",
     "PASSWORD_MIN_LENGTH",
+    "PRINCIPAL_CACHE_LOCAL_SIZE",
+    "PRINCIPAL_CACHE_LOCAL_TTL",
     "PROJECT_CODE_FILENAME_MAX_LENGTH",
     "PROJECT_CODE_LANGUAGE_MAX_LENGTH",
     "PROJECT_DESCRIPTION_MAX_LENGTH",
@@ -136,7 +185,17 @@ __all__ = [
     "PROJECT_STATUS_MAX_LENGTH",
     "PROJECT_SUBTITLE_MAX_LENGTH",
     "PROJECT_TITLE_MAX_LENGTH",
+    "SEARCH_CACHE_LOCAL_SIZE",
+    "SEARCH_CACHE_LOCAL_TTL",
+    "SUGGEST_DEFAULT_LIMIT",
+    "SUGGEST_MAX_LIMIT",
+    "SUGGEST_QUERY_MAX_LENGTH",
     "TAG_MAX_LENGTH",
+    "TOKEN_CLEANUP_BATCH_SIZE",
+    "TOKEN_CLEANUP_CHECK_SECONDS",
+    "TOKEN_CLEANUP_INTERVAL_SECONDS",
+    "TOKEN_CLEANUP_JOB",
+    "TOKEN_CLEANUP_LOCK_KEY",
     "TOKEN_HASH_LENGTH",
     "URL_MAX_LENGTH",
     "BlogCategory",
@@ -190,16 +249,31 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = Field(default = 10, ge = 0, le = 50)
     DB_POOL_TIMEOUT: int = Field(default = 30, ge = 10)
     DB_POOL_RECYCLE: int = Field(default = 1800, ge = 300)
+    DB_SLOW_QUERY_MS: int | None = Field(default = 250, ge = 1)
 
     SECRET_KEY: SecretStr = Field(..., min_length = 32)
     JWT_ALGORITHM: Literal["HS256", "HS384", "HS512"] = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default = 15, ge = 5, le = 60)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default = 7, ge = 1, le = 30)
+    REFRESH_TOKEN_REVOKED_RETENTION_DAYS: int = Field(default = 30, ge = 1)
+    TOKEN_CLEANUP_ENABLED: bool = True
+
+    PASSWORD_HASH_WORKERS: int = Field(default = 2, ge = 1, le = 32)
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(default = 16, ge = 0)
+    PASSWORD_HASH_PROCESSES: bool = False
 
     ADMIN_EMAIL: EmailStr | None = None
 
     REDIS_URL: RedisDsn | None = None
 
+    EDGE_PURGE_URL: HttpUrl | None = None
+
+    SNAPSHOT_MODE: bool = False
+
+    CONTENT_NOTIFY_ENABLED: bool = True
+
+    METRICS_MULTIPROC_DIR: Path | None = None
+
     CORS_ORIGINS: list[str] = [
         "http://localhost",
         "http://localhost:3421",
@@ -5,6 +5,8 @@ Base.py
 
 from uuid import UUID
 from datetime import UTC, datetime
+from collections.abc import Mapping
+from typing import Any
 
 import uuid6
 from sqlalchemy.orm import (
@@ -32,8 +34,12 @@ NAMING_CONVENTION = {
 class Base(AsyncAttrs, DeclarativeBase):
     """
     Base class for all SQLAlchemy models
+
+    eager_defaults fetches server generated values with RETURNING on the
+    INSERT or UPDATE itself, so writes never need a refresh SELECT
     """
     metadata = MetaData(naming_convention = NAMING_CONVENTION)
+    __mapper_args__: Mapping[str, Any] = {"eager_defaults": True}
 
 
 class UUIDMixin:
@@ -61,7 +67,6 @@ class TimestampMixin:
         DateTime(timezone = True),
         default = None,
         onupdate = lambda: datetime.now(UTC),
-        server_onupdate = func.now(),
     )
 
 
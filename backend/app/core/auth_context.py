@@ -0,0 +1,73 @@
+"""
+ⒸAngelaMos | 2025
+auth_context.py
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import jwt
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.requests import Request
+
+from config import TokenType
+from .security import decode_access_token
+
+
+AUTH_STATE_KEY = "auth"
+
+
+@dataclass(frozen = True, slots = True)
+class AuthContext:
+    """
+    Bearer token of a request and its verified claims
+
+    claims is only set for a valid, unexpired access token, error
+    explains why a presented token was rejected
+    """
+    token: str | None = None
+    claims: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def subject(self) -> str | None:
+        """
+        Verified user ID, None for anonymous or rejected tokens
+        """
+        return self.claims["sub"] if self.claims is not None else None
+
+
+ANONYMOUS = AuthContext()
+
+
+def authenticate(authorization: str | None) -> AuthContext:
+    """
+    Verify the bearer token of an Authorization header
+    """
+    scheme, token = get_authorization_scheme_param(authorization)
+    if scheme.lower() != "bearer" or not token:
+        return ANONYMOUS
+
+    try:
+        claims = decode_access_token(token)
+    except jwt.InvalidTokenError as e:
+        return AuthContext(token = token, error = str(e))
+
+    if claims.get("type") != TokenType.ACCESS.value:
+        return AuthContext(token = token, error = "Invalid token type")
+
+    return AuthContext(token = token, claims = claims)
+
+
+def get_auth_context(request: Request) -> AuthContext:
+    """
+    Auth context of a request, verified at most once
+
+    AuthContextMiddleware fills it before routing, requests that bypass
+    the middleware verify here on first use
+    """
+    context = getattr(request.state, AUTH_STATE_KEY, None)
+    if context is None:
+        context = authenticate(request.headers.get("Authorization"))
+        setattr(request.state, AUTH_STATE_KEY, context)
+    return context
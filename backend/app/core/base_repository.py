@@ -3,28 +3,88 @@
 base_repository.py
 """
 
+import asyncio
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import (
     Any,
+    ClassVar,
     Generic,
     TypeVar,
 )
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Row,
+    Select,
+    func,
+    literal,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import config
 from .Base import Base
+from .cache import responsecache
+from .events import (
+    ContentChanged,
+    record_event,
+)
+from .pagination import (
+    decode_cursor,
+    encode_cursor,
+)
 
 
 ModelT = TypeVar("ModelT", bound = Base)
+ItemT = TypeVar("ItemT")
+
+
+@dataclass(frozen = True, slots = True)
+class Page(Generic[ItemT]):
+    """
+    One page of rows, the number of rows across all pages and the cursor
+    of the page after it
+    """
+    items: Sequence[ItemT]
+    total: int
+    next_cursor: str | None = None
 
 
 class BaseRepository(Generic[ModelT]):
     """
     Generic repository with common CRUD operations
+
+    Repositories of public content set cache_namespace so their writes
+    queue a ContentChanged event, published once the transaction commits.
+    Repositories that paginate set cursor_keys, the columns pages are
+    ordered by, unique together and encoded into cursors
     """
     model: type[ModelT]
+    cache_namespace: ClassVar[str | None] = None
+    cursor_keys: ClassVar[tuple[Any, ...]] = ()
+
+    @classmethod
+    def _record_change(
+        cls,
+        session: AsyncSession,
+        instance: ModelT,
+    ) -> None:
+        """
+        Queue a content change event for the instance language
+        """
+        if cls.cache_namespace is None:
+            return
+        record_event(
+            session,
+            ContentChanged(
+                namespace = cls.cache_namespace,
+                language = getattr(instance,
+                                   "language",
+                                   None),
+            ),
+        )
 
     @classmethod
     async def get_by_id(
@@ -52,6 +112,25 @@ class BaseRepository(Generic[ModelT]):
         )
         return result.scalars().all()
 
+    @classmethod
+    async def get_page(
+        cls,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> Page[ModelT]:
+        """
+        Get multiple records with the total count for pagination
+        """
+        return await cls.paginate(
+            session,
+            select(cls.model),
+            skip,
+            limit,
+            cursor,
+        )
+
     @classmethod
     async def count(cls, session: AsyncSession) -> int:
         """
@@ -62,6 +141,209 @@ class BaseRepository(Generic[ModelT]):
         )
         return result.scalar_one()
 
+    @classmethod
+    async def select_columns(
+        cls,
+        session: AsyncSession,
+        statement: Select[Any],
+        *columns: Any,
+    ) -> Sequence[Row[Any]]:
+        """
+        Only the given columns of a select, as plain rows
+
+        Rows skip entity construction and the identity map, for read only
+        responses that need a few small columns
+        """
+        result = await session.execute(statement.with_only_columns(*columns))
+        return result.all()
+
+    @classmethod
+    async def count_matching(
+        cls,
+        session: AsyncSession,
+        statement: Select[Any],
+    ) -> int:
+        """
+        Count the rows a select returns, ignoring its ordering and paging
+        """
+        result = await session.execute(
+            select(func.count()).select_from(
+                statement.order_by(None).offset(None).limit(None).subquery()
+            )
+        )
+        return result.scalar_one()
+
+    @classmethod
+    async def paginate(
+        cls,
+        session: AsyncSession,
+        statement: Select[Any],
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+        count_parts: Sequence[object] | None = None,
+    ) -> Page[ModelT]:
+        """
+        Fetch a page of a select ordered by cursor_keys and its total
+
+        Offset pages carry the total on every row as count(*) OVER (), one
+        round trip. A cursor from a previous page seeks past its last row
+        through the index instead of scanning and discarding every row
+        before it. With count_parts the total is cached in the repository
+        namespace, read from Redis while the page query runs
+        """
+        ordered = statement.order_by(*cls.cursor_keys)
+        if cursor is not None:
+            return await cls._paginate_keyset(
+                session,
+                statement,
+                ordered,
+                cursor,
+                limit,
+                count_parts,
+            )
+        if cls._count_cacheable(count_parts):
+            return await cls._paginate_cached_count(
+                session,
+                statement,
+                ordered,
+                skip,
+                limit,
+                count_parts,
+            )
+
+        result = await session.execute(
+            ordered.add_columns(func.count().over().label("total")
+                                ).offset(skip).limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif skip == 0:
+            total = 0
+        else:
+            total = await cls.count_matching(session, statement)
+        items = [row[0] for row in rows]
+        return cls._page(items, total, skip + len(items) < total)
+
+    @classmethod
+    async def _paginate_cached_count(
+        cls,
+        session: AsyncSession,
+        statement: Select[Any],
+        ordered: Select[Any],
+        skip: int,
+        limit: int,
+        count_parts: Sequence[object] | None,
+    ) -> Page[ModelT]:
+        (key, total), result = await asyncio.gather(
+            cls._cached_count(count_parts),
+            session.execute(ordered.offset(skip).limit(limit)),
+        )
+        items = result.scalars().all()
+        if total is None:
+            if 0 < len(items) < limit or (skip == 0 and not items):
+                total = skip + len(items)
+            else:
+                total = await cls.count_matching(session, statement)
+            await cls._store_count(key, total)
+        return cls._page(items, total, skip + len(items) < total)
+
+    @classmethod
+    async def _paginate_keyset(
+        cls,
+        session: AsyncSession,
+        statement: Select[Any],
+        ordered: Select[Any],
+        cursor: str,
+        limit: int,
+        count_parts: Sequence[object] | None,
+    ) -> Page[ModelT]:
+        after = decode_cursor(
+            cursor,
+            [key.type.python_type for key in cls.cursor_keys],
+        )
+        seek = ordered.where(
+            tuple_(*cls.cursor_keys) > tuple_(
+                *(
+                    literal(value,
+                            key.type)
+                    for key, value in zip(
+                        cls.cursor_keys,
+                        after,
+                        strict = True,
+                    )
+                )
+            )
+        ).limit(limit + 1)
+
+        key, total = None, None
+        if cls._count_cacheable(count_parts):
+            (key, total), result = await asyncio.gather(
+                cls._cached_count(count_parts),
+                session.execute(seek),
+            )
+        else:
+            result = await session.execute(seek)
+        rows = result.scalars().all()
+        if total is None:
+            total = await cls.count_matching(session, statement)
+            await cls._store_count(key, total)
+        return cls._page(rows[:limit], total, len(rows) > limit)
+
+    @classmethod
+    def _page(
+        cls,
+        items: Sequence[ModelT],
+        total: int,
+        has_more: bool,
+    ) -> Page[ModelT]:
+        next_cursor = None
+        if has_more and items and cls.cursor_keys:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, key.key) for key in cls.cursor_keys]
+            )
+        return Page(items = items, total = total, next_cursor = next_cursor)
+
+    @classmethod
+    def _count_cacheable(cls, count_parts: Sequence[object] | None) -> bool:
+        return (
+            cls.cache_namespace is not None and count_parts is not None
+            and responsecache.is_available
+        )
+
+    @classmethod
+    async def _cached_count(
+        cls,
+        count_parts: Sequence[object] | None,
+    ) -> tuple[str | None, int | None]:
+        """
+        Cache key of a total and its cached value, if any
+        """
+        if cls.cache_namespace is None or count_parts is None:
+            return None, None
+        generation = await responsecache.generation(cls.cache_namespace)
+        if generation is None:
+            return None, None
+        key = responsecache.build_key(
+            cls.cache_namespace,
+            f"g{generation}",
+            "count",
+            *count_parts,
+        )
+        cached = await responsecache.get(key)
+        return key, int(cached) if cached is not None else None
+
+    @classmethod
+    async def _store_count(cls, key: str | None, total: int) -> None:
+        if key is not None:
+            await responsecache.set(
+                key,
+                str(total).encode(),
+                config.CACHE_TTL_PAGE_COUNT,
+            )
+
     @classmethod
     async def create(
         cls,
@@ -74,7 +356,7 @@ class BaseRepository(Generic[ModelT]):
         instance = cls.model(**kwargs)
         session.add(instance)
         await session.flush()
-        await session.refresh(instance)
+        cls._record_change(session, instance)
         return instance
 
     @classmethod
@@ -87,10 +369,11 @@ class BaseRepository(Generic[ModelT]):
         """
         Update an existing record
         """
+        cls._record_change(session, instance)
         for key, value in kwargs.items():
             setattr(instance, key, value)
         await session.flush()
-        await session.refresh(instance)
+        cls._record_change(session, instance)
         return instance
 
     @classmethod
@@ -102,5 +385,6 @@ class BaseRepository(Generic[ModelT]):
         """
         Delete a record
         """
+        cls._record_change(session, instance)
         await session.delete(instance)
         await session.flush()
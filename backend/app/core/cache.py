@@ -0,0 +1,554 @@
+"""
+ⒸAngelaMos | 2025
+cache.py
+"""
+
+import asyncio
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Sequence,
+)
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from enum import Enum
+from functools import partial
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+)
+
+import redis.asyncio as redis
+from fastapi import Response
+from pydantic_core import to_json
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+from .database import SessionFactory
+from .edge import SURROGATE_KEY_HEADER
+from .events import (
+    ContentChanged,
+    eventbus,
+)
+from .logging import get_logger
+from .metrics import track_cache
+from .singleflight import SingleFlight
+
+
+logger = get_logger(__name__)
+
+Loader = Callable[[AsyncSession], Awaitable[Any]]
+
+T = TypeVar("T")
+
+
+def _key_segment(part: object) -> str:
+    """
+    Render a single cache key segment, using enum values not names
+    """
+    if isinstance(part, Enum):
+        return str(part.value)
+    return str(part)
+
+
+@dataclass(slots = True)
+class CacheStats:
+    """
+    Hit and miss counters of a two tier cache
+    """
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of lookups served without running the loader
+        """
+        hits = self.local_hits + self.redis_hits + self.coalesced
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """
+        Counters plus the derived hit ratio
+        """
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+class LocalCache(Generic[T]):
+    """
+    Bounded, in process LRU with a per entry time to live
+
+    Sits in front of Redis for the hottest keys. The TTL bounds how long
+    a worker can serve an entry another worker already invalidated
+    """
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> T | None:
+        """
+        Get a live entry and mark it most recently used
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: T) -> None:
+        """
+        Store an entry, evicting the least recently used when full
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+
+    def discard(self, key: str) -> None:
+        """
+        Drop one entry if present
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry
+        """
+        self._entries.clear()
+
+
+class ResponseCache:
+    """
+    Read through cache of serialized JSON response bodies in Redis
+
+    Keys are namespaced and versioned with CACHE_PREFIX/CACHE_VERSION so a
+    version bump orphans every previously stored payload. Each namespace
+    also carries a generation counter that is part of every key, bumping it
+    on a content change makes all entries of that namespace unreachable at
+    once without a SCAN+DEL sweep. Every Redis failure degrades to a cache
+    miss, the database stays the source of truth
+
+    In snapshot mode content_version is the version of the snapshot this
+    worker serves from. It is part of every key, so a worker still holding
+    the previous snapshot after a bump cannot store its stale bodies under
+    the key of the fresh ones
+    """
+    def __init__(self) -> None:
+        self._client: redis.Redis[bytes] | None = None
+        self._fills: SingleFlight[bytes] = SingleFlight()
+        self.stats = CacheStats()
+        self.content_version: str | None = None
+
+    def init(self, redis_url: str) -> None:
+        """
+        Create the Redis client used for response payloads
+        """
+        self._client = redis.from_url(redis_url)
+        eventbus.subscribe(ContentChanged, self._on_content_changed)
+
+    async def close(self) -> None:
+        """
+        Close the Redis connection pool
+        """
+        eventbus.unsubscribe(ContentChanged, self._on_content_changed)
+        if self._client is not None:
+            # types-redis predates aclose, the replacement of close
+            await self._client.aclose()  # type: ignore[attr-defined]
+            self._client = None
+
+    @property
+    def is_available(self) -> bool:
+        """
+        Whether a Redis client has been configured
+        """
+        return self._client is not None
+
+    @staticmethod
+    def build_key(namespace: str, *parts: object) -> str:
+        """
+        Build a namespaced, versioned cache key
+        """
+        segments = [config.CACHE_PREFIX, config.CACHE_VERSION, namespace]
+        segments.extend(_key_segment(part) for part in parts)
+        return ":".join(segments)
+
+    @classmethod
+    def generation_key(cls, namespace: str) -> str:
+        """
+        Key of the generation counter for a namespace
+        """
+        return cls.build_key(namespace, "generation")
+
+    async def _seed_generation(self, key: str) -> None:
+        """
+        Start a missing generation counter at a random value
+
+        Counters live only in Redis, after a flush, restart or eviction
+        one starting over at 0 would hand out keys, and so ETags, that
+        clients already hold for older content
+        """
+        if self._client is not None:
+            await self._client.set(
+                key,
+                secrets.randbelow(config.CACHE_GENERATION_SEED_LIMIT),
+                nx = True,
+            )
+
+    async def generation(self, namespace: str) -> int | None:
+        """
+        Current generation of a namespace
+
+        None when Redis is unavailable, callers must not cache in that case
+        since they cannot know which generation the payload belongs to
+        """
+        if self._client is None:
+            return None
+        key = self.generation_key(namespace)
+        try:
+            value = await self._client.get(key)
+            if value is None:
+                await self._seed_generation(key)
+                value = await self._client.get(key)
+        except RedisError as e:
+            logger.warning(
+                "cache_generation_failed",
+                namespace = namespace,
+                error = str(e),
+            )
+            return None
+        return int(value) if value is not None else None
+
+    async def generations(
+        self,
+        namespaces: Sequence[str],
+    ) -> tuple[int, ...] | None:
+        """
+        Current generations of several namespaces in one round trip
+        """
+        if self._client is None:
+            return None
+        keys = [self.generation_key(namespace) for namespace in namespaces]
+        try:
+            values = await self._client.mget(keys)
+            if None in values:
+                for key, value in zip(keys, values, strict = True):
+                    if value is None:
+                        await self._seed_generation(key)
+                values = await self._client.mget(keys)
+        except RedisError as e:
+            logger.warning(
+                "cache_generation_failed",
+                namespace = ",".join(namespaces),
+                error = str(e),
+            )
+            return None
+        generations = tuple(
+            int(value) for value in values if value is not None
+        )
+        return generations if len(generations) == len(keys) else None
+
+    async def bump_generation(self, namespace: str) -> None:
+        """
+        Invalidate every cached entry of a namespace
+        """
+        if self._client is None:
+            return
+        key = self.generation_key(namespace)
+        try:
+            await self._seed_generation(key)
+            await self._client.incr(key)
+        except RedisError as e:
+            logger.warning(
+                "cache_invalidate_failed",
+                namespace = namespace,
+                error = str(e),
+            )
+
+    async def _on_content_changed(self, event: ContentChanged) -> None:
+        if not event.remote:
+            await self.bump_generation(event.namespace)
+
+    async def get(self, key: str) -> bytes | None:
+        """
+        Get a cached payload, None on miss or Redis failure
+        """
+        if self._client is None:
+            return None
+        try:
+            return await self._client.get(key)
+        except RedisError as e:
+            logger.warning("cache_get_failed", key = key, error = str(e))
+            return None
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: int,
+        *,
+        only_if_absent: bool = False,
+    ) -> None:
+        """
+        Store a payload with expiry, failures are logged and ignored
+
+        only_if_absent keeps an existing value, read through fills use it
+        so they never overwrite a fresher value written by an invalidation
+        """
+        if self._client is None:
+            return
+        try:
+            await self._client.set(key, value, ex = ttl, nx = only_if_absent)
+        except RedisError as e:
+            logger.warning("cache_set_failed", key = key, error = str(e))
+
+    async def current_key(
+        self,
+        namespace: str,
+        parts: Sequence[object],
+    ) -> str | None:
+        """
+        Key of parts at the current generation of a namespace
+
+        None when Redis is unavailable and the generation is unknown
+        """
+        generation = await self.generation(namespace)
+        if generation is None:
+            return None
+        if self.content_version is not None:
+            parts = (f"s{self.content_version}", *parts)
+        return self.build_key(namespace, f"g{generation}", *parts)
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        ttl: int,
+        parts: Sequence[object],
+        loader: Loader,
+        sessions: SessionFactory,
+    ) -> bytes:
+        """
+        Return cached JSON bytes or run the loader and cache its result
+
+        A hit skips both the database and Pydantic serialization
+        """
+        key = await self.current_key(namespace, parts)
+        return await self.get_or_load(key, ttl, loader, sessions)
+
+    async def get_or_load(
+        self,
+        key: str | None,
+        ttl: int,
+        loader: Loader,
+        sessions: SessionFactory,
+    ) -> bytes:
+        """
+        get_or_set for a key from current_key, None always runs the loader
+
+        Misses are single flight, concurrent requests for the same key in
+        this worker share one fill. The loader gets a session opened from
+        sessions, never one of a request, since the fill runs on after the
+        request that started it is gone. Callers wait for the fill, there
+        is no stale body to hand out meanwhile, a superseded generation
+        is unreachable by design
+        """
+        if key is None:
+            self.stats.misses += 1
+            return await self._load(loader, sessions)
+
+        cached = await self.get(key)
+        if cached is not None:
+            self.stats.redis_hits += 1
+            return cached
+
+        body, shared = await self._fills.do(
+            key,
+            partial(self._fill, key, ttl, loader, sessions),
+        )
+        if shared:
+            self.stats.coalesced += 1
+        return body
+
+    async def _fill(
+        self,
+        key: str,
+        ttl: int,
+        loader: Loader,
+        sessions: SessionFactory,
+    ) -> bytes:
+        """
+        Run the loader for a missed key, unless another worker holds its
+        fill lock and stores the payload while this one waits
+        """
+        lock_key = f"{key}:fill"
+        locked = await self._try_lock(lock_key)
+        if not locked:
+            body = await self._wait_for_fill(key, lock_key)
+            if body is not None:
+                self.stats.coalesced += 1
+                return body
+
+        self.stats.misses += 1
+        try:
+            body = await self._load(loader, sessions)
+            await self.set(key, body, ttl, only_if_absent = True)
+        finally:
+            if locked:
+                await self._unlock(lock_key)
+        return body
+
+    @staticmethod
+    async def _load(loader: Loader, sessions: SessionFactory) -> bytes:
+        async with sessions() as session:
+            return to_json(await loader(session))
+
+    async def _try_lock(self, lock_key: str) -> bool:
+        """
+        Take a short lived fill lock
+
+        True when Redis cannot tell, a failing lock must not stop the fill
+        """
+        if self._client is None:
+            return True
+        try:
+            return bool(
+                await self._client.set(
+                    lock_key,
+                    b"1",
+                    ex = config.CACHE_FILL_LOCK_TTL,
+                    nx = True,
+                )
+            )
+        except RedisError as e:
+            logger.warning("cache_lock_failed", key = lock_key, error = str(e))
+            return True
+
+    async def _unlock(self, lock_key: str) -> None:
+        if self._client is None:
+            return
+        try:
+            await self._client.delete(lock_key)
+        except RedisError as e:
+            logger.warning(
+                "cache_unlock_failed",
+                key = lock_key,
+                error = str(e),
+            )
+
+    async def _wait_for_fill(self, key: str, lock_key: str) -> bytes | None:
+        """
+        Poll until the lock holder stores the payload
+
+        None once the lock is gone without a payload, its loader failed,
+        or the lock expired, the caller then runs the loader itself
+        """
+        if self._client is None:
+            return None
+        deadline = time.monotonic() + config.CACHE_FILL_LOCK_TTL
+        while time.monotonic() < deadline:
+            await asyncio.sleep(config.CACHE_FILL_POLL_SECONDS)
+            try:
+                body, held = await self._client.mget([key, lock_key])
+            except RedisError as e:
+                logger.warning("cache_get_failed", key = key, error = str(e))
+                return None
+            if body is not None:
+                return body
+            if held is None:
+                return None
+        return None
+
+
+responsecache = ResponseCache()
+track_cache("response", responsecache.stats)
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Strong entity tag of a cache key or a response body
+    """
+    return f'"{hashlib.blake2b(data, digest_size = 16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether an If-None-Match header names the given entity tag
+
+    If-None-Match uses the weak comparison, a W/ prefix still matches
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def public_cache_headers(namespace: str) -> dict[str, str]:
+    """
+    Freshness and edge cache tag headers of a public, cacheable response
+    """
+    return {
+        "Cache-Control": (
+            f"public, max-age={config.HTTP_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={config.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+        SURROGATE_KEY_HEADER: namespace,
+    }
+
+
+async def cached_response(
+    namespace: str,
+    ttl: int,
+    parts: Sequence[object],
+    loader: Loader,
+    sessions: SessionFactory,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Serve a route from the response cache as raw JSON bytes
+
+    The ETag is derived from the cache key, which embeds the namespace
+    generation, so it changes exactly when the content may have. A client
+    holding it gets a 304 after a single Redis read, before the cached
+    body, the database or the serializer are touched. Without Redis the
+    ETag falls back to a hash of the body
+    """
+    key = await responsecache.current_key(namespace, parts)
+    body = None
+    if key is None:
+        body = await responsecache.get_or_load(None, ttl, loader, sessions)
+        etag = make_etag(body)
+    else:
+        etag = make_etag(key.encode())
+
+    headers = {"ETag": etag, **public_cache_headers(namespace)}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code = 304, headers = headers)
+    if body is None:
+        body = await responsecache.get_or_load(key, ttl, loader, sessions)
+    return Response(
+        content = body,
+        media_type = "application/json",
+        headers = headers,
+    )
@@ -7,6 +7,7 @@ EMAIL_MAX_LENGTH = 320
 PASSWORD_MIN_LENGTH = 8
 PASSWORD_MAX_LENGTH = 128
 PASSWORD_HASH_MAX_LENGTH = 1024
+PASSWORD_HASH_RETRY_AFTER = 2
 FULL_NAME_MAX_LENGTH = 255
 
 TOKEN_HASH_LENGTH = 64
@@ -52,6 +53,7 @@ PAGINATION_DEFAULT_LIMIT = 100
 PAGINATION_FEATURED_LIMIT = 10
 PAGINATION_MAX_LIMIT = 100
 PAGINATION_FEATURED_MAX_LIMIT = 20
+PAGINATION_CURSOR_MAX_LENGTH = 256
 
 CACHE_PREFIX = "portfolio"
 CACHE_VERSION = "v1"
@@ -61,9 +63,47 @@ CACHE_NS_EXPERIENCES = "experiences"
 CACHE_NS_CERTIFICATIONS = "certifications"
 CACHE_NS_BLOGS = "blogs"
 CACHE_NS_GITHUB = "github"
+CACHE_NS_SEARCH = "search"
+CACHE_NS_PRINCIPALS = "principals"
 
 CACHE_TTL_PROJECTS = 86400
 CACHE_TTL_EXPERIENCES = 86400
 CACHE_TTL_CERTIFICATIONS = 86400
 CACHE_TTL_BLOGS = 21600
 CACHE_TTL_GITHUB = 3600
+CACHE_TTL_SEARCH = 3600
+CACHE_TTL_PRINCIPAL = 300
+CACHE_TTL_PAGE_COUNT = 3600
+
+CACHE_GENERATION_SEED_LIMIT = 2**48
+
+CACHE_FILL_LOCK_TTL = 5
+CACHE_FILL_POLL_SECONDS = 0.05
+
+HTTP_CACHE_MAX_AGE = 60
+HTTP_CACHE_STALE_WHILE_REVALIDATE = 600
+
+EDGE_PURGE_TIMEOUT_SECONDS = 2.0
+
+SEARCH_CACHE_LOCAL_SIZE = 512
+SEARCH_CACHE_LOCAL_TTL = 30
+
+PRINCIPAL_CACHE_LOCAL_SIZE = 4096
+PRINCIPAL_CACHE_LOCAL_TTL = 5
+
+SUGGEST_QUERY_MAX_LENGTH = 50
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+
+CONTENT_NOTIFY_CHANNEL = "portfolio_content"
+CONTENT_LISTENER_RECONNECT_SECONDS = 5
+
+METRICS_FLUSH_SECONDS = 5
+
+TOKEN_CLEANUP_BATCH_SIZE = 1000
+TOKEN_CLEANUP_INTERVAL_SECONDS = 3600
+TOKEN_CLEANUP_CHECK_SECONDS = 300
+TOKEN_CLEANUP_JOB = "refresh_token_cleanup"
+TOKEN_CLEANUP_LOCK_KEY = 74210015
+
+MAINTENANCE_JOB_NAME_MAX_LENGTH = 64
@@ -6,10 +6,15 @@ database.py
 import contextlib
 from collections.abc import (
     AsyncIterator,
+    Callable,
     Iterator,
 )
+from contextlib import AbstractAsyncContextManager
 
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    create_engine,
+    text,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import (
@@ -20,8 +25,23 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from config import settings
+from .instrumentation import instrument_engine
+from .metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    metrics,
+)
+from .events import (
+    discard_pending_events,
+    publish_pending_events,
+)
+from .notify import notify_pending_events
+
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 
 class DatabaseSessionManager:
@@ -50,6 +70,7 @@ class DatabaseSessionManager:
             pool_pre_ping = True,
             echo = settings.DEBUG,
         )
+        instrument_engine(self._async_engine.sync_engine)
         self._async_sessionmaker = async_sessionmaker(
             bind = self._async_engine,
             class_ = AsyncSession,
@@ -89,12 +110,28 @@ class DatabaseSessionManager:
             self._sync_engine = None
             self._sync_sessionmaker = None
 
+    def collect_metrics(self) -> None:
+        """
+        Export usage of the async connection pool
+        """
+        if self._async_engine is None:
+            return
+        pool = self._async_engine.pool
+        if not isinstance(pool, QueuePool):
+            return
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
     @contextlib.asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
         """
         Async context manager for database sessions
 
-        Handles commit on success, rollback on exception
+        Handles commit on success, rollback on exception.
+        Events queued during the transaction are sent to other workers
+        with the commit and published locally once the session is closed,
+        outside the rollback handling, so a subscriber can never turn a
+        committed write into an error
         """
         if self._async_sessionmaker is None:
             raise RuntimeError("DatabaseSessionManager is not initialized")
@@ -102,12 +139,15 @@ class DatabaseSessionManager:
         session = self._async_sessionmaker()
         try:
             yield session
+            await notify_pending_events(session)
             await session.commit()
         except Exception:
+            discard_pending_events(session)
             await session.rollback()
             raise
         finally:
             await session.close()
+        await publish_pending_events(session)
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -120,6 +160,34 @@ class DatabaseSessionManager:
         async with self._async_engine.begin() as connection:
             yield connection
 
+    @contextlib.asynccontextmanager
+    async def advisory_lock(self, key: int) -> AsyncIterator[bool]:
+        """
+        Try to take a session level advisory lock for the block
+
+        Yields whether this process holds it, others yield False instead
+        of waiting. The lock lives on a dedicated connection that is not
+        left in a transaction, so it survives the commits made inside
+        """
+        if self._async_engine is None:
+            raise RuntimeError("DatabaseSessionManager is not initialized")
+
+        async with self._async_engine.connect() as connection:
+            acquired = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": key},
+            )
+            await connection.commit()
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    await connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": key},
+                    )
+                    await connection.commit()
+
     @property
     def sync_engine(self) -> Engine:
         """
@@ -149,6 +217,7 @@ class DatabaseSessionManager:
 
 
 sessionmanager = DatabaseSessionManager()
+metrics.add_collector(sessionmanager.collect_metrics)
 
 
 async def get_db_session() -> AsyncIterator[AsyncSession]:
@@ -157,3 +226,11 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
     """
     async with sessionmanager.session() as session:
         yield session
+
+
+def get_session_factory() -> SessionFactory:
+    """
+    FastAPI dependency for work that may outlive the request, like a
+    shared cache fill, and so opens sessions of its own
+    """
+    return sessionmanager.session
@@ -8,17 +8,18 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-import jwt
-from fastapi import Depends, Request
+from fastapi import Depends, Header, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
-from config import (
-    TokenType,
-    UserRole,
+from config import UserRole
+from .auth_context import get_auth_context
+from .database import (
+    SessionFactory,
+    get_db_session,
+    get_session_factory,
 )
-from .database import get_db_session
 from .exceptions import (
     InactiveUser,
     PermissionDenied,
@@ -27,7 +28,10 @@ from .exceptions import (
     UserNotFound,
 )
 from user.User import User
-from .security import decode_access_token
+from .principal import (
+    Principal,
+    principalcache,
+)
 from user.repository import UserRepository
 
 
@@ -42,70 +46,101 @@ oauth2_scheme_optional = OAuth2PasswordBearer(
 )
 
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
+DBSessionFactory = Annotated[SessionFactory, Depends(get_session_factory)]
+
+
+async def load_principal(
+    db: AsyncSession,
+    user_id: UUID,
+) -> Principal | None:
+    """
+    Principal of a user, from the cache or the users table
+    """
+    async def load() -> Principal | None:
+        user = await UserRepository.get_by_id(db, user_id)
+        return Principal.from_user(user) if user is not None else None
+
+    return await principalcache.get_or_load(user_id, load)
 
 
 async def get_current_user(
-    token: Annotated[str,
-                     Depends(oauth2_scheme)],
+    request: Request,
+    _: Annotated[str,
+                 Depends(oauth2_scheme)],
     db: DBSession,
-) -> User:
+) -> Principal:
     """
-    Validate access token and return current user
-    """
-    try:
-        payload = decode_access_token(token)
-    except jwt.InvalidTokenError as e:
-        raise TokenError(message = str(e)) from e
+    Validate access token and return the current principal
 
-    if payload.get("type") != TokenType.ACCESS.value:
-        raise TokenError(message = "Invalid token type")
+    Claims come from the request auth context, verified once per request.
+    The users table is only read on a principal cache miss
+    """
+    auth = get_auth_context(request)
+    if auth.claims is None:
+        raise TokenError(message = auth.error or "Invalid token")
 
+    payload = auth.claims
     user_id = UUID(payload["sub"])
-    user = await UserRepository.get_by_id(db, user_id)
+    principal = await load_principal(db, user_id)
 
-    if user is None:
+    if principal is None:
         raise UserNotFound(identifier = str(user_id))
 
-    if payload.get("token_version") != user.token_version:
+    if payload.get("token_version") != principal.token_version:
         raise TokenRevokedError()
 
-    return user
+    return principal
 
 
 async def get_current_active_user(
-    user: Annotated[User,
-                    Depends(get_current_user)],
-) -> User:
+    principal: Annotated[Principal,
+                         Depends(get_current_user)],
+) -> Principal:
     """
     Ensure user is active
     """
-    if not user.is_active:
+    if not principal.is_active:
         raise InactiveUser()
+    return principal
+
+
+async def get_current_user_model(
+    principal: Annotated[Principal,
+                         Depends(get_current_active_user)],
+    db: DBSession,
+) -> User:
+    """
+    Load the full row of the current user, for routes that read or
+    modify it
+    """
+    user = await UserRepository.get_by_id(db, principal.id)
+    if user is None:
+        raise UserNotFound(identifier = str(principal.id))
     return user
 
 
 async def get_optional_user(
-    token: Annotated[str | None,
-                     Depends(oauth2_scheme_optional)],
+    request: Request,
+    _: Annotated[str | None,
+                 Depends(oauth2_scheme_optional)],
     db: DBSession,
-) -> User | None:
+) -> Principal | None:
     """
-    Return current user if authenticated, None otherwise
+    Return current principal if authenticated, None otherwise
     """
-    if token is None:
+    payload = get_auth_context(request).claims
+    if payload is None:
         return None
 
     try:
-        payload = decode_access_token(token)
-        if payload.get("type") != TokenType.ACCESS.value:
-            return None
         user_id = UUID(payload["sub"])
-        user = await UserRepository.get_by_id(db, user_id)
-        if user and user.token_version == payload.get("token_version"):
-            return user
-    except (jwt.InvalidTokenError, ValueError):
-        pass
+    except ValueError:
+        return None
 
+    principal = await load_principal(db, user_id)
+    token_version = payload.get("token_version")
+    if principal and principal.token_version == token_version:
+        return principal
     return None
 
 
@@ -118,19 +153,20 @@ class RequireRole:
 
     async def __call__(
         self,
-        user: Annotated[User,
-                        Depends(get_current_active_user)],
-    ) -> User:
-        if user.role not in self.allowed_roles:
+        principal: Annotated[Principal,
+                             Depends(get_current_active_user)],
+    ) -> Principal:
+        if principal.role not in self.allowed_roles:
             raise PermissionDenied(
                 message =
                 f"Requires one of roles: {', '.join(r.value for r in self.allowed_roles)}",
             )
-        return user
+        return principal
 
 
-CurrentUser = Annotated["User", Depends(get_current_active_user)]
-OptionalUser = Annotated["User | None", Depends(get_optional_user)]
+CurrentUser = Annotated["Principal", Depends(get_current_active_user)]
+CurrentUserModel = Annotated["User", Depends(get_current_user_model)]
+OptionalUser = Annotated["Principal | None", Depends(get_optional_user)]
 
 
 def get_client_ip(request: Request) -> str:
@@ -156,3 +192,15 @@ def get_language(
 
 
 QueryLanguage = Annotated[config.Language, Depends(get_language)]
+
+
+def get_if_none_match(
+    if_none_match: str | None = Header(default = None),
+) -> str | None:
+    """
+    Entity tags the client already holds, for conditional GET
+    """
+    return if_none_match
+
+
+IfNoneMatch = Annotated[str | None, Depends(get_if_none_match)]
@@ -0,0 +1,104 @@
+"""
+ⒸAngelaMos | 2025
+edge.py
+"""
+
+import httpx
+
+import config
+from .events import (
+    ContentChanged,
+    eventbus,
+)
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+
+def surrogate_keys(namespace: str) -> tuple[str, ...]:
+    """
+    Edge cache keys a change in a namespace makes stale
+
+    Search results embed every content namespace, so they go stale with
+    any of them
+    """
+    if namespace == config.CACHE_NS_SEARCH:
+        return (namespace, )
+    return (namespace, config.CACHE_NS_SEARCH)
+
+
+class EdgePurger:
+    """
+    Purges the nginx micro cache in front of the public read API
+
+    Responses are tagged with a Surrogate-Key header naming their cache
+    namespace. On a content change the keys are POSTed to the nginx purge
+    endpoint, which bumps a per key generation that is part of its cache
+    key, the same scheme the response cache uses in Redis. Subscribed
+    after the response cache so nginx refetches only once Redis moved to
+    the new generation. Failures are logged, the micro cache TTL bounds
+    how long the edge can serve a missed purge
+    """
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._url: str | None = None
+
+    def init(
+        self,
+        purge_url: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Create the HTTP client and follow content changes
+        """
+        self._client = httpx.AsyncClient(
+            timeout = config.EDGE_PURGE_TIMEOUT_SECONDS,
+            transport = transport,
+        )
+        self._url = purge_url
+        eventbus.subscribe(ContentChanged, self._on_content_changed)
+
+    async def close(self) -> None:
+        """
+        Stop following content changes and close the HTTP client
+        """
+        eventbus.unsubscribe(ContentChanged, self._on_content_changed)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Whether a purge endpoint has been configured
+        """
+        return self._client is not None
+
+    async def purge(self, *keys: str) -> None:
+        """
+        Invalidate every edge cached response tagged with any of the keys
+        """
+        if self._client is None or self._url is None:
+            return
+        try:
+            response = await self._client.post(
+                self._url,
+                headers = {SURROGATE_KEY_HEADER: " ".join(keys)},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(
+                "edge_purge_failed",
+                keys = " ".join(keys),
+                error = str(e),
+            )
+
+    async def _on_content_changed(self, event: ContentChanged) -> None:
+        if not event.remote:
+            await self.purge(*surrogate_keys(event.namespace))
+
+
+edgepurger = EdgePurger()
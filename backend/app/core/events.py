@@ -0,0 +1,141 @@
+"""
+ⒸAngelaMos | 2025
+events.py
+"""
+
+from collections import defaultdict
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Language
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+PENDING_EVENTS_KEY = "pending_events"
+
+EventHandler = Callable[[Any], Awaitable[None]]
+
+
+@dataclass(frozen = True, slots = True)
+class ContentChanged:
+    """
+    A public content row was created, updated or deleted
+
+    language is None when a change spans every language (bulk clears).
+    remote marks a change committed by another process and relayed over
+    LISTEN/NOTIFY, shared state such as Redis was already updated there
+    """
+    namespace: str
+    language: Language | None = None
+    remote: bool = False
+
+
+class EventBus:
+    """
+    In process publish/subscribe for domain events
+
+    Handler failures are logged and never propagate to the publisher,
+    a broken subscriber must not fail a write that already committed
+    """
+    def __init__(self) -> None:
+        self._handlers: defaultdict[type, list[EventHandler]] = defaultdict(
+            list
+        )
+        self._remote: defaultdict[type, set[EventHandler]] = defaultdict(set)
+
+    def subscribe(
+        self,
+        event_type: type,
+        handler: EventHandler,
+        *,
+        remote: bool = False,
+    ) -> None:
+        """
+        Register a handler for an event type
+
+        remote marks handlers keeping per process state, they need events
+        committed by other processes relayed to them
+        """
+        if handler not in self._handlers[event_type]:
+            self._handlers[event_type].append(handler)
+        if remote:
+            self._remote[event_type].add(handler)
+
+    def unsubscribe(self, event_type: type, handler: EventHandler) -> None:
+        """
+        Remove a previously registered handler
+        """
+        if handler in self._handlers[event_type]:
+            self._handlers[event_type].remove(handler)
+        self._remote[event_type].discard(handler)
+
+    def has_remote_subscribers(self, event_type: type) -> bool:
+        """
+        Whether any handler needs events of other processes relayed
+        """
+        return bool(self._remote[event_type])
+
+    async def publish(self, *events: object) -> None:
+        """
+        Deliver events to their subscribers in order
+        """
+        for event in events:
+            for handler in list(self._handlers[type(event)]):
+                try:
+                    await handler(event)
+                except Exception:
+                    logger.exception(
+                        "event_handler_failed",
+                        event_repr = repr(event),
+                    )
+
+
+eventbus = EventBus()
+
+
+def record_event(session: AsyncSession, event: object) -> None:
+    """
+    Queue an event on the session until its transaction commits
+    """
+    session.info.setdefault(PENDING_EVENTS_KEY, []).append(event)
+
+
+def _distinct(events: list[object]) -> list[object]:
+    """
+    Drop repeated events, keeping each at its last position so events
+    that carry state are delivered with the final state of the transaction
+    """
+    return list(reversed(dict.fromkeys(reversed(events))))
+
+
+def pending_events(session: AsyncSession) -> list[object]:
+    """
+    Distinct events queued on the session, in order
+    """
+    return _distinct(session.info.get(PENDING_EVENTS_KEY, []))
+
+
+def discard_pending_events(session: AsyncSession) -> None:
+    """
+    Drop queued events after a rollback
+    """
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+async def publish_pending_events(session: AsyncSession) -> None:
+    """
+    Publish queued events once, after a successful commit
+
+    Duplicate events from the same transaction are delivered once
+    """
+    events = session.info.pop(PENDING_EVENTS_KEY, [])
+    if events:
+        await eventbus.publish(*_distinct(events))
@@ -135,6 +135,33 @@ class RateLimitExceeded(BaseAppException):
         self.retry_after = retry_after
 
 
+class ServiceBusy(BaseAppException):
+    """
+    Raised when a bounded resource is saturated, clients should retry
+    """
+    def __init__(
+        self,
+        message: str = "Service is busy, try again shortly",
+        retry_after: int = 1,
+        extra: dict[str,
+                    Any] | None = None,
+    ) -> None:
+        super().__init__(message = message, status_code = 503, extra = extra)
+        self.retry_after = retry_after
+
+
+class InvalidCursor(ValidationError):
+    """
+    Raised when a pagination cursor cannot be decoded
+    """
+    def __init__(self, extra: dict[str, Any] | None = None) -> None:
+        super().__init__(
+            message = "Invalid pagination cursor",
+            field = "cursor",
+            extra = extra,
+        )
+
+
 class UserNotFound(ResourceNotFound):
     """
     Raised when a user is not found
@@ -0,0 +1,111 @@
+"""
+ⒸAngelaMos | 2025
+executor.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
+
+from .exceptions import ServiceBusy
+from .metrics import (
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_REJECTED,
+    PASSWORD_HASH_WAIT,
+)
+
+
+T = TypeVar("T")
+
+
+def _run_timed(fn: Callable[..., T], *args: Any) -> tuple[float, T]:
+    """
+    Run fn and report when it started, runs inside the worker
+    """
+    return time.monotonic(), fn(*args)
+
+
+class BoundedExecutor:
+    """
+    Dedicated, size capped pool for CPU bound work such as Argon2
+
+    Keeps hashing off the default executor shared by every other blocking
+    call. At most workers + queue_size jobs are accepted, beyond that run
+    raises ServiceBusy instead of letting latency pile up. The pool is
+    created on first use, with processes when the GIL is the bottleneck
+    """
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        processes: bool = False,
+        retry_after: int = 1,
+    ) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.processes = processes
+        self.retry_after = retry_after
+        self._executor: Executor | None = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Jobs accepted and not yet finished
+        """
+        return self._pending
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            if self.processes:
+                self._executor = ProcessPoolExecutor(self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers,
+                    thread_name_prefix = "argon2",
+                )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn in the pool, failing fast when the queue is full
+
+        fn and its arguments must be picklable in process mode
+        """
+        if self._pending >= self.capacity:
+            PASSWORD_HASH_REJECTED.inc()
+            raise ServiceBusy(retry_after = self.retry_after)
+
+        self._pending += 1
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        submitted = time.monotonic()
+        try:
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                self._pool(),
+                _run_timed,
+                fn,
+                *args,
+            )
+        finally:
+            self._pending -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+
+        PASSWORD_HASH_WAIT.observe(max(started - submitted, 0.0))
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Stop the pool, queued jobs are cancelled
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
+            self._executor = None
@@ -0,0 +1,136 @@
+"""
+ⒸAngelaMos | 2025
+fts.py
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import (
+    DDL,
+    Index,
+    event,
+    text,
+)
+
+from config import Language
+from .Base import Base
+
+
+SEARCH_CONFIGS: dict[Language, str] = {
+    Language.ENGLISH: "english",
+    Language.SPANISH: "spanish",
+    Language.FRENCH: "french",
+    Language.PORTUGUESE: "portuguese",
+    Language.ARABIC: "arabic",
+}
+SEARCH_CONFIG_FALLBACK = "simple"
+
+TRIGRAM_LANGUAGES: tuple[Language, ...] = (
+    Language.MANDARIN,
+    Language.HINDI,
+)
+
+SEARCH_WEIGHT_PRIMARY = "A"
+SEARCH_WEIGHT_SECONDARY = "B"
+SEARCH_WEIGHT_TERTIARY = "C"
+
+# SQLAlchemy leaves DDL.__init__ unannotated
+TRIGRAM_EXTENSION_DDL = DDL(  # type: ignore[no-untyped-call]
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+)
+
+event.listen(Base.metadata, "before_create", TRIGRAM_EXTENSION_DDL)
+
+
+def search_config(language: Language) -> str:
+    """
+    Postgres text search configuration for a content language
+    """
+    return SEARCH_CONFIGS.get(language, SEARCH_CONFIG_FALLBACK)
+
+
+def uses_trigram(language: Language) -> bool:
+    """
+    Whether a language has no stemmer and is searched by trigram instead
+    """
+    return language in TRIGRAM_LANGUAGES
+
+
+def _config_case() -> str:
+    """
+    Pick the regconfig from the row language inside a generated column
+    """
+    branches = " ".join(
+        f"WHEN '{language.value}' THEN '{config}'::regconfig"
+        for language, config in SEARCH_CONFIGS.items()
+    )
+    return (
+        f"CASE language {branches} "
+        f"ELSE '{SEARCH_CONFIG_FALLBACK}'::regconfig END"
+    )
+
+
+def search_vector_sql(*weighted_columns: tuple[str, str]) -> str:
+    """
+    Build the expression of a stored, generated tsvector column
+
+    Takes (column, weight) pairs so titles can outrank body text in
+    ts_rank. Each row is tokenised with the configuration of its own
+    language, only immutable functions are allowed in generated columns
+    which is why configurations are literals
+    """
+    config = _config_case()
+    return " || ".join(
+        f"setweight(to_tsvector({config}, "
+        f"coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
+def search_text_sql(*columns: str) -> str:
+    """
+    Build the expression of the stored trigram search text column
+
+    Only populated for languages without a stemmer, NULL elsewhere
+    """
+    languages = ", ".join(
+        f"'{language.value}'" for language in TRIGRAM_LANGUAGES
+    )
+    body = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"CASE WHEN language IN ({languages}) THEN {body} END"
+
+
+def search_indexes(table: str) -> tuple[Index, ...]:
+    """
+    Per language partial GIN indexes for a searchable table
+
+    One tsvector index per stemmed language plus a single pg_trgm index
+    over search_text, so every query resolves to one indexed lookup
+    """
+    vector_indexes = tuple(
+        Index(
+            f"ix_{table}_search_vector_{language.value}",
+            "search_vector",
+            postgresql_using = "gin",
+            postgresql_where = text(f"language = '{language.value}'"),
+        ) for language in SEARCH_CONFIGS
+    )
+    trigram_index = Index(
+        f"ix_{table}_search_text_trgm",
+        "search_text",
+        postgresql_using = "gin",
+        postgresql_ops = {"search_text": "gin_trgm_ops"},
+        postgresql_where = text("search_text IS NOT NULL"),
+    )
+    return vector_indexes + (trigram_index, )
+
+
+class SearchableMixin:
+    """
+    Mixin for models with computed search columns
+
+    Turns eager_defaults off so those columns stay out of RETURNING on
+    every write, they are deferred and expired instead
+    """
+    __mapper_args__: Mapping[str, Any] = {"eager_defaults": False}
@@ -0,0 +1,119 @@
+"""
+ⒸAngelaMos | 2025
+instrumentation.py
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import (
+    Connection,
+    Engine,
+)
+
+from config import settings
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+QUERY_START_KEY = "query_start_times"
+SLOW_QUERY_STATEMENT_MAX_LENGTH = 500
+
+
+@dataclass(slots = True)
+class QueryStats:
+    """
+    Queries issued and database time spent while handling one request
+    """
+    count: int = 0
+    duration_ms: float = 0.0
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing header value for the request
+        """
+        return (
+            f'db;dur={self.duration_ms:.1f};desc="{self.count} queries"'
+        )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats",
+    default = None,
+)
+
+
+def track_queries() -> QueryStats:
+    """
+    Start counting queries for the current request
+
+    The stats object is mutated in place by the engine hooks, so it is
+    shared with copies of the context such as SQLAlchemy greenlets
+    """
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    started = conn.info[QUERY_START_KEY].pop()
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration_ms += duration_ms
+
+    threshold = settings.DB_SLOW_QUERY_MS
+    if threshold is not None and duration_ms >= threshold:
+        logger.warning(
+            "slow_query",
+            duration_ms = round(duration_ms,
+                                1),
+            statement = statement[:SLOW_QUERY_STATEMENT_MAX_LENGTH],
+        )
+
+
+def _handle_error(context: Any) -> None:
+    """
+    Drop the start time of a failed statement, after_cursor_execute
+    never runs for it
+    """
+    if context.connection is None:
+        return
+    starts = context.connection.info.get(QUERY_START_KEY)
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement run by an engine
+
+    Takes the sync engine, for an AsyncEngine pass engine.sync_engine
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,602 @@
+"""
+ⒸAngelaMos | 2025
+metrics.py
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import math
+import os
+from bisect import bisect_left
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+    TypeVar,
+)
+
+import config
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+LabelValues = tuple[str, ...]
+Samples = dict[LabelValues, Any]
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (
+    128,
+    512,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+)
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+RETAINED_SNAPSHOT = "retained.json"
+SNAPSHOT_LOCK = "snapshots.lock"
+
+Snapshot = dict[str, list[list[Any]]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{_escape(value)}"'
+        for name, value in zip(names, values, strict = True)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """
+    Base of a labelled metric family held in process memory
+    """
+    kind: ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._samples: Samples = {}
+
+    def dump(self) -> list[list[Any]]:
+        """
+        JSON friendly copy of the samples
+        """
+        return [
+            [list(labels), value] for labels, value in self._samples.items()
+        ]
+
+    @staticmethod
+    def merge(dumps: Iterable[list[list[Any]]]) -> Samples:
+        """
+        Sum the samples of several processes
+        """
+        merged: Samples = {}
+        for dump in dumps:
+            for labels, value in dump:
+                key = tuple(labels)
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+    def render(self, samples: Samples) -> list[str]:
+        """
+        Exposition lines of merged samples
+        """
+        return [
+            f"{self.name}{_label_text(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in sorted(samples.items())
+        ]
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing total
+    """
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Add to the total of a label set
+        """
+        self._samples[labels] = self._samples.get(labels, 0.0) + amount
+
+    def set_total(self, value: float, *labels: str) -> None:
+        """
+        Mirror a total kept elsewhere, for counters filled by collectors
+        """
+        self._samples[labels] = float(value)
+
+
+class Gauge(Metric):
+    """
+    Value that goes up and down, summed across live processes
+    """
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        """
+        Set the value of a label set
+        """
+        self._samples[labels] = float(value)
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Increase the value of a label set
+        """
+        self._samples[labels] = self._samples.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """
+        Decrease the value of a label set
+        """
+        self.inc(*labels, amount = -amount)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations over fixed buckets
+    """
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record one observation
+        """
+        state = self._samples.get(labels)
+        if state is None:
+            state = {
+                "buckets": [0] * (len(self.buckets) + 1),
+                "sum": 0.0,
+                "count": 0,
+            }
+            self._samples[labels] = state
+        state["buckets"][bisect_left(self.buckets, value)] += 1
+        state["sum"] += value
+        state["count"] += 1
+
+    @staticmethod
+    def merge(dumps: Iterable[list[list[Any]]]) -> Samples:
+        merged: Samples = {}
+        for dump in dumps:
+            for labels, state in dump:
+                key = tuple(labels)
+                target = merged.get(key)
+                if target is None:
+                    merged[key] = {
+                        "buckets": list(state["buckets"]),
+                        "sum": state["sum"],
+                        "count": state["count"],
+                    }
+                    continue
+                target["buckets"] = [
+                    a + b for a, b in zip(
+                        target["buckets"],
+                        state["buckets"],
+                        strict = True,
+                    )
+                ]
+                target["sum"] += state["sum"]
+                target["count"] += state["count"]
+        return merged
+
+    def render(self, samples: Samples) -> list[str]:
+        lines = []
+        bucket_labels = (*self.labelnames, "le")
+        for labels, state in sorted(samples.items()):
+            cumulative = 0
+            bounds = (*self.buckets, math.inf)
+            for bound, count in zip(bounds, state["buckets"], strict = True):
+                cumulative += count
+                label_text = _label_text(
+                    bucket_labels,
+                    (*labels, _format_value(bound)),
+                )
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _label_text(self.labelnames, labels)
+            lines.append(
+                f"{self.name}_sum{label_text} {_format_value(state['sum'])}"
+            )
+            lines.append(f"{self.name}_count{label_text} {state['count']}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound = Metric)
+
+
+class MetricsRegistry:
+    """
+    Metric families of this process plus collectors run before export
+
+    Collectors refresh values that are read rather than counted, such as
+    pool usage or cache statistics kept by their owners
+    """
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """
+        Add a metric family, names must be unique
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Run collector before every snapshot
+        """
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Snapshot:
+        """
+        Collect and dump every metric family
+        """
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("metrics_collector_failed")
+        return {name: metric.dump() for name, metric in self._metrics.items()}
+
+    def retain(self, snapshots: Iterable[Snapshot]) -> Snapshot:
+        """
+        Sum snapshots of exited processes into one, dropping gauges
+        """
+        snapshots = list(snapshots)
+        return {
+            name: [
+                [list(labels), value]
+                for labels, value in metric.merge(
+                    s.get(name, []) for s in snapshots
+                ).items()
+            ]
+            for name, metric in self._metrics.items()
+            if metric.kind != "gauge"
+        }
+
+    def render(
+        self,
+        snapshots: list[Snapshot],
+        live_snapshots: list[Snapshot],
+    ) -> str:
+        """
+        Merge process snapshots into the text exposition format
+
+        Counters and histograms keep the totals of exited workers, gauges
+        only count live ones
+        """
+        lines = []
+        for name, metric in self._metrics.items():
+            sources = live_snapshots if metric.kind == "gauge" else snapshots
+            samples = metric.merge(s.get(name, []) for s in sources)
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render(samples))
+            if name == CACHE_REQUESTS.name:
+                lines.extend(_hit_ratio_lines(samples))
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = metrics.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Request latency by templated route",
+        ("method",
+         "route",
+         "status"),
+    )
+)
+HTTP_REQUESTS_IN_PROGRESS = metrics.register(
+    Gauge(
+        "http_requests_in_progress",
+        "Requests currently being handled",
+        ("method", ),
+    )
+)
+HTTP_RESPONSE_SIZE = metrics.register(
+    Histogram(
+        "http_response_size_bytes",
+        "Response body size by templated route",
+        ("method",
+         "route"),
+        buckets = SIZE_BUCKETS,
+    )
+)
+DB_POOL_CHECKED_OUT = metrics.register(
+    Gauge(
+        "db_pool_checked_out_connections",
+        "Connections currently checked out of the async pool",
+    )
+)
+DB_POOL_OVERFLOW = metrics.register(
+    Gauge(
+        "db_pool_overflow_connections",
+        "Connections open beyond the configured pool size",
+    )
+)
+PASSWORD_HASH_QUEUE_DEPTH = metrics.register(
+    Gauge(
+        "password_hash_queue_depth",
+        "Password hash jobs queued or running on the hashing executor",
+    )
+)
+PASSWORD_HASH_WAIT = metrics.register(
+    Histogram(
+        "password_hash_wait_seconds",
+        "Time password hash jobs waited for a hashing worker",
+    )
+)
+PASSWORD_HASH_REJECTED = metrics.register(
+    Counter(
+        "password_hash_rejected_total",
+        "Password hash jobs refused because the queue was full",
+    )
+)
+CACHE_REQUESTS = metrics.register(
+    Counter(
+        "cache_requests_total",
+        "Cache lookups by cache and outcome",
+        ("cache",
+         "result"),
+    )
+)
+
+CACHE_HIT_RATIO = "cache_hit_ratio"
+CACHE_HIT_RESULTS = ("local_hit", "redis_hit", "coalesced")
+
+
+def _hit_ratio_lines(samples: Samples) -> list[str]:
+    """
+    Hit ratio per cache over the merged lookup totals of all workers
+    """
+    totals: dict[str, list[float]] = {}
+    for (cache, result), value in samples.items():
+        hits_and_total = totals.setdefault(cache, [0.0, 0.0])
+        if result in CACHE_HIT_RESULTS:
+            hits_and_total[0] += value
+        hits_and_total[1] += value
+
+    lines = [
+        f"# HELP {CACHE_HIT_RATIO} Share of lookups served from cache",
+        f"# TYPE {CACHE_HIT_RATIO} gauge",
+    ]
+    for cache, (hits, total) in sorted(totals.items()):
+        ratio = hits / total if total else 0.0
+        lines.append(
+            f"{CACHE_HIT_RATIO}{_label_text(('cache', ), (cache, ))} "
+            f"{_format_value(ratio)}"
+        )
+    return lines
+
+
+def track_cache(name: str, stats: Any) -> None:
+    """
+    Export the CacheStats of a cache as cache_requests_total
+    """
+    def collect() -> None:
+        CACHE_REQUESTS.set_total(stats.local_hits, name, "local_hit")
+        CACHE_REQUESTS.set_total(stats.redis_hits, name, "redis_hit")
+        CACHE_REQUESTS.set_total(stats.misses, name, "miss")
+        CACHE_REQUESTS.set_total(stats.coalesced, name, "coalesced")
+
+    metrics.add_collector(collect)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_snapshot(path: Path) -> Snapshot | None:
+    try:
+        snapshot: Snapshot = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(
+            "metrics_snapshot_unreadable",
+            path = str(path),
+            error = str(e),
+        )
+        return None
+    return snapshot
+
+
+def _write_snapshot(path: Path, snapshot: Snapshot) -> None:
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(snapshot))
+    temporary.replace(path)
+
+
+class MetricsExporter:
+    """
+    Share metrics between the workers of one host
+
+    Without a directory the endpoint reports this process only. With
+    METRICS_MULTIPROC_DIR every worker writes its snapshot to <pid>.json
+    on an interval, and whichever worker serves /metrics merges all of
+    them with its own live values
+
+    Snapshots of exited workers are folded into retained.json and
+    removed, by the Gunicorn child_exit hook or the next exposition, so
+    recycled workers neither pile up files nor lose their totals. A new
+    worker retires any file left under its own, reused, pid before its
+    first flush, which would otherwise read as a counter reset
+    """
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._registry = registry
+        self._directory: Path | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def init(self, directory: Path | None) -> None:
+        """
+        Start periodic snapshots when a directory is configured
+        """
+        if directory is None:
+            return
+        directory.mkdir(parents = True, exist_ok = True)
+        self._directory = directory
+        self.mark_process_dead(os.getpid())
+        self._task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """
+        Stop flushing and write a final snapshot
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._directory is not None:
+            self.flush()
+            self._directory = None
+
+    def flush(self) -> None:
+        """
+        Atomically replace this process' snapshot file
+        """
+        if self._directory is None:
+            return
+        _write_snapshot(
+            self._directory / f"{os.getpid()}.json",
+            self._registry.snapshot(),
+        )
+
+    def mark_process_dead(
+        self,
+        pid: int,
+        directory: Path | None = None,
+    ) -> None:
+        """
+        Fold the snapshot of an exited process into the retained totals
+        """
+        directory = directory or self._directory
+        if directory is None:
+            return
+        with self._locked(directory):
+            self._retire(directory, pid)
+
+    def exposition(self) -> str:
+        """
+        Text exposition of this host, or of this process in single mode
+        """
+        own = self._registry.snapshot()
+        snapshots = [own]
+        live = [own]
+        if self._directory is None:
+            return self._registry.render(snapshots, live)
+
+        with self._locked(self._directory):
+            for path in self._directory.glob("*.json"):
+                if not path.stem.isdigit():
+                    continue
+                pid = int(path.stem)
+                if pid == os.getpid():
+                    continue
+                if not _pid_alive(pid):
+                    self._retire(self._directory, pid)
+                    continue
+                snapshot = _read_snapshot(path)
+                if snapshot is not None:
+                    snapshots.append(snapshot)
+                    live.append(snapshot)
+            retained = _read_snapshot(self._directory / RETAINED_SNAPSHOT)
+        if retained is not None:
+            snapshots.append(retained)
+        return self._registry.render(snapshots, live)
+
+    def _retire(self, directory: Path, pid: int) -> None:
+        path = directory / f"{pid}.json"
+        snapshot = _read_snapshot(path)
+        if snapshot is None:
+            path.unlink(missing_ok = True)
+            return
+        retained_path = directory / RETAINED_SNAPSHOT
+        retained = _read_snapshot(retained_path) or {}
+        _write_snapshot(
+            retained_path,
+            self._registry.retain([retained, snapshot]),
+        )
+        path.unlink()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _locked(directory: Path) -> Iterator[None]:
+        with (directory / SNAPSHOT_LOCK).open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(config.METRICS_FLUSH_SECONDS)
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning("metrics_flush_failed", error = str(e))
+
+
+metricsexporter = MetricsExporter(metrics)
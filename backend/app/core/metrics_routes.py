@@ -0,0 +1,28 @@
+"""
+ⒸAngelaMos | 2025
+metrics_routes.py
+"""
+
+from fastapi import (
+    APIRouter,
+    Response,
+)
+
+from .metrics import (
+    EXPOSITION_CONTENT_TYPE,
+    metricsexporter,
+)
+
+
+router = APIRouter(tags = ["health"])
+
+
+@router.get("/metrics", include_in_schema = False)
+async def prometheus_metrics() -> Response:
+    """
+    Prometheus text exposition of every worker on this host
+    """
+    return Response(
+        content = metricsexporter.exposition(),
+        media_type = EXPOSITION_CONTENT_TYPE,
+    )
@@ -0,0 +1,182 @@
+"""
+ⒸAngelaMos | 2025
+notify.py
+"""
+
+import asyncio
+import contextlib
+import json
+from uuid import uuid4
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+from config import (
+    Language,
+    settings,
+)
+from .events import (
+    ContentChanged,
+    eventbus,
+    pending_events,
+)
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+PROCESS_ID = uuid4().hex
+
+CONTENT_NAMESPACES = (
+    config.CACHE_NS_PROJECTS,
+    config.CACHE_NS_EXPERIENCES,
+    config.CACHE_NS_CERTIFICATIONS,
+    config.CACHE_NS_BLOGS,
+)
+
+NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+
+
+def encode_change(event: ContentChanged) -> str:
+    """
+    NOTIFY payload of a content change, tagged with this process
+    """
+    return json.dumps(
+        {
+            "origin": PROCESS_ID,
+            "namespace": event.namespace,
+            "language": event.language.value if event.language else None,
+        }
+    )
+
+
+def decode_change(payload: str) -> ContentChanged | None:
+    """
+    Content change relayed from another process
+
+    None for changes this process made itself, those were already
+    published locally after commit
+    """
+    data = json.loads(payload)
+    if data["origin"] == PROCESS_ID:
+        return None
+    language = data.get("language")
+    return ContentChanged(
+        namespace = data["namespace"],
+        language = Language(language) if language else None,
+        remote = True,
+    )
+
+
+async def notify_pending_events(session: AsyncSession) -> None:
+    """
+    Queue a NOTIFY for every pending content change
+
+    Postgres delivers notifications only when the transaction commits
+    and drops them on rollback, so listeners never see phantom changes.
+    Sent whether or not this process follows the channel itself, the seed
+    CLI writes content but subscribes nothing, the workers it must reach do
+    """
+    if not settings.CONTENT_NOTIFY_ENABLED:
+        return
+    for event in pending_events(session):
+        if isinstance(event, ContentChanged):
+            await session.execute(
+                NOTIFY_SQL,
+                {
+                    "channel": config.CONTENT_NOTIFY_CHANNEL,
+                    "payload": encode_change(event),
+                },
+            )
+
+
+class ContentListener:
+    """
+    LISTEN on the content channel and republish changes of other workers
+
+    Runs on a dedicated asyncpg connection outside the pool and
+    reconnects when it drops. Notifications sent while disconnected are
+    lost, so every reconnect republishes a change of each namespace to
+    make subscribers resync
+    """
+    def __init__(self) -> None:
+        self._task: asyncio.Task[None] | None = None
+        self._deliveries: set[asyncio.Task[None]] = set()
+
+    def start(self, database_url: str) -> None:
+        """
+        Start listening in the background
+        """
+        dsn = make_url(database_url).set(drivername = "postgresql")
+        self._task = asyncio.create_task(
+            self._listen(dsn.render_as_string(hide_password = False))
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop listening and close the connection
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _listen(self, dsn: str) -> None:
+        resync = False
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(
+                    "content_listener_connect_failed",
+                    error = str(e),
+                )
+                await asyncio.sleep(config.CONTENT_LISTENER_RECONNECT_SECONDS)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(
+                lambda _, closed = closed: closed.set()
+            )
+            try:
+                await connection.add_listener(
+                    config.CONTENT_NOTIFY_CHANNEL,
+                    self._on_notification,
+                )
+                if resync:
+                    await eventbus.publish(
+                        *(
+                            ContentChanged(namespace, remote = True)
+                            for namespace in CONTENT_NAMESPACES
+                        )
+                    )
+                await closed.wait()
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+
+            logger.warning("content_listener_disconnected")
+            resync = True
+            await asyncio.sleep(config.CONTENT_LISTENER_RECONNECT_SECONDS)
+
+    def _on_notification(
+        self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        event = decode_change(payload)
+        if event is None:
+            return
+        task = asyncio.create_task(eventbus.publish(event))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+
+contentlistener = ContentListener()
@@ -0,0 +1,45 @@
+"""
+ⒸAngelaMos | 2025
+pagination.py
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from .exceptions import InvalidCursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Opaque cursor holding the sort key of the last row of a page
+    """
+    payload = json.dumps(
+        [str(value) if isinstance(value, UUID) else value for value in values],
+        separators = (",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> tuple[Any, ...]:
+    """
+    Sort key stored by encode_cursor, each value coerced to its column type
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursor()
+        return tuple(
+            kind(value) for kind, value in zip(types, values, strict = True)
+        )
+    except (
+            binascii.Error,
+            AttributeError,
+            TypeError,
+            ValueError,
+    ) as e:
+        raise InvalidCursor() from e
@@ -0,0 +1,190 @@
+"""
+ⒸAngelaMos | 2025
+principal.py
+"""
+
+import json
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import config
+from config import UserRole
+from .cache import (
+    CacheStats,
+    LocalCache,
+    ResponseCache,
+    responsecache,
+)
+from .events import eventbus
+from .metrics import track_cache
+
+if TYPE_CHECKING:
+    from user.User import User
+
+
+TOMBSTONE = b"null"
+
+
+@dataclass(frozen = True, slots = True)
+class Principal:
+    """
+    The parts of a user that authentication and authorization need
+    """
+    id: UUID
+    role: UserRole
+    is_active: bool
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user: "User") -> "Principal":
+        """
+        Principal of a User row
+        """
+        return cls(
+            id = user.id,
+            role = user.role,
+            is_active = user.is_active,
+            token_version = user.token_version,
+        )
+
+
+@dataclass(frozen = True, slots = True)
+class UserChanged:
+    """
+    A user's token version, status or role changed, or the user was
+    deleted when principal is None
+    """
+    user_id: UUID
+    principal: Principal | None
+
+
+PrincipalLoader = Callable[[], Awaitable[Principal | None]]
+
+
+def encode_principal(principal: Principal | None) -> bytes:
+    """
+    Redis payload of a principal, a tombstone for deleted users
+    """
+    if principal is None:
+        return TOMBSTONE
+    return json.dumps(
+        {
+            "role": principal.role.value,
+            "is_active": principal.is_active,
+            "token_version": principal.token_version,
+        }
+    ).encode()
+
+
+def decode_principal(user_id: UUID, payload: bytes) -> Principal | None:
+    """
+    Principal stored by encode_principal
+    """
+    data = json.loads(payload)
+    if data is None:
+        return None
+    return Principal(
+        id = user_id,
+        role = UserRole(data["role"]),
+        is_active = data["is_active"],
+        token_version = data["token_version"],
+    )
+
+
+class PrincipalCache:
+    """
+    Two tier cache of principals so access tokens validate without a
+    database round trip
+
+    Changes overwrite the Redis entry after commit while read through
+    fills only write absent keys, so a fill racing a change cannot bring
+    back the old state. Other workers' local tiers lag by at most their
+    short TTL. Disabled until init, tests and scripts that never publish
+    UserChanged always read the database
+    """
+    def __init__(self, backend: ResponseCache) -> None:
+        self._backend = backend
+        self._local: LocalCache[Principal] = LocalCache(
+            config.PRINCIPAL_CACHE_LOCAL_SIZE,
+            config.PRINCIPAL_CACHE_LOCAL_TTL,
+        )
+        self._enabled = False
+        self.stats = CacheStats()
+
+    def init(self) -> None:
+        """
+        Start caching and following user changes
+        """
+        eventbus.subscribe(UserChanged, self._on_user_changed)
+        self._enabled = True
+
+    def close(self) -> None:
+        """
+        Stop caching
+        """
+        eventbus.unsubscribe(UserChanged, self._on_user_changed)
+        self._enabled = False
+        self._local.clear()
+
+    @staticmethod
+    def build_key(user_id: UUID) -> str:
+        """
+        Redis key of a user's principal
+        """
+        return ResponseCache.build_key(config.CACHE_NS_PRINCIPALS, user_id)
+
+    async def get_or_load(
+        self,
+        user_id: UUID,
+        load: PrincipalLoader,
+    ) -> Principal | None:
+        """
+        Return the cached principal or load it from the database
+        """
+        if not self._enabled:
+            return await load()
+
+        key = self.build_key(user_id)
+        principal = self._local.get(key)
+        if principal is not None:
+            self.stats.local_hits += 1
+            return principal
+
+        cached = await self._backend.get(key)
+        if cached is not None:
+            self.stats.redis_hits += 1
+            principal = decode_principal(user_id, cached)
+        else:
+            self.stats.misses += 1
+            principal = await load()
+            await self._backend.set(
+                key,
+                encode_principal(principal),
+                config.CACHE_TTL_PRINCIPAL,
+                only_if_absent = True,
+            )
+
+        if principal is not None:
+            self._local.set(key, principal)
+        return principal
+
+    async def _on_user_changed(self, event: UserChanged) -> None:
+        key = self.build_key(event.user_id)
+        if event.principal is None:
+            self._local.discard(key)
+        else:
+            self._local.set(key, event.principal)
+        await self._backend.set(
+            key,
+            encode_principal(event.principal),
+            config.CACHE_TTL_PRINCIPAL,
+        )
+
+
+principalcache = PrincipalCache(responsecache)
+track_cache(config.CACHE_NS_PRINCIPALS, principalcache.stats)
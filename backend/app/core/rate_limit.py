@@ -3,35 +3,26 @@
 rate_limit.py
 """
 
-import jwt
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from starlette.requests import Request
 
 from config import settings
+from .auth_context import get_auth_context
 
 
 def get_identifier(request: Request) -> str:
     """
     Get rate limit identifier
 
-    Uses user ID if authenticated, otherwise falls back to IP address
+    Uses the verified user ID if authenticated, otherwise falls back to
+    IP address. Unverified claims are never trusted, a forged sub must not
+    pick its own bucket
     (Will add more fingerprinting if needed depending on project)
     """
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        try:
-            token = auth_header.split(" ")[1]
-            payload = jwt.decode(
-                token,
-                options = {"verify_signature": False},
-            )
-            user_id = payload.get("sub")
-            if user_id:
-                return f"user:{user_id}"
-        except Exception:
-            pass
-
+    user_id = get_auth_context(request).subject
+    if user_id:
+        return f"user:{user_id}"
     return get_remote_address(request)
 
 
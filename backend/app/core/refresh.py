@@ -0,0 +1,48 @@
+"""
+ⒸAngelaMos | 2025
+refresh.py
+"""
+
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+
+
+class CoalescedRefresh:
+    """
+    Run a rebuild in the background, folding bursts of triggers into one
+
+    A trigger while a rebuild is running marks the result stale, the
+    running task then rebuilds once more instead of queueing a task per
+    trigger
+    """
+    def __init__(self, rebuild: Callable[[], Awaitable[None]]) -> None:
+        self._rebuild = rebuild
+        self._task: asyncio.Task[None] | None = None
+        self._stale = False
+
+    def trigger(self) -> None:
+        """
+        Request a rebuild without waiting for it
+        """
+        if self._task is not None and not self._task.done():
+            self._stale = True
+            return
+        self._task = asyncio.create_task(self._run())
+
+    def cancel(self) -> None:
+        """
+        Cancel a pending or running rebuild
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._stale = False
+            await self._rebuild()
+            if not self._stale:
+                return
@@ -5,9 +5,25 @@ responses.py
 
 from typing import Any
 
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
 from .error_schemas import ErrorDetail
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core straight to bytes
+
+    Models, UUIDs, datetimes and enums serialize natively, skipping the
+    json.dumps of the stock JSONResponse. Routes that return one with an
+    already validated model also skip FastAPI's response validation and
+    jsonable_encoder pass, response_model then only documents the route
+    """
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 AUTH_401: dict[int | str,
                dict[str,
                     Any]] = {
@@ -35,6 +51,15 @@ NOT_FOUND_404: dict[int | str,
                              },
                          }
 
+BUSY_503: dict[int | str,
+               dict[str,
+                    Any]] = {
+                        503: {
+                            "model": ErrorDetail,
+                            "description": "Service busy, retry later"
+                        },
+                    }
+
 CONFLICT_409: dict[int | str,
                    dict[str,
                         Any]] = {
@@ -3,7 +3,6 @@
 security.py
 """
 
-import asyncio
 import hashlib
 import secrets
 from datetime import (
@@ -11,6 +10,7 @@ from datetime import (
     datetime,
     timedelta,
 )
+from functools import partial
 from typing import Any
 from uuid import UUID
 
@@ -23,19 +23,50 @@ from config import (
     settings,
     TokenType,
 )
+from .exceptions import ServiceBusy
+from .executor import BoundedExecutor
+from .singleflight import SingleFlight
 
 
 password_hasher = PasswordHash.recommended()
 
+DUMMY_PASSWORD = "dummy_password_for_timing_attack_prevention"
+
+passwordexecutor = BoundedExecutor(
+    workers = settings.PASSWORD_HASH_WORKERS,
+    queue_size = settings.PASSWORD_HASH_QUEUE_SIZE,
+    processes = settings.PASSWORD_HASH_PROCESSES,
+    retry_after = config.PASSWORD_HASH_RETRY_AFTER,
+)
+
+
+def _hash(password: str) -> str:
+    return password_hasher.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return password_hasher.verify(password, hashed_password)
+
+
+def _verify_and_update(
+    password: str,
+    hashed_password: str,
+) -> tuple[bool,
+           str | None]:
+    return password_hasher.verify_and_update(password, hashed_password)
+
 
 async def hash_password(password: str) -> str:
     """
     Hash password using Argon2id
 
-    Runs in thread pool to avoid blocking the async event loop
-    since Argon2 is CPU intensive by design
+    Runs on the dedicated hashing executor to avoid blocking the async
+    event loop since Argon2 is CPU intensive by design
+
+    Raises:
+        ServiceBusy: If the hashing queue is full
     """
-    return await asyncio.to_thread(password_hasher.hash, password)
+    return await passwordexecutor.run(_hash, password)
 
 
 async def verify_password(plain_password: str,
@@ -47,18 +78,57 @@ async def verify_password(plain_password: str,
     Returns:
         Tuple of (is_valid, new_hash_if_needs_rehash)
         If password is valid but hash params are outdated, returns new hash
+
+    Raises:
+        ServiceBusy: If the hashing queue is full
     """
     try:
-        return await asyncio.to_thread(
-            password_hasher.verify_and_update,
+        return await passwordexecutor.run(
+            _verify_and_update,
             plain_password,
             hashed_password
         )
+    except ServiceBusy:
+        raise
     except Exception:
         return False, None
 
 
-DUMMY_HASH = password_hasher.hash("dummy_password_for_timing_attack_prevention")
+class DummyHash:
+    """
+    Hash checked when the user does not exist
+
+    Computed on first use rather than at import, so workers, migrations
+    and tests do not pay for an Argon2 hash before doing anything. Hashed
+    once on the executor and kept in this process, every pool worker
+    verifies against the same value instead of hashing its own copy.
+    Uses the current parameters, so its verify costs the same as a real one
+    """
+    def __init__(self) -> None:
+        self._value: str | None = None
+        self._fills: SingleFlight[str] = SingleFlight()
+
+    async def get(self) -> str:
+        """
+        The dummy hash, computing it on the first call
+        """
+        if self._value is None:
+            self._value, _ = await self._fills.do(
+                "dummy",
+                partial(passwordexecutor.run, _hash, DUMMY_PASSWORD),
+            )
+        return self._value
+
+
+dummyhash = DummyHash()
+
+
+async def prepare_dummy_hash() -> None:
+    """
+    Compute the dummy hash on the hashing executor ahead of the first
+    login, so that login does not pay for it and stand out in timing
+    """
+    await dummyhash.get()
 
 
 async def verify_password_with_timing_safety(
@@ -73,10 +143,10 @@ async def verify_password_with_timing_safety(
     hash operation to prevent timing attacks
     """
     if hashed_password is None:
-        await asyncio.to_thread(
-            password_hasher.verify,
+        await passwordexecutor.run(
+            _verify,
             plain_password,
-            DUMMY_HASH
+            await dummyhash.get(),
         )
         return False, None
     return await verify_password(plain_password, hashed_password)
@@ -109,12 +179,7 @@ def create_access_token(
     )
 
 
-def create_refresh_token(
-    user_id: UUID,
-    family_id: UUID,
-) -> tuple[str,
-           str,
-           datetime]:
+def create_refresh_token() -> tuple[str, str, datetime]:
     """
     Create a long lived refresh token
 
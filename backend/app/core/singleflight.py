@@ -0,0 +1,54 @@
+"""
+ⒸAngelaMos | 2025
+singleflight.py
+"""
+
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls for the same key into a single call
+
+    The first caller of a key starts the call as a task, callers arriving
+    while it runs await that same task. Every caller awaits it shielded,
+    so a cancelled request leaves the call running for the others
+    """
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: str,
+        call: Callable[[],
+                       Awaitable[T]],
+    ) -> tuple[T, bool]:
+        """
+        Result of the call for key and whether it was shared with an
+        earlier caller
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -6,11 +6,17 @@ Experience.py
 from datetime import date
 
 from sqlalchemy import (
+    Computed,
     Date,
+    Index,
     String,
     Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    TSVECTOR,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -27,9 +33,17 @@ from core.Base import (
     TimestampMixin,
     UUIDMixin,
 )
+from core.fts import (
+    SEARCH_WEIGHT_PRIMARY,
+    SEARCH_WEIGHT_SECONDARY,
+    SearchableMixin,
+    search_indexes,
+    search_text_sql,
+    search_vector_sql,
+)
 
 
-class Experience(Base, UUIDMixin, TimestampMixin):
+class Experience(SearchableMixin, Base, UUIDMixin, TimestampMixin):
     """
     Work experience model with i18n support.
     Each row represents one job/role in one language.
@@ -104,3 +118,39 @@ class Experience(Base, UUIDMixin, TimestampMixin):
     is_visible: Mapped[bool] = mapped_column(
         default = True,
     )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            search_vector_sql(
+                ("company", SEARCH_WEIGHT_PRIMARY),
+                ("role", SEARCH_WEIGHT_PRIMARY),
+                ("description", SEARCH_WEIGHT_SECONDARY),
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            search_text_sql(
+                "company",
+                "role",
+                "description",
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_experiences_language_display_order",
+            "language",
+            "display_order",
+            "id",
+            postgresql_where = text("is_visible"),
+        ),
+        *search_indexes(__tablename__),
+    )
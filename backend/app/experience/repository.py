@@ -4,13 +4,21 @@ repository.py
 """
 
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
 from config import Language
-from core.base_repository import BaseRepository
+from core.base_repository import (
+    BaseRepository,
+    Page,
+)
 from .Experience import Experience
 
 
@@ -19,25 +27,63 @@ class ExperienceRepository(BaseRepository[Experience]):
     Repository for Experience model database operations.
     """
     model = Experience
+    cache_namespace = config.CACHE_NS_EXPERIENCES
+    cursor_keys = (Experience.display_order, Experience.id)
+    brief_columns = (
+        Experience.company,
+        Experience.role,
+        Experience.start_date,
+        Experience.end_date,
+        Experience.is_current,
+    )
 
     @classmethod
-    async def get_visible_by_language(
+    def _visible_by_language(
+        cls,
+        language: Language,
+    ) -> Select[tuple[Experience]]:
+        return select(Experience).where(Experience.language == language).where(
+            Experience.is_visible == True
+        )
+
+    @classmethod
+    async def get_visible_page_by_language(
         cls,
         session: AsyncSession,
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
-    ) -> Sequence[Experience]:
+        cursor: str | None = None,
+    ) -> Page[Experience]:
         """
-        Get all visible experiences for a language.
-        Ordered by display_order for consistent timeline.
+        Get a page of visible experiences with the total for pagination.
         """
-        result = await session.execute(
-            select(Experience).where(Experience.language == language).where(
-                Experience.is_visible == True
-            ).order_by(Experience.display_order).offset(skip).limit(limit)
+        return await cls.paginate(
+            session,
+            cls._visible_by_language(language),
+            skip,
+            limit,
+            cursor,
+            count_parts = ("visible", language),
+        )
+
+    @classmethod
+    async def get_visible_brief_by_language(
+        cls,
+        session: AsyncSession,
+        language: Language,
+        limit: int = config.PAGINATION_DEFAULT_LIMIT,
+    ) -> Sequence[Row[Any]]:
+        """
+        Timeline columns of visible experiences, as plain rows.
+        """
+        return await cls.select_columns(
+            session,
+            cls._visible_by_language(language).order_by(
+                *cls.cursor_keys
+            ).limit(limit),
+            *cls.brief_columns,
         )
-        return result.scalars().all()
 
     @classmethod
     async def get_current_by_language(
@@ -56,19 +102,3 @@ class ExperienceRepository(BaseRepository[Experience]):
             )
         )
         return result.scalars().all()
-
-    @classmethod
-    async def count_visible_by_language(
-        cls,
-        session: AsyncSession,
-        language: Language,
-    ) -> int:
-        """
-        Count visible experiences for pagination.
-        """
-        result = await session.execute(
-            select(func.count()).select_from(Experience).where(
-                Experience.language == language
-            ).where(Experience.is_visible == True)
-        )
-        return result.scalar_one()
@@ -5,12 +5,21 @@ routes.py
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import (
+    APIRouter,
+    Query,
+    Response,
+)
 
 import config
-from core.dependencies import QueryLanguage
+from core.cache import cached_response
+from core.dependencies import (
+    DBSessionFactory,
+    IfNoneMatch,
+    QueryLanguage,
+)
 from core.responses import NOT_FOUND_404
-from .dependencies import ExperienceServiceDep
+from .service import ExperienceService
 from .schemas import (
     ExperienceBriefResponse,
     ExperienceListResponse,
@@ -26,8 +35,9 @@ router = APIRouter(prefix = "/experiences", tags = ["experiences"])
     response_model = ExperienceListResponse,
 )
 async def list_experiences(
-    service: ExperienceServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     skip: int = Query(default = config.PAGINATION_DEFAULT_SKIP,
                       ge = 0),
     limit: int = Query(
@@ -35,11 +45,28 @@ async def list_experiences(
         ge = 1,
         le = config.PAGINATION_MAX_LIMIT
     ),
-) -> ExperienceListResponse:
+    cursor: str | None = Query(
+        default = None,
+        max_length = config.PAGINATION_CURSOR_MAX_LENGTH
+    ),
+) -> Response:
     """
     List all visible experiences for the specified language.
+    Pass next_cursor back as cursor to fetch the following page.
     """
-    return await service.list_visible(lang, skip, limit)
+    return await cached_response(
+        config.CACHE_NS_EXPERIENCES,
+        config.CACHE_TTL_EXPERIENCES,
+        ("list", lang, skip, limit, cursor),
+        lambda db: ExperienceService(db).list_visible(
+            lang,
+            skip,
+            limit,
+            cursor,
+        ),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -47,13 +74,21 @@ async def list_experiences(
     response_model = list[ExperienceResponse],
 )
 async def list_current_experiences(
-    service: ExperienceServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> list[ExperienceResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     List current (ongoing) positions.
     """
-    return await service.list_current(lang)
+    return await cached_response(
+        config.CACHE_NS_EXPERIENCES,
+        config.CACHE_TTL_EXPERIENCES,
+        ("current", lang),
+        lambda db: ExperienceService(db).list_current(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -61,13 +96,21 @@ async def list_current_experiences(
     response_model = list[ExperienceBriefResponse],
 )
 async def get_experience_timeline(
-    service: ExperienceServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> list[ExperienceBriefResponse]:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get brief experience data for timeline display.
     """
-    return await service.get_timeline(lang)
+    return await cached_response(
+        config.CACHE_NS_EXPERIENCES,
+        config.CACHE_TTL_EXPERIENCES,
+        ("timeline", lang),
+        lambda db: ExperienceService(db).get_timeline(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -76,10 +119,18 @@ async def get_experience_timeline(
     responses = {**NOT_FOUND_404},
 )
 async def get_experience(
-    service: ExperienceServiceDep,
+    sessions: DBSessionFactory,
     experience_id: UUID,
-) -> ExperienceResponse:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get a single experience by ID.
     """
-    return await service.get_by_id(experience_id)
+    return await cached_response(
+        config.CACHE_NS_EXPERIENCES,
+        config.CACHE_TTL_EXPERIENCES,
+        ("detail", experience_id),
+        lambda db: ExperienceService(db).get_by_id(experience_id),
+        sessions,
+        if_none_match,
+    )
@@ -57,3 +57,4 @@ class ExperienceListResponse(BaseSchema):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
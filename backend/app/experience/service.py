@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import config
 from config import Language
 from core.exceptions import ExperienceNotFound
+from snapshot import snapshotstore
 from .repository import ExperienceRepository
 from .schemas import (
     ExperienceBriefResponse,
@@ -29,6 +30,13 @@ class ExperienceService:
         """
         Get experience by ID.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            cached = snapshot.experiences.by_id.get(experience_id)
+            if cached is None:
+                raise ExperienceNotFound(str(experience_id))
+            return cached
+
         experience = await ExperienceRepository.get_by_id(
             self.session,
             experience_id,
@@ -42,25 +50,38 @@ class ExperienceService:
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
+        cursor: str | None = None,
     ) -> ExperienceListResponse:
         """
         List visible experiences for a language.
         """
-        experiences = await ExperienceRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.experiences.language(language)
+            items, next_cursor = view.paginate(skip, limit, cursor)
+            return ExperienceListResponse(
+                items = items,
+                total = len(view.visible),
+                skip = skip,
+                limit = limit,
+                next_cursor = next_cursor,
+            )
+
+        page = await ExperienceRepository.get_visible_page_by_language(
             self.session,
             language,
             skip,
             limit,
-        )
-        total = await ExperienceRepository.count_visible_by_language(
-            self.session,
-            language,
+            cursor,
         )
         return ExperienceListResponse(
-            items = [ExperienceResponse.model_validate(e) for e in experiences],
-            total = total,
+            items = [
+                ExperienceResponse.model_validate(e) for e in page.items
+            ],
+            total = page.total,
             skip = skip,
             limit = limit,
+            next_cursor = page.next_cursor,
         )
 
     async def list_current(
@@ -70,6 +91,10 @@ class ExperienceService:
         """
         List current (ongoing) positions for a language.
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return list(snapshot.experiences.language(language).featured)
+
         experiences = await ExperienceRepository.get_current_by_language(
             self.session,
             language,
@@ -83,8 +108,16 @@ class ExperienceService:
         """
         Get brief experience data for timeline display.
         """
-        experiences = await ExperienceRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.experiences.language(language)
+            return [
+                ExperienceBriefResponse.model_validate(e)
+                for e in view.page(0, config.PAGINATION_DEFAULT_LIMIT)
+            ]
+
+        rows = await ExperienceRepository.get_visible_brief_by_language(
             self.session,
             language,
         )
-        return [ExperienceBriefResponse.model_validate(e) for e in experiences]
+        return [ExperienceBriefResponse.model_validate(r) for r in rows]
@@ -3,6 +3,7 @@
 factory.py
 """
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -11,25 +12,46 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from fastapi_rc import cachemanager
 
 import config
 from config import settings
+from core.cache import responsecache
 from core.database import sessionmanager
+from core.edge import edgepurger
+from core.events import (
+    ContentChanged,
+    eventbus,
+)
 from core.exceptions import BaseAppException
 from core.logging import configure_logging
+from core.metrics import metricsexporter
+from core.notify import contentlistener
+from core.principal import principalcache
 from core.rate_limit import limiter
+from core.responses import FastJSONResponse
+from core.security import (
+    passwordexecutor,
+    prepare_dummy_hash,
+)
+from middleware.auth import AuthContextMiddleware
 from middleware.correlation import CorrelationIdMiddleware
+from middleware.metrics import MetricsMiddleware
 from core.common_schemas import AppInfoResponse
 from core.health_routes import router as health_router
+from core.metrics_routes import router as metrics_router
 from user.routes import router as user_router
 from auth.routes import router as auth_router
+from auth.maintenance import tokencleanup
 from admin.routes import router as admin_router
 from project.routes import router as project_router
 from experience.routes import router as experience_router
 from certification.routes import router as certification_router
 from blog.routes import router as blog_router
 from search.routes import router as search_router
+from search.cache import searchcache
+from search.suggest import suggestindex
+from snapshot import snapshotstore
+from snapshot.loader import load_snapshot
 from it_was_never_real import register_psyop_handler
 
 
@@ -40,11 +62,38 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     configure_logging()
     sessionmanager.init(str(settings.DATABASE_URL))
+    dummy_hash = asyncio.create_task(prepare_dummy_hash())
     if settings.REDIS_URL:
-        cachemanager.init(str(settings.REDIS_URL))
+        responsecache.init(str(settings.REDIS_URL))
+    if settings.EDGE_PURGE_URL:
+        edgepurger.init(str(settings.EDGE_PURGE_URL))
+    principalcache.init()
+    if settings.SNAPSHOT_MODE:
+        snapshotstore.init(load_snapshot)
+        await snapshotstore.reload()
+    searchcache.init()
+    suggestindex.init()
+    await suggestindex.refresh()
+    if (settings.CONTENT_NOTIFY_ENABLED
+            and eventbus.has_remote_subscribers(ContentChanged)):
+        contentlistener.start(str(settings.DATABASE_URL))
+    metricsexporter.init(settings.METRICS_MULTIPROC_DIR)
+    if settings.TOKEN_CLEANUP_ENABLED:
+        tokencleanup.start()
     yield
-    if cachemanager.is_available:
-        await cachemanager.close()
+    dummy_hash.cancel()
+    await tokencleanup.stop()
+    await metricsexporter.close()
+    await contentlistener.stop()
+    await suggestindex.close()
+    searchcache.close()
+    await snapshotstore.close()
+    principalcache.close()
+    if edgepurger.is_enabled:
+        await edgepurger.close()
+    if responsecache.is_available:
+        await responsecache.close()
+    passwordexecutor.shutdown()
     await sessionmanager.close()
 
 
@@ -112,12 +161,15 @@ def create_app() -> FastAPI:
         openapi_tags = OPENAPI_TAGS,
         openapi_version = "3.1.0",
         lifespan = lifespan,
+        default_response_class = FastJSONResponse,
         root_path = "/api",
         openapi_url = "/openapi.json",
         docs_url = "/docs",
         redoc_url = "/redoc",
     )
 
+    app.add_middleware(AuthContextMiddleware)
+    app.add_middleware(MetricsMiddleware)
     app.add_middleware(CorrelationIdMiddleware)
     app.add_middleware(
         CORSMiddleware,
@@ -136,12 +188,15 @@ def create_app() -> FastAPI:
         request: Request,
         exc: BaseAppException,
     ) -> JSONResponse:
+        retry_after = getattr(exc, "retry_after", None)
         return JSONResponse(
             status_code = exc.status_code,
             content = {
                 "detail": exc.message,
                 "type": exc.__class__.__name__,
             },
+            headers = {"Retry-After": str(retry_after)}
+            if retry_after is not None else None,
         )
 
     @app.get("/", response_model = AppInfoResponse, tags = ["root"])
@@ -154,6 +209,7 @@ def create_app() -> FastAPI:
         )
 
     app.include_router(health_router)
+    app.include_router(metrics_router)
     app.include_router(project_router, prefix = config.API_PREFIX)
     app.include_router(experience_router, prefix = config.API_PREFIX)
     app.include_router(certification_router, prefix = config.API_PREFIX)
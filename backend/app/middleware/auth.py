@@ -0,0 +1,42 @@
+"""
+ⒸAngelaMos | 2025
+auth.py
+"""
+
+from starlette.datastructures import Headers
+from starlette.types import (
+    ASGIApp,
+    Receive,
+    Scope,
+    Send,
+)
+
+from core.auth_context import (
+    AUTH_STATE_KEY,
+    authenticate,
+)
+
+
+class AuthContextMiddleware:
+    """
+    Verify the bearer token once and share it on request.state.auth
+
+    The rate limiter keys on the verified subject and the auth
+    dependencies read the same claims, so a token is decoded once per
+    request and a forged sub never picks a rate limit bucket
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] == "http":
+            authorization = Headers(scope = scope).get("Authorization")
+            scope.setdefault("state", {})[AUTH_STATE_KEY] = authenticate(
+                authorization
+            )
+        await self.app(scope, receive, send)
@@ -4,29 +4,49 @@ correlation.py
 """
 
 import uuid
-from collections.abc import (
-    Awaitable,
-    Callable,
-)
+
 import structlog
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from core.instrumentation import track_queries
+from core.logging import get_logger
 
 
-RequestResponseEndpoint = Callable[[Request], Awaitable[Response]]
+logger = get_logger(__name__)
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+class CorrelationIdMiddleware:
     """
     Correlation ID to requests for distributed tracing
+
+    Also reports the queries each request issued, in the log context and
+    as a Server-Timing header. Pure ASGI, headers are added to the
+    http.response.start message and the body passes through untouched
     """
-    async def dispatch(
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
         self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        correlation_id = request.headers.get(
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = Headers(scope = scope).get(
             "X-Correlation-ID",
             str(uuid.uuid4())
         )
@@ -34,10 +54,24 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
             correlation_id = correlation_id,
-            method = request.method,
-            path = request.url.path,
+            method = scope["method"],
+            path = scope["path"],
         )
 
-        response = await call_next(request)
-        response.headers["X-Correlation-ID"] = correlation_id
-        return response
+        query_stats = track_queries()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                structlog.contextvars.bind_contextvars(
+                    db_queries = query_stats.count,
+                    db_time_ms = round(query_stats.duration_ms,
+                                       1),
+                )
+                logger.info("request_completed", status = message["status"])
+
+                headers = MutableHeaders(scope = message)
+                headers["X-Correlation-ID"] = correlation_id
+                headers["Server-Timing"] = query_stats.server_timing()
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,88 @@
+"""
+ⒸAngelaMos | 2025
+metrics.py
+"""
+
+import time
+
+from starlette.routing import Match
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE,
+)
+
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, never the raw URL
+
+    Raw paths would create a time series per slug or id
+    """
+    route = scope.get("route")
+    if route is not None:
+        return str(route.path)
+    for candidate in scope["app"].router.routes:
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return str(getattr(candidate, "path", UNMATCHED_ROUTE))
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Request latency, in flight requests and response sizes per route
+
+    Pure ASGI, the status comes from http.response.start and the size is
+    summed over the body messages, so streamed responses count too
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec(method)
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method,
+                route,
+                str(status_code),
+            )
+            HTTP_RESPONSE_SIZE.observe(response_size, method, route)
@@ -6,12 +6,17 @@ Project.py
 from datetime import date
 
 from sqlalchemy import (
+    Computed,
     Date,
+    Index,
     String,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    TSVECTOR,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -28,9 +33,18 @@ from core.Base import (
     TimestampMixin,
     UUIDMixin,
 )
+from core.fts import (
+    SEARCH_WEIGHT_PRIMARY,
+    SEARCH_WEIGHT_SECONDARY,
+    SEARCH_WEIGHT_TERTIARY,
+    SearchableMixin,
+    search_indexes,
+    search_text_sql,
+    search_vector_sql,
+)
 
 
-class Project(Base, UUIDMixin, TimestampMixin):
+class Project(SearchableMixin, Base, UUIDMixin, TimestampMixin):
     """
     Portfolio project model with i18n support.
     Each row represents one project in one language
@@ -166,10 +180,42 @@ class Project(Base, UUIDMixin, TimestampMixin):
         default = None,
     )
 
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            search_vector_sql(
+                ("title", SEARCH_WEIGHT_PRIMARY),
+                ("description", SEARCH_WEIGHT_SECONDARY),
+                ("technical_details", SEARCH_WEIGHT_TERTIARY),
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            search_text_sql(
+                "title",
+                "description",
+                "technical_details",
+            ),
+            persisted = True,
+        ),
+        deferred = True,
+    )
+
     __table_args__ = (
         UniqueConstraint(
             "slug",
             "language",
             name = "uq_projects_slug_language"
         ),
+        Index(
+            "ix_projects_language_display_order",
+            "language",
+            "display_order",
+            "id",
+        ),
+        *search_indexes(__tablename__),
     )
@@ -4,13 +4,22 @@ repository.py
 """
 
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Row,
+    Select,
+    func,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import config
 from config import Language
-from core.base_repository import BaseRepository
+from core.base_repository import (
+    BaseRepository,
+    Page,
+)
 
 from .Project import Project
 
@@ -20,6 +29,15 @@ class ProjectRepository(BaseRepository[Project]):
     Repository for Project model database operations
     """
     model = Project
+    cache_namespace = config.CACHE_NS_PROJECTS
+    cursor_keys = (Project.display_order, Project.id)
+    brief_columns = (
+        Project.slug,
+        Project.title,
+        Project.subtitle,
+        Project.status,
+        Project.is_featured,
+    )
 
     @classmethod
     async def get_by_slug_and_language(
@@ -39,23 +57,53 @@ class ProjectRepository(BaseRepository[Project]):
         return result.scalars().first()
 
     @classmethod
-    async def get_visible_by_language(
+    def _visible_by_language(
+        cls,
+        language: Language,
+    ) -> Select[tuple[Project]]:
+        return select(Project).where(Project.language == language)
+
+    @classmethod
+    async def get_visible_page_by_language(
         cls,
         session: AsyncSession,
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
-    ) -> Sequence[Project]:
+        cursor: str | None = None,
+    ) -> Page[Project]:
         """
-        Get all visible (complete) projects for a language
-        Ordered by display_order for consistent nav/listing
+        Get a page of visible projects with the total for pagination
         """
-        result = await session.execute(
-            select(Project).where(Project.language == language).order_by(
-                Project.display_order
-            ).offset(skip).limit(limit)
+        return await cls.paginate(
+            session,
+            cls._visible_by_language(language),
+            skip,
+            limit,
+            cursor,
+            count_parts = ("visible", language),
         )
-        return result.scalars().all()
+
+    @classmethod
+    async def get_nav_by_language(
+        cls,
+        session: AsyncSession,
+        language: Language,
+        limit: int = config.PAGINATION_DEFAULT_LIMIT,
+    ) -> Page[Row[Any]]:
+        """
+        Nav columns of visible projects and their total, as plain rows
+        Leaves the long text, snippet and URL columns in the database
+        """
+        rows = await cls.select_columns(
+            session,
+            cls._visible_by_language(language).order_by(
+                *cls.cursor_keys
+            ).limit(limit),
+            *cls.brief_columns,
+            func.count().over().label("total"),
+        )
+        return Page(items = rows, total = rows[0].total if rows else 0)
 
     @classmethod
     async def get_featured_by_language(
@@ -77,21 +125,6 @@ class ProjectRepository(BaseRepository[Project]):
         )
         return result.scalars().all()
 
-    @classmethod
-    async def count_visible_by_language(
-        cls,
-        session: AsyncSession,
-        language: Language,
-    ) -> int:
-        """
-        Count visible projects for pagination
-        """
-        result = await session.execute(
-            select(func.count()
-                   ).select_from(Project).where(Project.language == language)
-        )
-        return result.scalar_one()
-
     @classmethod
     async def get_all_slugs(
         cls,
@@ -3,12 +3,21 @@
 routes.py
 """
 
-from fastapi import APIRouter, Query
+from fastapi import (
+    APIRouter,
+    Query,
+    Response,
+)
 
 import config
-from core.dependencies import QueryLanguage
+from core.cache import cached_response
+from core.dependencies import (
+    DBSessionFactory,
+    IfNoneMatch,
+    QueryLanguage,
+)
 from core.responses import NOT_FOUND_404
-from .dependencies import ProjectServiceDep
+from .service import ProjectService
 from .schemas import (
     ProjectListResponse,
     ProjectNavResponse,
@@ -24,8 +33,9 @@ router = APIRouter(prefix = "/projects", tags = ["projects"])
     response_model = ProjectListResponse,
 )
 async def list_projects(
-    service: ProjectServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     skip: int = Query(default = config.PAGINATION_DEFAULT_SKIP,
                       ge = 0),
     limit: int = Query(
@@ -33,11 +43,23 @@ async def list_projects(
         ge = 1,
         le = config.PAGINATION_MAX_LIMIT
     ),
-) -> ProjectListResponse:
+    cursor: str | None = Query(
+        default = None,
+        max_length = config.PAGINATION_CURSOR_MAX_LENGTH
+    ),
+) -> Response:
     """
     List all visible projects for the specified language.
+    Pass next_cursor back as cursor to fetch the following page.
     """
-    return await service.list_visible(lang, skip, limit)
+    return await cached_response(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("list", lang, skip, limit, cursor),
+        lambda db: ProjectService(db).list_visible(lang, skip, limit, cursor),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -45,18 +67,26 @@ async def list_projects(
     response_model = list[ProjectResponse],
 )
 async def list_featured_projects(
-    service: ProjectServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
+    if_none_match: IfNoneMatch,
     limit: int = Query(
         default = config.PAGINATION_FEATURED_LIMIT,
         ge = 1,
         le = config.PAGINATION_FEATURED_MAX_LIMIT
     ),
-) -> list[ProjectResponse]:
+) -> Response:
     """
     List featured projects for the overview page.
     """
-    return await service.list_featured(lang, limit)
+    return await cached_response(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("featured", lang, limit),
+        lambda db: ProjectService(db).list_featured(lang, limit),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -64,13 +94,21 @@ async def list_featured_projects(
     response_model = ProjectNavResponse,
 )
 async def get_project_nav(
-    service: ProjectServiceDep,
+    sessions: DBSessionFactory,
     lang: QueryLanguage,
-) -> ProjectNavResponse:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get minimal project data for sidebar navigation.
     """
-    return await service.get_nav_items(lang)
+    return await cached_response(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("nav", lang),
+        lambda db: ProjectService(db).get_nav_items(lang),
+        sessions,
+        if_none_match,
+    )
 
 
 @router.get(
@@ -79,11 +117,19 @@ async def get_project_nav(
     responses = {**NOT_FOUND_404},
 )
 async def get_project(
-    service: ProjectServiceDep,
+    sessions: DBSessionFactory,
     slug: str,
     lang: QueryLanguage,
-) -> ProjectResponse:
+    if_none_match: IfNoneMatch,
+) -> Response:
     """
     Get a single project by slug and language.
     """
-    return await service.get_by_slug(slug, lang)
+    return await cached_response(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("detail", lang, slug),
+        lambda db: ProjectService(db).get_by_slug(slug, lang),
+        sessions,
+        if_none_match,
+    )
@@ -72,6 +72,7 @@ class ProjectListResponse(BaseSchema):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
 
 
 class ProjectNavResponse(BaseSchema):
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import config
 from config import Language
 from core.exceptions import ProjectNotFound
+from snapshot import snapshotstore
 from .repository import ProjectRepository
 from .schemas import (
     ProjectBriefResponse,
@@ -30,6 +31,13 @@ class ProjectService:
         """
         Get project by ID
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            cached = snapshot.projects.by_id.get(project_id)
+            if cached is None:
+                raise ProjectNotFound(str(project_id))
+            return cached
+
         project = await ProjectRepository.get_by_id(self.session, project_id)
         if not project:
             raise ProjectNotFound(str(project_id))
@@ -44,6 +52,13 @@ class ProjectService:
         Get project by slug and language
         Primary lookup for public project pages
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            cached = snapshot.projects.language(language).by_slug.get(slug)
+            if cached is None:
+                raise ProjectNotFound(slug)
+            return cached
+
         project = await ProjectRepository.get_by_slug_and_language(
             self.session,
             slug,
@@ -58,25 +73,36 @@ class ProjectService:
         language: Language,
         skip: int = config.PAGINATION_DEFAULT_SKIP,
         limit: int = config.PAGINATION_DEFAULT_LIMIT,
+        cursor: str | None = None,
     ) -> ProjectListResponse:
         """
         List visible projects for a language
         """
-        projects = await ProjectRepository.get_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.projects.language(language)
+            items, next_cursor = view.paginate(skip, limit, cursor)
+            return ProjectListResponse(
+                items = items,
+                total = len(view.visible),
+                skip = skip,
+                limit = limit,
+                next_cursor = next_cursor,
+            )
+
+        page = await ProjectRepository.get_visible_page_by_language(
             self.session,
             language,
             skip,
             limit,
-        )
-        total = await ProjectRepository.count_visible_by_language(
-            self.session,
-            language,
+            cursor,
         )
         return ProjectListResponse(
-            items = [ProjectResponse.model_validate(p) for p in projects],
-            total = total,
+            items = [ProjectResponse.model_validate(p) for p in page.items],
+            total = page.total,
             skip = skip,
             limit = limit,
+            next_cursor = page.next_cursor,
         )
 
     async def list_featured(
@@ -88,6 +114,10 @@ class ProjectService:
         List featured projects for a language
         Used for overview page highlights
         """
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            return list(snapshot.projects.language(language).featured[:limit])
+
         projects = await ProjectRepository.get_featured_by_language(
             self.session,
             language,
@@ -102,15 +132,24 @@ class ProjectService:
         """
         Get minimal project data for sidebar navigation
         """
-        projects = await ProjectRepository.get_visible_by_language(
-            self.session,
-            language,
-        )
-        total = await ProjectRepository.count_visible_by_language(
+        snapshot = snapshotstore.current
+        if snapshot is not None:
+            view = snapshot.projects.language(language)
+            return ProjectNavResponse(
+                items = [
+                    ProjectBriefResponse.model_validate(p) for p in
+                    view.page(0, config.PAGINATION_DEFAULT_LIMIT)
+                ],
+                total = len(view.visible),
+            )
+
+        page = await ProjectRepository.get_nav_by_language(
             self.session,
             language,
         )
         return ProjectNavResponse(
-            items = [ProjectBriefResponse.model_validate(p) for p in projects],
-            total = total,
+            items = [
+                ProjectBriefResponse.model_validate(p) for p in page.items
+            ],
+            total = page.total,
         )
@@ -0,0 +1,154 @@
+"""
+ⒸAngelaMos | 2025
+cache.py
+"""
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+import config
+from config import Language
+from core.cache import (
+    CacheStats,
+    LocalCache,
+    ResponseCache,
+    responsecache,
+)
+from core.events import (
+    ContentChanged,
+    eventbus,
+)
+from core.fts import uses_trigram
+from core.metrics import track_cache
+from .schemas import SearchResultItem
+
+
+SEARCHED_NAMESPACES = (
+    config.CACHE_NS_PROJECTS,
+    config.CACHE_NS_EXPERIENCES,
+    config.CACHE_NS_CERTIFICATIONS,
+)
+
+SearchResults = list[SearchResultItem]
+
+results_adapter = TypeAdapter(SearchResults)
+
+
+def normalize_query(query: str, language: Language) -> str:
+    """
+    Cache key form of a query
+
+    No stemming is applied, inflected variants get keys of their own.
+    Stemmed languages are matched with plainto_tsquery, which lowercases
+    and ANDs its terms regardless of order or repetition, so the key is
+    the sorted set of lowercased terms. Trigram languages use the query
+    verbatim as an ILIKE substring pattern, where whitespace is
+    significant, so the query is kept as is
+    """
+    if uses_trigram(language):
+        return query
+    return " ".join(sorted(set(query.lower().split())))
+
+
+class SearchCache:
+    """
+    Two tier cache of search results, in process LRU in front of Redis
+
+    Redis keys carry the generations of every searched namespace so a
+    content change makes stale results unreachable. The local tier is
+    cleared on change events and bounded by a short TTL for changes made
+    by other workers
+    """
+    def __init__(self, backend: ResponseCache) -> None:
+        self._backend = backend
+        self._local: LocalCache[SearchResults] = LocalCache(
+            config.SEARCH_CACHE_LOCAL_SIZE,
+            config.SEARCH_CACHE_LOCAL_TTL,
+        )
+        self.stats = CacheStats()
+
+    def init(self) -> None:
+        """
+        Start following content changes
+        """
+        eventbus.subscribe(ContentChanged, self._on_content_changed)
+
+    def close(self) -> None:
+        """
+        Stop following content changes
+        """
+        eventbus.unsubscribe(ContentChanged, self._on_content_changed)
+        self._local.clear()
+
+    @property
+    def local_size(self) -> int:
+        """
+        Number of entries held by the local tier
+        """
+        return len(self._local)
+
+    async def get_or_search(
+        self,
+        query: str,
+        language: Language,
+        limit: int,
+        highlight: bool,
+        search: Callable[[],
+                         Awaitable[SearchResults]],
+    ) -> SearchResults:
+        """
+        Return cached results or run the search and cache them
+        """
+        local_key = ResponseCache.build_key(
+            config.CACHE_NS_SEARCH,
+            language,
+            limit,
+            int(highlight),
+            normalize_query(query, language),
+        )
+        results = self._local.get(local_key)
+        if results is not None:
+            self.stats.local_hits += 1
+            return results
+
+        generations = await self._backend.generations(SEARCHED_NAMESPACES)
+        if generations is None:
+            self.stats.misses += 1
+            return await search()
+
+        key = ResponseCache.build_key(
+            config.CACHE_NS_SEARCH,
+            *(f"g{generation}" for generation in generations),
+            language,
+            limit,
+            int(highlight),
+            normalize_query(query, language),
+        )
+        cached = await self._backend.get(key)
+        if cached is not None:
+            self.stats.redis_hits += 1
+            results = results_adapter.validate_json(cached)
+        else:
+            self.stats.misses += 1
+            results = await search()
+            await self._backend.set(
+                key,
+                to_json(results),
+                config.CACHE_TTL_SEARCH,
+            )
+
+        self._local.set(local_key, results)
+        return results
+
+    async def _on_content_changed(self, event: ContentChanged) -> None:
+        if event.namespace in SEARCHED_NAMESPACES:
+            self._local.clear()
+
+
+searchcache = SearchCache(responsecache)
+track_cache(config.CACHE_NS_SEARCH, searchcache.stats)
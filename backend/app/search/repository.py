@@ -3,13 +3,172 @@
 repository.py
 """
 
-from sqlalchemy import text
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import (
+    Row,
+    select,
+    text,
+)
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from blog.Blog import Blog
+from certification.Certification import Certification
 from config import Language
+from core.fts import (
+    search_config,
+    uses_trigram,
+)
+from experience.Experience import Experience
+from project.Project import Project
 from .schemas import SearchResultItem
 
 
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+
+FTS_MATCH = "{alias}.search_vector @@ query.tsquery"
+FTS_RANK = "ts_rank({alias}.search_vector, query.tsquery)"
+
+TRIGRAM_MATCH = "{alias}.search_text ILIKE query.pattern"
+TRIGRAM_RANK = "word_similarity(query.raw, {alias}.search_text)"
+
+SEARCH_SQL = """
+    WITH query AS (
+        SELECT
+            plainto_tsquery('{config}', CAST(:query AS text)) AS tsquery,
+            CAST(:query AS text) AS raw,
+            CAST(:pattern AS text) AS pattern
+    ),
+    ranked AS MATERIALIZED (
+        SELECT p.id, 'project' AS type, {project_rank} AS rank
+        FROM projects p, query
+        WHERE p.language = '{language}'
+        AND {project_match}
+
+        UNION ALL
+
+        SELECT e.id, 'experience' AS type, {experience_rank} AS rank
+        FROM experiences e, query
+        WHERE e.language = '{language}'
+        AND e.is_visible = true
+        AND {experience_match}
+
+        UNION ALL
+
+        SELECT c.id, 'certification' AS type, {certification_rank} AS rank
+        FROM certifications c, query
+        WHERE c.language = '{language}'
+        AND c.is_visible = true
+        AND {certification_match}
+
+        ORDER BY rank DESC
+        LIMIT :limit
+    )
+    SELECT
+        p.title,
+        {project_excerpt} AS excerpt,
+        '/projects/' || p.slug AS url,
+        ranked.type,
+        ranked.rank
+    FROM ranked
+    JOIN projects p ON ranked.type = 'project' AND p.id = ranked.id, query
+
+    UNION ALL
+
+    SELECT
+        e.company || ' - ' || e.role AS title,
+        {experience_excerpt} AS excerpt,
+        '/background/experience' AS url,
+        ranked.type,
+        ranked.rank
+    FROM ranked
+    JOIN experiences e ON ranked.type = 'experience' AND e.id = ranked.id, query
+
+    UNION ALL
+
+    SELECT
+        c.name AS title,
+        {certification_excerpt} AS excerpt,
+        '/background/certifications' AS url,
+        ranked.type,
+        ranked.rank
+    FROM ranked
+    JOIN certifications c
+        ON ranked.type = 'certification' AND c.id = ranked.id, query
+
+    ORDER BY rank DESC
+"""
+
+HEADLINE_SQL = "ts_headline('{config}', {document}, query.tsquery, '{options}')"
+NO_EXCERPT_SQL = "CAST(NULL AS text)"
+
+PROJECT_DOCUMENT = (
+    "COALESCE(p.description, '') || ' ' || COALESCE(p.technical_details, '')"
+)
+EXPERIENCE_DOCUMENT = "e.description"
+CERTIFICATION_DOCUMENT = "c.name || ' - ' || c.issuer"
+
+
+def escape_like(value: str) -> str:
+    """
+    Escape LIKE wildcards so user input only matches literally
+    """
+    for char in ("\\", "%", "_"):
+        value = value.replace(char, f"\\{char}")
+    return value
+
+
+@lru_cache(maxsize = 2 * len(Language))
+def build_search_statement(language: Language, highlight: bool) -> TextClause:
+    """
+    Build the search statement for one language
+
+    Language and text search configuration are inlined from trusted
+    mappings rather than bound, so the planner can match the per language
+    partial indexes. Stemmed languages match the tsvector, the rest use
+    the trigram index. Exactly one path runs per query
+
+    Ranking runs on ids alone and is limited before any row is joined
+    back, so ts_headline only runs for the returned page, or not at all
+    when highlight is off
+    """
+    config = search_config(language)
+    match, rank = (
+        (TRIGRAM_MATCH, TRIGRAM_RANK) if uses_trigram(language)
+        else (FTS_MATCH, FTS_RANK)
+    )
+
+    def excerpt(document: str) -> str:
+        if not highlight:
+            return NO_EXCERPT_SQL
+        return HEADLINE_SQL.format(
+            config = config,
+            document = document,
+            options = HEADLINE_OPTIONS,
+        )
+
+    return text(
+        SEARCH_SQL.format(
+            config = config,
+            language = language.value,
+            project_match = match.format(alias = "p"),
+            project_rank = rank.format(alias = "p"),
+            project_excerpt = excerpt(PROJECT_DOCUMENT),
+            experience_match = match.format(alias = "e"),
+            experience_rank = rank.format(alias = "e"),
+            experience_excerpt = excerpt(EXPERIENCE_DOCUMENT),
+            certification_match = match.format(alias = "c"),
+            certification_rank = rank.format(alias = "c"),
+            certification_excerpt = excerpt(CERTIFICATION_DOCUMENT),
+        )
+    )
+
+
 class SearchRepository:
     """
     Repository for full-text search across portfolio content
@@ -21,89 +180,19 @@ class SearchRepository:
         query: str,
         language: Language,
         limit: int = 20,
+        highlight: bool = True,
     ) -> list[SearchResultItem]:
         """
         Full-text search across projects, experiences, and certifications.
-        Returns results with highlighted excerpts.
-        """
-        search_query = text(
-            """
-            WITH search_results AS (
-                SELECT
-                    title,
-                    ts_headline(
-                        'english',
-                        COALESCE(description, '') || ' ' || COALESCE(technical_details, ''),
-                        plainto_tsquery('english', :query),
-                        'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
-                    ) AS excerpt,
-                    '/projects/' || slug AS url,
-                    'project' AS type,
-                    ts_rank(
-                        to_tsvector('english', title || ' ' || COALESCE(description, '') || ' ' || COALESCE(technical_details, '')),
-                        plainto_tsquery('english', :query)
-                    ) AS rank
-                FROM projects
-                WHERE language = :language
-                AND to_tsvector('english', title || ' ' || COALESCE(description, '') || ' ' || COALESCE(technical_details, ''))
-                    @@ plainto_tsquery('english', :query)
-
-                UNION ALL
-
-                SELECT
-                    company || ' - ' || role AS title,
-                    ts_headline(
-                        'english',
-                        description,
-                        plainto_tsquery('english', :query),
-                        'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
-                    ) AS excerpt,
-                    '/background/experience' AS url,
-                    'experience' AS type,
-                    ts_rank(
-                        to_tsvector('english', company || ' ' || role || ' ' || description),
-                        plainto_tsquery('english', :query)
-                    ) AS rank
-                FROM experiences
-                WHERE language = :language
-                AND is_visible = true
-                AND to_tsvector('english', company || ' ' || role || ' ' || description)
-                    @@ plainto_tsquery('english', :query)
-
-                UNION ALL
-
-                SELECT
-                    name AS title,
-                    ts_headline(
-                        'english',
-                        name || ' - ' || issuer,
-                        plainto_tsquery('english', :query),
-                        'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
-                    ) AS excerpt,
-                    '/background/certifications' AS url,
-                    'certification' AS type,
-                    ts_rank(
-                        to_tsvector('english', name || ' ' || issuer),
-                        plainto_tsquery('english', :query)
-                    ) AS rank
-                FROM certifications
-                WHERE language = :language
-                AND is_visible = true
-                AND to_tsvector('english', name || ' ' || issuer)
-                    @@ plainto_tsquery('english', :query)
-            )
-            SELECT title, excerpt, url, type
-            FROM search_results
-            ORDER BY rank DESC
-            LIMIT :limit
+        Matches and ranks against the stored, GIN indexed search columns
+        using the text search configuration of the requested language.
+        Returns results with highlighted excerpts unless highlight is off.
         """
-        )
-
         result = await session.execute(
-            search_query,
+            build_search_statement(language, highlight),
             {
                 "query": query,
-                "language": language.value,
+                "pattern": f"%{escape_like(query)}%",
                 "limit": limit,
             }
         )
@@ -117,3 +206,73 @@ class SearchRepository:
                 type = row.type,
             ) for row in rows
         ]
+
+    @classmethod
+    async def project_terms(
+        cls,
+        session: AsyncSession,
+    ) -> Sequence[Row[Any]]:
+        """
+        Titles, slugs and tech stacks of every project
+        """
+        result = await session.execute(
+            select(
+                Project.language,
+                Project.title,
+                Project.slug,
+                Project.tech_stack,
+            )
+        )
+        return result.all()
+
+    @classmethod
+    async def experience_terms(
+        cls,
+        session: AsyncSession,
+    ) -> Sequence[Row[Any]]:
+        """
+        Companies, roles and tech stacks of visible experiences
+        """
+        result = await session.execute(
+            select(
+                Experience.language,
+                Experience.company,
+                Experience.role,
+                Experience.tech_stack,
+            ).where(Experience.is_visible == True)
+        )
+        return result.all()
+
+    @classmethod
+    async def certification_terms(
+        cls,
+        session: AsyncSession,
+    ) -> Sequence[Row[Any]]:
+        """
+        Names of visible certifications
+        """
+        result = await session.execute(
+            select(
+                Certification.language,
+                Certification.name,
+            ).where(Certification.is_visible == True)
+        )
+        return result.all()
+
+    @classmethod
+    async def blog_terms(
+        cls,
+        session: AsyncSession,
+    ) -> Sequence[Row[Any]]:
+        """
+        Titles, links and tags of visible blog posts
+        """
+        result = await session.execute(
+            select(
+                Blog.language,
+                Blog.title,
+                Blog.external_url,
+                Blog.tags,
+            ).where(Blog.is_visible == True)
+        )
+        return result.all()
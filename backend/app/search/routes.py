@@ -5,9 +5,17 @@ routes.py
 
 from fastapi import APIRouter, Query
 
+import config
+from config import Language
+from core.cache import public_cache_headers
 from core.dependencies import QueryLanguage
+from core.responses import FastJSONResponse
 from .dependencies import SearchServiceDep
-from .schemas import SearchResponse
+from .schemas import (
+    SearchResponse,
+    SuggestResponse,
+)
+from .suggest import suggestindex
 
 
 router = APIRouter(prefix = "/search", tags = ["search"])
@@ -25,10 +33,45 @@ async def search(
     limit: int = Query(default = 20,
                        ge = 1,
                        le = 50),
-) -> SearchResponse:
+    highlight: bool = True,
+) -> FastJSONResponse:
     """
     Full-text search across all portfolio content.
     Searches projects, experiences, and certifications.
-    Returns highlighted excerpts.
+    Returns highlighted excerpts unless highlight=false.
+    """
+    return FastJSONResponse(
+        await service.search(q,
+                             lang,
+                             limit,
+                             highlight),
+        headers = public_cache_headers(config.CACHE_NS_SEARCH),
+    )
+
+
+@router.get(
+    "/suggest",
+    response_model = SuggestResponse,
+)
+async def suggest(
+    q: str = Query(min_length = 1,
+                   max_length = config.SUGGEST_QUERY_MAX_LENGTH),
+    lang: QueryLanguage | None = None,
+    limit: int = Query(default = config.SUGGEST_DEFAULT_LIMIT,
+                       ge = 1,
+                       le = config.SUGGEST_MAX_LIMIT),
+) -> FastJSONResponse:
+    """
+    Typeahead suggestions for a query prefix.
+    Matches titles, slugs, tech stack entries and tags from an
+    in memory index, never touches the database.
     """
-    return await service.search(q, lang, limit)
+    return FastJSONResponse(
+        SuggestResponse(
+            query = q,
+            suggestions = suggestindex.suggest(q,
+                                               lang or Language.ENGLISH,
+                                               limit),
+        ),
+        headers = public_cache_headers(config.CACHE_NS_SEARCH),
+    )
@@ -11,7 +11,7 @@ class SearchResultItem(BaseModel):
     Single search result with highlighted excerpt
     """
     title: str
-    excerpt: str
+    excerpt: str | None = None
     url: str
     type: str = Field(description = "project, experience, or certification")
 
@@ -23,3 +23,33 @@ class SearchResponse(BaseModel):
     query: str
     total: int
     results: list[SearchResultItem]
+
+
+class SuggestionItem(BaseModel):
+    """
+    Single typeahead suggestion
+    """
+    text: str
+    type: str = Field(
+        description = "project, experience, certification, blog, tech or tag"
+    )
+    url: str | None = None
+
+
+class SuggestResponse(BaseModel):
+    """
+    Typeahead suggestions for a query prefix
+    """
+    query: str
+    suggestions: list[SuggestionItem]
+
+
+class SearchCacheStatsResponse(BaseModel):
+    """
+    Hit and miss counters of the search result cache
+    """
+    local_hits: int
+    redis_hits: int
+    misses: int
+    hit_ratio: float
+    local_size: int
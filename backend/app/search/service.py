@@ -3,9 +3,12 @@
 service.py
 """
 
+from functools import partial
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import Language
+from .cache import searchcache
 from .repository import SearchRepository
 from .schemas import SearchResponse
 
@@ -22,15 +25,26 @@ class SearchService:
         query: str,
         language: Language | None,
         limit: int = 20,
+        highlight: bool = True,
     ) -> SearchResponse:
         """
-        Search across all portfolio content
+        Search across all portfolio content, served from the search
+        cache when the same terms were searched before
         """
-        results = await SearchRepository.search_all(
-            self.session,
+        language = language or Language.ENGLISH
+        results = await searchcache.get_or_search(
             query,
-            language or Language.ENGLISH,
+            language,
             limit,
+            highlight,
+            partial(
+                SearchRepository.search_all,
+                self.session,
+                query,
+                language,
+                limit,
+                highlight,
+            ),
         )
 
         return SearchResponse(
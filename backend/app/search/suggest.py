@@ -0,0 +1,277 @@
+"""
+ⒸAngelaMos | 2025
+suggest.py
+"""
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Language
+from core.database import sessionmanager
+from core.events import (
+    ContentChanged,
+    eventbus,
+)
+from core.fts import uses_trigram
+from core.logging import get_logger
+from core.refresh import CoalescedRefresh
+from .repository import SearchRepository
+from .schemas import SuggestionItem
+
+
+logger = get_logger(__name__)
+
+WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen = True, slots = True)
+class SuggestEntry:
+    """
+    A suggestion and the terms whose prefixes should find it
+    """
+    language: Language
+    item: SuggestionItem
+    terms: tuple[str, ...]
+
+
+def normalize(value: str) -> str:
+    """
+    Case fold and collapse whitespace so lookups ignore formatting
+    """
+    return " ".join(value.casefold().split())
+
+
+def _term_keys(term: str, language: Language) -> set[str]:
+    """
+    Every suffix of a term a prefix lookup may start at
+
+    Word starts for space separated scripts, every character for
+    languages written without word boundaries
+    """
+    term = normalize(term)
+    if uses_trigram(language):
+        return {term[i:] for i in range(len(term)) if not term[i].isspace()}
+    return {term[match.start():] for match in WORD.finditer(term)}
+
+
+@dataclass(frozen = True, slots = True)
+class PrefixTable:
+    """
+    Sorted array of keys with the suggestion each key points to
+
+    A prefix lookup is one bisect plus a scan over the matching run
+    """
+    keys: list[str]
+    items: list[SuggestionItem]
+
+    @classmethod
+    def build(cls, entries: Iterable[SuggestEntry]) -> "PrefixTable":
+        """
+        Sort all keys of the entries, one item per distinct suggestion
+        """
+        items: dict[tuple[str, str, str | None], SuggestionItem] = {}
+        pairs: set[tuple[str, tuple[str, str, str | None]]] = set()
+        for entry in entries:
+            identity = (
+                entry.item.type,
+                normalize(entry.item.text),
+                entry.item.url,
+            )
+            items.setdefault(identity, entry.item)
+            for term in entry.terms:
+                pairs.update(
+                    (key, identity)
+                    for key in _term_keys(term, entry.language)
+                )
+
+        ordered = sorted(pairs, key = lambda pair: pair[0])
+        return cls(
+            keys = [key for key, _ in ordered],
+            items = [items[identity] for _, identity in ordered],
+        )
+
+    def lookup(self, prefix: str, limit: int) -> list[SuggestionItem]:
+        """
+        Distinct suggestions with a key starting with prefix
+        """
+        found: dict[int, SuggestionItem] = {}
+        for index in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[index].startswith(prefix):
+                break
+            item = self.items[index]
+            found.setdefault(id(item), item)
+            if len(found) >= limit:
+                break
+        return list(found.values())
+
+
+async def collect_entries(session: AsyncSession) -> list[SuggestEntry]:
+    """
+    Load every suggestible term of the public content
+    """
+    entries: list[SuggestEntry] = []
+
+    for row in await SearchRepository.project_terms(session):
+        url = f"/projects/{row.slug}"
+        entries.append(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(text = row.title,
+                               type = "project",
+                               url = url),
+                (row.title,
+                 row.slug.replace("-",
+                                  " ")),
+            )
+        )
+        entries.extend(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(text = tech,
+                               type = "tech"),
+                (tech, ),
+            ) for tech in row.tech_stack or ()
+        )
+
+    for row in await SearchRepository.experience_terms(session):
+        entries.append(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(
+                    text = f"{row.company} - {row.role}",
+                    type = "experience",
+                    url = "/background/experience",
+                ),
+                (row.company,
+                 row.role),
+            )
+        )
+        entries.extend(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(text = tech,
+                               type = "tech"),
+                (tech, ),
+            ) for tech in row.tech_stack or ()
+        )
+
+    for row in await SearchRepository.certification_terms(session):
+        entries.append(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(
+                    text = row.name,
+                    type = "certification",
+                    url = "/background/certifications",
+                ),
+                (row.name, ),
+            )
+        )
+
+    for row in await SearchRepository.blog_terms(session):
+        entries.append(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(
+                    text = row.title,
+                    type = "blog",
+                    url = row.external_url,
+                ),
+                (row.title, ),
+            )
+        )
+        entries.extend(
+            SuggestEntry(
+                row.language,
+                SuggestionItem(text = tag,
+                               type = "tag"),
+                (tag, ),
+            ) for tag in row.tags or ()
+        )
+
+    return entries
+
+
+class SuggestIndex:
+    """
+    Per language, in memory prefix index for typeahead suggestions
+
+    Built at startup and rebuilt in the background whenever content
+    changes, so lookups never touch Postgres. Tables are replaced
+    wholesale, readers always see either the old or the new snapshot
+    """
+    def __init__(self) -> None:
+        self._tables: dict[Language, PrefixTable] = {}
+        self._background = CoalescedRefresh(self.refresh)
+
+    def init(self) -> None:
+        """
+        Start following content changes, of every worker
+        """
+        eventbus.subscribe(
+            ContentChanged,
+            self._on_content_changed,
+            remote = True,
+        )
+
+    async def close(self) -> None:
+        """
+        Stop following content changes and cancel a pending rebuild
+        """
+        eventbus.unsubscribe(ContentChanged, self._on_content_changed)
+        self._background.cancel()
+
+    def load(self, entries: Iterable[SuggestEntry]) -> None:
+        """
+        Replace the index with one built from entries
+        """
+        grouped: dict[Language, list[SuggestEntry]] = {}
+        for entry in entries:
+            grouped.setdefault(entry.language, []).append(entry)
+        self._tables = {
+            language: PrefixTable.build(language_entries)
+            for language, language_entries in grouped.items()
+        }
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        """
+        Rebuild the index from the database
+        """
+        entries = await collect_entries(session)
+        self.load(entries)
+        logger.info("suggest_index_built", entries = len(entries))
+
+    async def refresh(self) -> None:
+        """
+        Rebuild in a session of its own, keeping the old index on failure
+        """
+        try:
+            async with sessionmanager.session() as session:
+                await self.rebuild(session)
+        except Exception:
+            logger.exception("suggest_index_refresh_failed")
+
+    def suggest(
+        self,
+        query: str,
+        language: Language,
+        limit: int,
+    ) -> list[SuggestionItem]:
+        """
+        Suggestions whose terms start with the query
+        """
+        prefix = normalize(query)
+        table = self._tables.get(language)
+        if not prefix or table is None:
+            return []
+        return table.lookup(prefix, limit)
+
+    async def _on_content_changed(self, _event: ContentChanged) -> None:
+        self._background.trigger()
+
+
+suggestindex = SuggestIndex()
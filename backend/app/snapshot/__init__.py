@@ -0,0 +1,23 @@
+"""
+ⒸAngelaMos | 2025
+__init__.py
+"""
+
+from .index import (
+    ContentIndex,
+    LanguageView,
+)
+from .store import (
+    ContentSnapshot,
+    SnapshotStore,
+    snapshotstore,
+)
+
+
+__all__ = [
+    "ContentIndex",
+    "ContentSnapshot",
+    "LanguageView",
+    "SnapshotStore",
+    "snapshotstore",
+]
@@ -0,0 +1,170 @@
+"""
+ⒸAngelaMos | 2025
+index.py
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+)
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from config import Language
+from core.pagination import (
+    decode_cursor,
+    encode_cursor,
+)
+
+
+ItemT = TypeVar("ItemT", bound = BaseModel)
+
+Predicate = Callable[[Any], bool]
+KeyFunc = Callable[[Any], Hashable | None]
+SlugFunc = Callable[[Any], str]
+
+CURSOR_TYPES = (int, UUID)
+
+
+def _cursor_key(item: Any) -> tuple[int, UUID]:
+    """
+    (display_order, id) sort key, the cursor keys of the repositories
+    """
+    return item.display_order, item.id
+
+
+@dataclass(frozen = True, slots = True)
+class LanguageView(Generic[ItemT]):
+    """
+    Visible rows of one content type in one language, in display order
+
+    featured holds the highlighted subset of the type: featured projects
+    and posts, current positions, active certifications
+    """
+    visible: tuple[ItemT, ...]
+    featured: tuple[ItemT, ...]
+    by_slug: Mapping[str, ItemT]
+    by_category: Mapping[Hashable, tuple[ItemT, ...]]
+
+    def page(self, skip: int, limit: int) -> list[ItemT]:
+        """
+        One offset page of the visible rows
+        """
+        return list(self.visible[skip:skip + limit])
+
+    def paginate(
+        self,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[ItemT], str | None]:
+        """
+        One page of the visible rows and the cursor of the next one
+
+        A cursor seeks past the row it was taken from, like the keyset
+        queries of the repositories
+        """
+        if cursor is not None:
+            skip = bisect_right(
+                self.visible,
+                decode_cursor(cursor, CURSOR_TYPES),
+                key = _cursor_key,
+            )
+        items = self.page(skip, limit)
+        next_cursor = None
+        if items and skip + len(items) < len(self.visible):
+            next_cursor = encode_cursor(_cursor_key(items[-1]))
+        return items, next_cursor
+
+    def category(self, category: Hashable) -> list[ItemT]:
+        """
+        Visible rows of a category
+        """
+        return list(self.by_category.get(category, ()))
+
+
+EMPTY_VIEW: LanguageView[Any] = LanguageView(
+    visible = (),
+    featured = (),
+    by_slug = MappingProxyType({}),
+    by_category = MappingProxyType({}),
+)
+
+
+@dataclass(frozen = True, slots = True)
+class ContentIndex(Generic[ItemT]):
+    """
+    Immutable, indexed copy of every row of one content type
+    """
+    by_id: Mapping[UUID, ItemT]
+    views: Mapping[Language, LanguageView[ItemT]]
+
+    def language(self, language: Language) -> LanguageView[ItemT]:
+        """
+        View of one language, empty when it has no content
+        """
+        return self.views.get(language, EMPTY_VIEW)
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Any],
+        schema: type[ItemT],
+        *,
+        visible: Predicate,
+        featured: Predicate,
+        slug: SlugFunc | None = None,
+        category: KeyFunc | None = None,
+    ) -> "ContentIndex[ItemT]":
+        """
+        Validate rows into response schemas and index them
+
+        Rows must arrive in display order, every view keeps that order.
+        by_id covers hidden rows too, matching lookups by id
+        """
+        by_id: dict[UUID, ItemT] = {}
+        grouped: defaultdict[Language, list[tuple[Any, ItemT]]] = defaultdict(
+            list
+        )
+        for row in rows:
+            item = schema.model_validate(row)
+            by_id[row.id] = item
+            if visible(row):
+                grouped[row.language].append((row, item))
+
+        views = {}
+        for language, pairs in grouped.items():
+            by_category: defaultdict[Hashable, list[ItemT]] = defaultdict(list)
+            if category is not None:
+                for row, item in pairs:
+                    key = category(row)
+                    if key is not None:
+                        by_category[key].append(item)
+            views[language] = LanguageView(
+                visible = tuple(item for _, item in pairs),
+                featured = tuple(item for row, item in pairs if featured(row)),
+                by_slug = MappingProxyType(
+                    {slug(row): item for row, item in pairs}
+                    if slug is not None else {}
+                ),
+                by_category = MappingProxyType(
+                    {key: tuple(items) for key, items in by_category.items()}
+                ),
+            )
+
+        return cls(
+            by_id = MappingProxyType(by_id),
+            views = MappingProxyType(views),
+        )
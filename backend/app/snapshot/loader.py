@@ -0,0 +1,106 @@
+"""
+ⒸAngelaMos | 2025
+loader.py
+"""
+
+import hashlib
+from datetime import (
+    UTC,
+    datetime,
+)
+from typing import Any
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog.Blog import Blog
+from blog.schemas import BlogResponse
+from certification.Certification import Certification
+from certification.schemas import CertificationResponse
+from experience.Experience import Experience
+from experience.schemas import ExperienceResponse
+from project.Project import Project
+from project.schemas import ProjectResponse
+from .index import ContentIndex
+from .repository import SnapshotRepository
+from .store import ContentSnapshot
+
+
+def snapshot_version(*indexes: ContentIndex[Any]) -> str:
+    """
+    Digest of every row and view of a snapshot
+
+    Derived from the content alone, workers that loaded the same rows
+    agree on it and share response cache entries. Views are included
+    since visibility flags are not part of every response schema
+    """
+    digest = hashlib.blake2b(digest_size = 8)
+    for index in indexes:
+        digest.update(to_json(list(index.by_id.values())))
+        digest.update(
+            to_json(
+                [
+                    (language, view.visible, view.featured)
+                    for language, view in index.views.items()
+                ]
+            )
+        )
+    return digest.hexdigest()
+
+
+async def load_snapshot(session: AsyncSession) -> ContentSnapshot:
+    """
+    Read every content row and index it, filters mirror the repositories
+    """
+    projects = await SnapshotRepository.get_all_ordered(session, Project)
+    experiences = await SnapshotRepository.get_all_ordered(
+        session,
+        Experience,
+    )
+    certifications = await SnapshotRepository.get_all_ordered(
+        session,
+        Certification,
+    )
+    blogs = await SnapshotRepository.get_all_ordered(session, Blog)
+
+    project_index = ContentIndex.build(
+        projects,
+        ProjectResponse,
+        visible = lambda _: True,
+        featured = lambda p: p.is_complete and p.is_featured,
+        slug = lambda p: p.slug,
+    )
+    experience_index = ContentIndex.build(
+        experiences,
+        ExperienceResponse,
+        visible = lambda e: e.is_visible,
+        featured = lambda e: e.is_current,
+    )
+    certification_index = ContentIndex.build(
+        certifications,
+        CertificationResponse,
+        visible = lambda c: c.is_visible,
+        featured = lambda c: not c.is_expired,
+        category = lambda c: c.category,
+    )
+    blog_index = ContentIndex.build(
+        blogs,
+        BlogResponse,
+        visible = lambda b: b.is_visible,
+        featured = lambda b: b.is_featured,
+        category = lambda b: b.category,
+    )
+
+    return ContentSnapshot(
+        projects = project_index,
+        experiences = experience_index,
+        certifications = certification_index,
+        blogs = blog_index,
+        loaded_at = datetime.now(UTC),
+        version = snapshot_version(
+            project_index,
+            experience_index,
+            certification_index,
+            blog_index,
+        ),
+    )
@@ -0,0 +1,39 @@
+"""
+ⒸAngelaMos | 2025
+repository.py
+"""
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog.Blog import Blog
+from certification.Certification import Certification
+from experience.Experience import Experience
+from project.Project import Project
+
+
+ContentT = TypeVar("ContentT", Project, Experience, Certification, Blog)
+
+
+class SnapshotRepository:
+    """
+    Bulk reads of public content for the in memory snapshot
+    """
+    @classmethod
+    async def get_all_ordered(
+        cls,
+        session: AsyncSession,
+        model: type[ContentT],
+    ) -> Sequence[ContentT]:
+        """
+        Every row of a content model in display order
+
+        The id tie break keeps the order stable across reloads
+        """
+        result = await session.execute(
+            select(model).order_by(model.display_order, model.id)
+        )
+        return result.scalars().all()
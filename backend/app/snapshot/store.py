@@ -0,0 +1,126 @@
+"""
+ⒸAngelaMos | 2025
+store.py
+"""
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import responsecache
+from core.database import sessionmanager
+from core.events import (
+    ContentChanged,
+    eventbus,
+)
+from core.logging import get_logger
+from core.refresh import CoalescedRefresh
+from .index import ContentIndex
+
+
+if TYPE_CHECKING:
+    from blog.schemas import BlogResponse
+    from certification.schemas import CertificationResponse
+    from experience.schemas import ExperienceResponse
+    from project.schemas import ProjectResponse
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen = True, slots = True)
+class ContentSnapshot:
+    """
+    Point in time copy of all public portfolio content
+    """
+    projects: "ContentIndex[ProjectResponse]"
+    experiences: "ContentIndex[ExperienceResponse]"
+    certifications: "ContentIndex[CertificationResponse]"
+    blogs: "ContentIndex[BlogResponse]"
+    loaded_at: datetime
+    version: str
+
+
+SnapshotLoader = Callable[[AsyncSession], Awaitable[ContentSnapshot]]
+
+
+class SnapshotStore:
+    """
+    Holder of the current content snapshot of this worker
+
+    Enabled with SNAPSHOT_MODE. Services answer from current while it is
+    set and fall back to the database otherwise. Reloads build a complete
+    new snapshot and swap the reference, a request never observes a half
+    built one. Content changes of any worker trigger a reload through
+    LISTEN/NOTIFY. The response cache keys on the version of the snapshot
+    in use, so bodies cached from it never outlive it
+    """
+    def __init__(self) -> None:
+        self._snapshot: ContentSnapshot | None = None
+        self._loader: SnapshotLoader | None = None
+        self._background = CoalescedRefresh(self.reload)
+
+    @property
+    def current(self) -> ContentSnapshot | None:
+        """
+        Current snapshot, None while snapshot mode is off
+        """
+        return self._snapshot
+
+    def init(self, loader: SnapshotLoader) -> None:
+        """
+        Start following content changes
+
+        The loader is injected so content services can read the store
+        without importing every content model
+        """
+        self._loader = loader
+        eventbus.subscribe(
+            ContentChanged,
+            self._on_content_changed,
+            remote = True,
+        )
+
+    async def close(self) -> None:
+        """
+        Stop following content changes and drop the snapshot
+        """
+        eventbus.unsubscribe(ContentChanged, self._on_content_changed)
+        self._background.cancel()
+        self._snapshot = None
+        responsecache.content_version = None
+
+    async def reload(self) -> None:
+        """
+        Load a fresh snapshot, keeping the previous one on failure
+        """
+        if self._loader is None:
+            return
+        try:
+            async with sessionmanager.session() as session:
+                snapshot = await self._loader(session)
+        except Exception:
+            logger.exception("snapshot_reload_failed")
+            return
+        self._snapshot = snapshot
+        responsecache.content_version = snapshot.version
+        logger.info(
+            "snapshot_loaded",
+            version = snapshot.version,
+            projects = len(snapshot.projects.by_id),
+            experiences = len(snapshot.experiences.by_id),
+            certifications = len(snapshot.certifications.by_id),
+            blogs = len(snapshot.blogs.by_id),
+        )
+
+    async def _on_content_changed(self, _event: ContentChanged) -> None:
+        self._background.trigger()
+
+
+snapshotstore = SnapshotStore()
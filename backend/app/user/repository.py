@@ -10,13 +10,40 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from config import UserRole
 from .User import User
 from core.base_repository import BaseRepository
+from core.events import record_event
+from core.principal import (
+    Principal,
+    UserChanged,
+)
 
 
 class UserRepository(BaseRepository[User]):
     """
     Repository for User model database operations
+
+    Writes queue a UserChanged event with the new principal, so cached
+    token versions, status and roles follow every change. UUIDv7 ids
+    are time ordered, so they alone make a stable cursor
     """
     model = User
+    cursor_keys = (User.id, )
+
+    @classmethod
+    def _record_change(
+        cls,
+        session: AsyncSession,
+        instance: User,
+    ) -> None:
+        """
+        Queue the current principal of the user
+        """
+        record_event(
+            session,
+            UserChanged(
+                user_id = instance.id,
+                principal = Principal.from_user(instance),
+            ),
+        )
 
     @classmethod
     async def get_by_email(
@@ -75,7 +102,6 @@ class UserRepository(BaseRepository[User]):
         )
         session.add(user)
         await session.flush()
-        await session.refresh(user)
         return user
 
     @classmethod
@@ -91,7 +117,7 @@ class UserRepository(BaseRepository[User]):
         user.hashed_password = hashed_password
         user.increment_token_version()
         await session.flush()
-        await session.refresh(user)
+        cls._record_change(session, user)
         return user
 
     @classmethod
@@ -105,5 +131,18 @@ class UserRepository(BaseRepository[User]):
         """
         user.increment_token_version()
         await session.flush()
-        await session.refresh(user)
+        cls._record_change(session, user)
         return user
+
+    @classmethod
+    async def delete(
+        cls,
+        session: AsyncSession,
+        instance: User,
+    ) -> None:
+        """
+        Delete a user and tombstone its cached principal
+        """
+        user_id = instance.id
+        await super().delete(session, instance)
+        record_event(session, UserChanged(user_id = user_id, principal = None))
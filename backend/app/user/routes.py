@@ -10,7 +10,10 @@ from fastapi import (
     status,
 )
 
-from core.dependencies import CurrentUser
+from core.dependencies import (
+    CurrentUser,
+    CurrentUserModel,
+)
 from core.responses import (
     AUTH_401,
     CONFLICT_409,
@@ -69,7 +72,7 @@ async def get_user(
 )
 async def update_current_user(
     user_service: UserServiceDep,
-    current_user: CurrentUser,
+    current_user: CurrentUserModel,
     user_data: UserUpdate,
 ) -> UserResponse:
     """
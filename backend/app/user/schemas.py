@@ -103,3 +103,4 @@ class UserListResponse(BaseSchema):
     total: int
     page: int
     size: int
+    next_cursor: str | None = None
@@ -136,22 +136,24 @@ class UserService:
         self,
         page: int,
         size: int,
+        cursor: str | None = None,
     ) -> UserListResponse:
         """
-        List users with pagination
+        List users with pagination, a cursor takes precedence over page
         """
         skip = (page - 1) * size
-        users = await UserRepository.get_multi(
+        users = await UserRepository.get_page(
             self.session,
             skip = skip,
-            limit = size
+            limit = size,
+            cursor = cursor,
         )
-        total = await UserRepository.count(self.session)
         return UserListResponse(
-            items = [UserResponse.model_validate(u) for u in users],
-            total = total,
+            items = [UserResponse.model_validate(u) for u in users.items],
+            total = users.total,
             page = page,
             size = size,
+            next_cursor = users.next_cursor,
         )
 
     async def admin_create_user(
@@ -0,0 +1,173 @@
+"""
+ⒸAngelaMos | 2025
+bench_middleware.py
+
+Requests per second on /v1/projects with the pure ASGI middleware stack
+against the BaseHTTPMiddleware stack it replaced
+
+Needs the database from the dev compose file, run from backend/:
+    python benchmarks/bench_middleware.py --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import structlog
+from fastapi import FastAPI
+from httpx import (
+    ASGITransport,
+    AsyncClient,
+)
+from starlette.middleware import Middleware
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+
+from core.instrumentation import track_queries
+from core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE,
+)
+from factory import create_app
+from middleware.correlation import CorrelationIdMiddleware
+from middleware.metrics import (
+    MetricsMiddleware,
+    route_template,
+)
+
+
+URL_PROJECTS = "/v1/projects"
+
+
+class BaseHTTPCorrelationIdMiddleware(BaseHTTPMiddleware):
+    """
+    The previous correlation middleware, kept as the baseline
+    """
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        correlation_id = request.headers.get("X-Correlation-ID", "bench")
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            correlation_id = correlation_id,
+            method = request.method,
+            path = request.url.path,
+        )
+        query_stats = track_queries()
+        response = await call_next(request)
+        response.headers["X-Correlation-ID"] = correlation_id
+        response.headers["Server-Timing"] = query_stats.server_timing()
+        return response
+
+
+class BaseHTTPMetricsMiddleware(BaseHTTPMiddleware):
+    """
+    The previous metrics middleware, kept as the baseline
+    """
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        method = request.method
+        HTTP_REQUESTS_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec(method)
+        route = route_template(request.scope)
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            method,
+            route,
+            str(response.status_code),
+        )
+        HTTP_RESPONSE_SIZE.observe(
+            int(response.headers.get("content-length",
+                                     0)),
+            method,
+            route,
+        )
+        return response
+
+
+BASELINE = {
+    CorrelationIdMiddleware: BaseHTTPCorrelationIdMiddleware,
+    MetricsMiddleware: BaseHTTPMetricsMiddleware,
+}
+
+
+def build_app(stack: str) -> FastAPI:
+    """
+    Application with either middleware stack
+    """
+    app = create_app()
+    if stack == "basehttp":
+        app.user_middleware = [
+            Middleware(BASELINE[m.cls]) if m.cls in BASELINE else m
+            for m in app.user_middleware
+        ]
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    """
+    Requests per second over a fixed number of requests
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = ASGITransport(app = app)
+
+    async with (
+        app.router.lifespan_context(app),
+        AsyncClient(transport = transport,
+                    base_url = "http://bench") as client,
+    ):
+
+        async def one() -> None:
+            async with semaphore:
+                response = await client.get(URL_PROJECTS)
+                response.raise_for_status()
+
+        await one()
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """
+    Benchmark both stacks and print requests per second
+    """
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--requests", type = int, default = 2000)
+    parser.add_argument("--concurrency", type = int, default = 50)
+    args = parser.parse_args()
+
+    results = {}
+    for stack in ("basehttp", "asgi"):
+        results[stack] = asyncio.run(
+            run(build_app(stack),
+                args.requests,
+                args.concurrency)
+        )
+        print(f"{stack:>8}: {results[stack]:8.1f} req/s")
+
+    speedup = results["asgi"] / results["basehttp"]
+    print(f"speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
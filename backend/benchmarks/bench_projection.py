@@ -0,0 +1,199 @@
+"""
+ⒸAngelaMos | 2025
+bench_projection.py
+
+Rows per second and row bytes for the project nav query, loading full
+Project entities against selecting only the nav columns
+
+Seeds synthetic projects inside a transaction that is rolled back, so the
+database is left untouched. Needs the database from the dev compose file,
+run from backend/:
+    python benchmarks/bench_projection.py --rows 100 --iterations 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Sequence,
+)
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from sqlalchemy import (
+    Select,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine,
+)
+
+import config
+from config import (
+    Language,
+    settings,
+)
+from project.Project import Project
+from project.repository import ProjectRepository
+from project.schemas import ProjectBriefResponse
+
+
+LANGUAGE = Language.ENGLISH
+LONG_TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+
+Load = Callable[[AsyncSession, int], Awaitable[Sequence[Any]]]
+
+
+async def load_entities(session: AsyncSession, rows: int) -> Sequence[Any]:
+    """
+    The previous nav path, full entities validated into briefs
+    """
+    result = await session.execute(entity_statement(rows))
+    projects = result.scalars().all()
+    return [ProjectBriefResponse.model_validate(p) for p in projects]
+
+
+async def load_columns(session: AsyncSession, rows: int) -> Sequence[Any]:
+    """
+    The projected nav path, plain rows validated into briefs
+    """
+    page = await ProjectRepository.get_nav_by_language(
+        session,
+        LANGUAGE,
+        limit = rows,
+    )
+    return [ProjectBriefResponse.model_validate(r) for r in page.items]
+
+
+def entity_statement(rows: int) -> Select[Any]:
+    """
+    Statement behind load_entities
+    """
+    return select(Project).where(Project.language == LANGUAGE).order_by(
+        *ProjectRepository.cursor_keys
+    ).limit(rows)
+
+
+def column_statement(rows: int) -> Select[Any]:
+    """
+    Statement behind load_columns, without the window count
+    """
+    return entity_statement(rows).with_only_columns(
+        *ProjectRepository.brief_columns
+    )
+
+
+async def row_bytes(session: AsyncSession, statement: Select[Any]) -> int:
+    """
+    Total size of the rows a statement returns, as stored by Postgres
+    """
+    sub = statement.subquery("sub")
+    result = await session.execute(
+        select(func.sum(func.pg_column_size(literal_column("sub.*")))
+               ).select_from(sub)
+    )
+    return result.scalar_one() or 0
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    """
+    Projects with realistically long text columns
+    """
+    session.add_all(
+        Project(
+            slug = f"bench-projection-{i}",
+            language = LANGUAGE,
+            title = f"Bench project {i}",
+            subtitle = "Projection benchmark",
+            description = LONG_TEXT[:config.PROJECT_DESCRIPTION_MAX_LENGTH],
+            technical_details = LONG_TEXT,
+            code_snippet = LONG_TEXT,
+            tech_stack = ["Python",
+                          "FastAPI",
+                          "PostgreSQL"],
+            display_order = i,
+        ) for i in range(rows)
+    )
+    await session.flush()
+    session.expunge_all()
+
+
+async def measure(
+    session: AsyncSession,
+    load: Load,
+    rows: int,
+    iterations: int,
+) -> float:
+    """
+    Rows per second over a fixed number of loads
+    """
+    await load(session, rows)
+    session.expunge_all()
+    loaded = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        loaded += len(await load(session, rows))
+        session.expunge_all()
+    return loaded / (time.perf_counter() - start)
+
+
+async def run(rows: int, iterations: int) -> None:
+    """
+    Seed, benchmark both paths and print the results
+    """
+    engine = create_async_engine(str(settings.DATABASE_URL))
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind = connection, expire_on_commit = False)
+        try:
+            await seed(session, rows)
+            entity_rate = await measure(
+                session,
+                load_entities,
+                rows,
+                iterations,
+            )
+            column_rate = await measure(
+                session,
+                load_columns,
+                rows,
+                iterations,
+            )
+            entity_bytes = await row_bytes(session, entity_statement(rows))
+            column_bytes = await row_bytes(session, column_statement(rows))
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+    print(f"{'path':>8}  {'rows/s':>10}  {'bytes/request':>14}")
+    print(f"{'entities':>8}  {entity_rate:10.0f}  {entity_bytes:14d}")
+    print(f"{'columns':>8}  {column_rate:10.0f}  {column_bytes:14d}")
+    print(
+        f"speedup: {column_rate / entity_rate:.2f}x, "
+        f"bytes: {column_bytes / max(entity_bytes, 1):.1%}"
+    )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark
+    """
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--rows", type = int, default = 100)
+    parser.add_argument("--iterations", type = int, default = 200)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
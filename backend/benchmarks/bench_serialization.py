@@ -0,0 +1,225 @@
+"""
+ⒸAngelaMos | 2025
+bench_serialization.py
+
+CPU time per request spent serializing responses, per endpoint payload:
+    stock   model returned to FastAPI, validated, jsonable_encoder'd and
+            rendered by JSONResponse
+    fast    FastJSONResponse returned by the route, pydantic-core to bytes
+    cached  raw JSON bytes from the response cache, no validation at all
+
+Runs in process, no database or Redis needed, run from backend/:
+    python benchmarks/bench_serialization.py --requests 500
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Callable
+from datetime import (
+    UTC,
+    date,
+    datetime,
+)
+from pathlib import Path
+from uuid import uuid4
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+from fastapi import (
+    FastAPI,
+    Response,
+)
+from fastapi.responses import JSONResponse
+from httpx import (
+    ASGITransport,
+    AsyncClient,
+)
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from config import (
+    Language,
+    ProjectStatus,
+    UserRole,
+)
+from core.responses import FastJSONResponse
+from project.schemas import (
+    ProjectListResponse,
+    ProjectResponse,
+)
+from user.schemas import (
+    UserListResponse,
+    UserResponse,
+)
+
+
+LONG_TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 30
+VARIANTS = ("stock", "fast", "cached")
+
+
+def project_list(items: int) -> ProjectListResponse:
+    """
+    /v1/projects page full of long text fields
+    """
+    projects = [
+        ProjectResponse(
+            id = uuid4(),
+            created_at = datetime.now(UTC),
+            slug = f"project-{i}",
+            language = Language.ENGLISH,
+            title = f"Project {i}",
+            subtitle = "Serialization benchmark",
+            description = LONG_TEXT,
+            technical_details = LONG_TEXT,
+            tech_stack = ["Python",
+                          "FastAPI",
+                          "PostgreSQL"],
+            github_url = "https://github.com/example/project",
+            demo_url = None,
+            website_url = "https://example.com",
+            docs_url = None,
+            blog_url = None,
+            pypi_url = None,
+            npm_url = None,
+            ios_url = None,
+            android_url = None,
+            code_snippet = LONG_TEXT,
+            code_language = "python",
+            code_filename = "main.py",
+            thumbnail_url = None,
+            banner_url = None,
+            screenshots = [
+                f"https://example.com/{i}-{n}.png" for n in range(4)
+            ],
+            stars_count = i,
+            forks_count = None,
+            downloads_count = None,
+            users_count = None,
+            display_order = i,
+            is_complete = True,
+            is_featured = i % 5 == 0,
+            status = ProjectStatus.ACTIVE,
+            start_date = date(2024,
+                              1,
+                              1),
+            end_date = None,
+        ) for i in range(items)
+    ]
+    return ProjectListResponse(
+        items = projects,
+        total = items,
+        skip = 0,
+        limit = items,
+    )
+
+
+def user_list(items: int) -> UserListResponse:
+    """
+    /v1/admin/users page
+    """
+    users = [
+        UserResponse(
+            id = uuid4(),
+            created_at = datetime.now(UTC),
+            email = f"user{i}@example.com",
+            full_name = f"User {i}",
+            is_active = True,
+            is_verified = i % 2 == 0,
+            role = UserRole.USER,
+        ) for i in range(items)
+    ]
+    return UserListResponse(
+        items = users,
+        total = items,
+        page = 1,
+        size = items,
+    )
+
+
+PAYLOADS: dict[str, Callable[[int], BaseModel]] = {
+    "projects": project_list,
+    "users": user_list,
+}
+
+
+def add_routes(app: FastAPI, name: str, payload: BaseModel) -> None:
+    """
+    The three variants of one endpoint
+    """
+    body = to_json(payload)
+    model = type(payload)
+
+    async def stock() -> BaseModel:
+        return payload
+
+    async def fast() -> Response:
+        return FastJSONResponse(payload)
+
+    async def cached() -> Response:
+        return Response(content = body, media_type = "application/json")
+
+    app.get(f"/stock/{name}", response_model = model)(stock)
+    app.get(f"/fast/{name}", response_model = model)(fast)
+    app.get(f"/cached/{name}", response_model = model)(cached)
+
+
+def build_app(items: int) -> FastAPI:
+    """
+    Every payload with every variant, stock FastAPI defaults otherwise
+    """
+    app = FastAPI(default_response_class = JSONResponse)
+    for name, build in PAYLOADS.items():
+        add_routes(app, name, build(items))
+    return app
+
+
+async def measure(client: AsyncClient, url: str, requests: int) -> float:
+    """
+    Milliseconds of process CPU time per request
+    """
+    (await client.get(url)).raise_for_status()
+    start = time.process_time()
+    for _ in range(requests):
+        (await client.get(url)).raise_for_status()
+    return (time.process_time() - start) * 1000 / requests
+
+
+async def run(items: int, requests: int) -> None:
+    """
+    Benchmark every payload and variant and print the results
+    """
+    app = build_app(items)
+    transport = ASGITransport(app = app)
+    async with AsyncClient(transport = transport,
+                           base_url = "http://bench") as client:
+        print(f"{'endpoint':>10}  " + "  ".join(f"{v:>9}" for v in VARIANTS))
+        for name in PAYLOADS:
+            times = {
+                variant: await measure(client,
+                                       f"/{variant}/{name}",
+                                       requests)
+                for variant in VARIANTS
+            }
+            print(
+                f"{name:>10}  " +
+                "  ".join(f"{times[v]:6.2f} ms" for v in VARIANTS) +
+                f"  fast {times['stock'] / times['fast']:.1f}x"
+            )
+
+
+def main() -> None:
+    """
+    Parse arguments and run the benchmark
+    """
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--items", type = int, default = 100)
+    parser.add_argument("--requests", type = int, default = 500)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent / "app"))
 
 import hashlib
 import secrets
+from contextlib import asynccontextmanager
 from datetime import (
     UTC,
     date,
@@ -37,10 +38,14 @@ from core.security import (
     create_access_token,
 )
 from config import UserRole
-from core.database import get_db_session
+from core.database import (
+    get_db_session,
+    get_session_factory,
+)
 
 from core.Base import Base
 from user.User import User
+from auth.MaintenanceRun import MaintenanceRun  # noqa: F401
 from auth.RefreshToken import RefreshToken
 from project.Project import Project
 from experience.Experience import Experience
@@ -87,7 +92,12 @@ async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:
     async def override_get_db():
         yield db_session
 
+    @asynccontextmanager
+    async def test_session():
+        yield db_session
+
     app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: test_session
 
     async with AsyncClient(
             transport = ASGITransport(app = app),
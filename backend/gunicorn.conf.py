@@ -0,0 +1,22 @@
+"""
+ⒸAngelaMos | 2025
+gunicorn.conf.py
+
+Server hooks, the command line in the production image sets the rest
+"""
+
+from typing import Any
+
+from config import settings
+from core.metrics import metricsexporter
+
+
+def child_exit(_server: Any, worker: Any) -> None:
+    """
+    Fold the metrics snapshot of an exited worker into the retained totals
+    """
+    if settings.METRICS_MULTIPROC_DIR is not None:
+        metricsexporter.mark_process_dead(
+            worker.pid,
+            settings.METRICS_MULTIPROC_DIR,
+        )
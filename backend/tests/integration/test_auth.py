@@ -3,11 +3,32 @@
 test_auth.py
 """
 
+import asyncio
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from user.User import User
 from auth.RefreshToken import RefreshToken
+from auth.maintenance import (
+    CleanupResult,
+    TokenCleanupTask,
+)
+from auth.repository import RefreshTokenRepository
+from auth.service import AuthService
+from core.database import sessionmanager
+from core.exceptions import TokenError
+from conftest import (
+    TEST_DATABASE_URL,
+    RefreshTokenFactory,
+)
 
 
 URL_LOGIN = "/v1/auth/login"
@@ -158,6 +179,35 @@ async def test_refresh_token_revoked(
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_refresh_token_of_inactive_user(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    inactive_user: User,
+):
+    """
+    A deactivated user is refused without revoking the token family
+    """
+    token, raw_token = await RefreshTokenFactory.create(
+        db_session,
+        inactive_user,
+    )
+    token_id = token.id
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": raw_token},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found or inactive"
+    db_session.expire_all()
+    revoked = await db_session.execute(
+        select(RefreshToken.is_revoked).where(RefreshToken.id == token_id)
+    )
+    assert revoked.scalar_one() is False
+
+
 @pytest.mark.asyncio
 async def test_logout_success(
     client: AsyncClient,
@@ -280,3 +330,93 @@ async def test_change_password_wrong_current(
     )
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_expired_and_old_revoked_tokens(
+    db_session: AsyncSession,
+    refresh_token_pair: tuple[RefreshToken,
+                              str],
+    expired_refresh_token_pair: tuple[RefreshToken,
+                                      str],
+    revoked_refresh_token_pair: tuple[RefreshToken,
+                                      str],
+):
+    """
+    Batched cleanup removes dead tokens and keeps active ones
+    """
+    active_id = refresh_token_pair[0].id
+    revoked, _ = revoked_refresh_token_pair
+    revoked.revoked_at = datetime.now(UTC) - timedelta(days = 60)
+    await db_session.flush()
+
+    assert await RefreshTokenRepository.cleanup_expired(db_session, 1) == 1
+    assert await RefreshTokenRepository.cleanup_expired(db_session, 1) == 0
+    assert await RefreshTokenRepository.cleanup_revoked(
+        db_session,
+        datetime.now(UTC) - timedelta(days = 30),
+        10,
+    ) == 1
+
+    db_session.expire_all()
+    remaining = await db_session.execute(select(RefreshToken.id))
+    assert list(remaining.scalars()) == [active_id]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_runs_once_per_interval(
+    db_session: AsyncSession,
+    expired_refresh_token_pair: tuple[RefreshToken,
+                                      str],
+):
+    """
+    A second worker checking within the interval skips the purge
+    """
+    await db_session.commit()
+    sessionmanager.init(TEST_DATABASE_URL)
+    try:
+        first = await TokenCleanupTask().run_if_due()
+        second = await TokenCleanupTask().run_if_due()
+    finally:
+        await sessionmanager.close()
+
+    assert first == CleanupResult(expired = 1, revoked = 0)
+    assert second is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_with_same_token_succeeds_once(
+    db_session: AsyncSession,
+    refresh_token_pair: tuple[RefreshToken,
+                              str],
+):
+    """
+    Two rotations racing on one token yield exactly one successor
+    """
+    _, raw_token = refresh_token_pair
+    await db_session.commit()
+
+    async def rotate() -> str:
+        async with AsyncSession(db_session.bind) as session:
+            try:
+                _, new_token = await AuthService(session).refresh_tokens(
+                    raw_token
+                )
+            except TokenError:
+                await session.rollback()
+                raise
+            await session.commit()
+            return new_token
+
+    results = await asyncio.gather(
+        rotate(),
+        rotate(),
+        return_exceptions = True,
+    )
+
+    assert sum(isinstance(r, str) for r in results) == 1
+    assert sum(isinstance(r, TokenError) for r in results) == 1
+
+    db_session.expire_all()
+    tokens = await db_session.execute(select(RefreshToken))
+    assert len(tokens.scalars().all()) == 2
@@ -9,6 +9,7 @@ from httpx import AsyncClient
 
 URL_HEALTH = "/health"
 URL_HEALTH_DETAILED = "/health/detailed"
+URL_METRICS = "/metrics"
 
 
 @pytest.mark.asyncio
@@ -38,3 +39,34 @@ async def test_health_detailed(client: AsyncClient):
     assert "database" in data
     assert "environment" in data
     assert "version" in data
+
+
+@pytest.mark.asyncio
+async def test_metrics_labels_route_templates(client: AsyncClient):
+    """
+    Prometheus exposition labels requests by route template, not URL
+    """
+    await client.get("/v1/projects/missing-slug", params = {"lang": "en"})
+
+    response = await client.get(URL_METRICS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/v1/projects/{slug}"' in response.text
+    assert "missing-slug" not in response.text
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+@pytest.mark.asyncio
+async def test_response_headers_from_asgi_middleware(client: AsyncClient):
+    """
+    Correlation ID is echoed and database timing is reported
+    """
+    response = await client.get(
+        URL_HEALTH,
+        headers = {"X-Correlation-ID": "trace-123"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Correlation-ID"] == "trace-123"
+    assert response.headers["Server-Timing"].startswith("db;dur=")
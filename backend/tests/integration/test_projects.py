@@ -5,7 +5,9 @@ test_projects.py
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from conftest import ProjectFactory
 from project.Project import Project
 
 
@@ -127,3 +129,69 @@ async def test_get_project_by_slug_not_found(client: AsyncClient):
     response = await client.get(f"{URL_PROJECTS}/non-existent-slug")
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_projects_cursor_pages(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    next_cursor walks the list in (display_order, id) order without gaps
+    """
+    projects = [await ProjectFactory.create(db_session) for _ in range(3)]
+
+    first = await client.get(f"{URL_PROJECTS}?limit=2")
+    assert first.status_code == 200
+    first_data = first.json()
+    assert first_data["total"] == 3
+    assert first_data["next_cursor"] is not None
+
+    second = await client.get(
+        URL_PROJECTS,
+        params = {
+            "limit": 2,
+            "cursor": first_data["next_cursor"],
+        },
+    )
+    assert second.status_code == 200
+    second_data = second.json()
+    assert second_data["total"] == 3
+    assert second_data["next_cursor"] is None
+
+    slugs = [p["slug"] for p in first_data["items"] + second_data["items"]]
+    assert slugs == [p.slug for p in projects]
+
+
+@pytest.mark.asyncio
+async def test_list_projects_invalid_cursor(client: AsyncClient):
+    """
+    A cursor that does not decode is rejected
+    """
+    response = await client.get(URL_PROJECTS, params = {"cursor": "bogus"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_projects_conditional_get(
+    client: AsyncClient,
+    test_project: Project
+):
+    """
+    Repeating a request with its ETag returns 304 without a body
+    """
+    response = await client.get(URL_PROJECTS)
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert "stale-while-revalidate" in response.headers["cache-control"]
+
+    revalidated = await client.get(
+        URL_PROJECTS,
+        headers = {"If-None-Match": etag},
+    )
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
@@ -0,0 +1,159 @@
+"""
+©AngelaMos | 2025
+test_query_counts.py
+"""
+
+import re
+
+import pytest
+from httpx import (
+    AsyncClient,
+    Response,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.RefreshToken import RefreshToken
+from project.Project import Project
+from core.instrumentation import instrument_engine
+from user.User import User
+
+
+URL_USERS = "/v1/users"
+URL_LOGIN = "/v1/auth/login"
+URL_REFRESH = "/v1/auth/refresh"
+URL_PROJECTS = "/v1/projects"
+URL_PROJECTS_NAV = "/v1/projects/nav"
+
+
+def query_count(response: Response) -> int:
+    """
+    Queries a request issued, from its Server-Timing header
+    """
+    server_timing = response.headers["Server-Timing"]
+    match = re.search(r'desc="(\d+) queries"', server_timing)
+    assert match is not None
+    return int(match.group(1))
+
+
+@pytest.fixture
+def counted(db_session: AsyncSession) -> AsyncSession:
+    """
+    Count the statements run on the test engine
+    """
+    instrument_engine(db_session.bind.sync_engine)
+    return db_session
+
+
+@pytest.mark.asyncio
+async def test_registration_is_two_queries(
+    client: AsyncClient,
+    counted: AsyncSession,
+):
+    """
+    Email check and one INSERT ... RETURNING, no refresh SELECT
+    """
+    response = await client.post(
+        URL_USERS,
+        json = {
+            "email": "counted@test.com",
+            "password": "ValidPass123",
+            "full_name": "Counted User",
+        },
+    )
+
+    assert response.status_code == 201
+    assert query_count(response) == 2
+
+
+@pytest.mark.asyncio
+async def test_login_is_two_queries(
+    client: AsyncClient,
+    counted: AsyncSession,
+    test_user: User,
+):
+    """
+    User lookup and the refresh token INSERT
+    """
+    response = await client.post(
+        URL_LOGIN,
+        data = {
+            "username": test_user.email,
+            "password": "TestPass123",
+        },
+    )
+
+    assert response.status_code == 200
+    assert query_count(response) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_one_query(
+    client: AsyncClient,
+    counted: AsyncSession,
+    refresh_token_pair: tuple[RefreshToken,
+                              str],
+):
+    """
+    Rotation is a single statement
+    """
+    _, raw_token = refresh_token_pair
+
+    response = await client.post(
+        URL_REFRESH,
+        cookies = {"refresh_token": raw_token},
+    )
+
+    assert response.status_code == 200
+    assert query_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_project_list_is_one_query(
+    client: AsyncClient,
+    counted: AsyncSession,
+    test_project: Project,
+):
+    """
+    Page and total come back together via count(*) OVER ()
+    """
+    response = await client.get(URL_PROJECTS)
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert query_count(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_project_list_past_last_page_keeps_total(
+    client: AsyncClient,
+    counted: AsyncSession,
+    test_project: Project,
+):
+    """
+    An empty page past the end falls back to a plain count
+    """
+    response = await client.get(f"{URL_PROJECTS}?skip=10")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 1
+    assert query_count(response) == 2
+
+
+@pytest.mark.asyncio
+async def test_project_nav_is_one_query(
+    client: AsyncClient,
+    counted: AsyncSession,
+    test_project: Project,
+):
+    """
+    Nav columns and the total from one projected SELECT
+    """
+    response = await client.get(URL_PROJECTS_NAV)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["items"][0]["slug"] == test_project.slug
+    assert query_count(response) == 1
@@ -0,0 +1,190 @@
+"""
+©AngelaMos | 2025
+test_search.py
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Language
+from conftest import (
+    CertificationFactory,
+    ProjectFactory,
+)
+from search.suggest import suggestindex
+
+
+URL_SEARCH = "/v1/search"
+URL_SUGGEST = "/v1/search/suggest"
+
+
+@pytest.mark.asyncio
+async def test_search_matches_project_title(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Search finds projects through the stored search vector
+    """
+    await ProjectFactory.create(
+        db_session,
+        title = "Kubernetes Operator",
+        description = "Reconciles custom resources",
+    )
+    await ProjectFactory.create(db_session, title = "Unrelated Thing")
+
+    response = await client.get(URL_SEARCH, params = {"q": "kubernetes"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["results"][0]["title"] == "Kubernetes Operator"
+    assert data["results"][0]["type"] == "project"
+
+
+@pytest.mark.asyncio
+async def test_search_limits_before_highlighting(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Only the requested page is returned, excerpts can be switched off
+    """
+    for _ in range(3):
+        await ProjectFactory.create(
+            db_session,
+            description = "Terraform modules for observability",
+        )
+
+    highlighted = await client.get(
+        URL_SEARCH,
+        params = {"q": "terraform",
+                  "limit": 2},
+    )
+    plain = await client.get(
+        URL_SEARCH,
+        params = {"q": "terraform",
+                  "limit": 2,
+                  "highlight": "false"},
+    )
+
+    assert highlighted.json()["total"] == 2
+    assert all(
+        "<mark>" in item["excerpt"]
+        for item in highlighted.json()["results"]
+    )
+    assert plain.json()["total"] == 2
+    assert all(item["excerpt"] is None for item in plain.json()["results"])
+
+
+@pytest.mark.asyncio
+async def test_search_stems_query_terms(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Stemmed query terms match inflected document terms
+    """
+    await CertificationFactory.create(
+        db_session,
+        name = "Networking Fundamentals",
+    )
+
+    response = await client.get(URL_SEARCH, params = {"q": "network"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["results"][0]["type"] == "certification"
+
+
+@pytest.mark.asyncio
+async def test_search_uses_language_stemmer(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Spanish content is stemmed with the Spanish configuration
+    """
+    await ProjectFactory.create(
+        db_session,
+        language = Language.SPANISH,
+        title = "Aplicaciones distribuidas",
+    )
+
+    response = await client.get(
+        URL_SEARCH,
+        params = {"q": "aplicación",
+                  "lang": "es"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_trigram_language(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Languages without a stemmer match substrings through trigrams
+    """
+    await ProjectFactory.create(
+        db_session,
+        language = Language.MANDARIN,
+        title = "分布式任务调度系统",
+    )
+
+    response = await client.get(
+        URL_SEARCH,
+        params = {"q": "任务调度",
+                  "lang": "zh"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["results"][0]["type"] == "project"
+
+
+@pytest.mark.asyncio
+async def test_search_no_results(client: AsyncClient):
+    """
+    Search with no matches returns an empty result list
+    """
+    response = await client.get(URL_SEARCH, params = {"q": "nothing"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 0
+    assert data["results"] == []
+
+
+@pytest.mark.asyncio
+async def test_suggest_serves_prefixes_from_index(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """
+    Suggest answers from the in memory index built from content
+    """
+    await ProjectFactory.create(
+        db_session,
+        title = "Kubernetes Operator",
+        tech_stack = ["Go", "Kubebuilder"],
+    )
+    await suggestindex.rebuild(db_session)
+
+    try:
+        response = await client.get(URL_SUGGEST, params = {"q": "kube"})
+    finally:
+        suggestindex.load([])
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {item["text"] for item in data["suggestions"]} == {
+        "Kubernetes Operator",
+        "Kubebuilder",
+    }
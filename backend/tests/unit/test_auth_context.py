@@ -0,0 +1,68 @@
+"""
+©AngelaMos | 2025
+test_auth_context.py
+"""
+
+from uuid import uuid4
+
+import jwt
+from starlette.requests import Request
+
+from config import settings
+from core.auth_context import (
+    ANONYMOUS,
+    authenticate,
+)
+from core.rate_limit import get_identifier
+from core.security import create_access_token
+
+
+def make_request(authorization: str | None) -> Request:
+    headers = []
+    if authorization is not None:
+        headers.append((b"authorization", authorization.encode()))
+    return Request(
+        {
+            "type": "http",
+            "headers": headers,
+            "client": ("203.0.113.7", 4321),
+        }
+    )
+
+
+def test_authenticate_verifies_access_tokens():
+    """
+    Valid access tokens expose their subject, missing headers are anonymous
+    """
+    user_id = uuid4()
+    context = authenticate(f"Bearer {create_access_token(user_id, 0)}")
+
+    assert context.subject == str(user_id)
+    assert context.error is None
+    assert authenticate(None) is ANONYMOUS
+
+
+def test_forged_subject_falls_back_to_client_address():
+    """
+    A token signed with another key never selects a user bucket
+    """
+    forged = jwt.encode(
+        {"sub": str(uuid4()), "type": "access", "token_version": 0},
+        "not-the-secret-key-not-the-secret-key",
+        algorithm = settings.JWT_ALGORITHM,
+    )
+    request = make_request(f"Bearer {forged}")
+
+    assert get_identifier(request) == "203.0.113.7"
+    assert request.state.auth.subject is None
+    assert request.state.auth.error is not None
+
+
+def test_rate_limit_key_uses_verified_subject():
+    """
+    Authenticated requests are limited per user
+    """
+    user_id = uuid4()
+    request = make_request(f"Bearer {create_access_token(user_id, 0)}")
+
+    assert get_identifier(request) == f"user:{user_id}"
@@ -0,0 +1,313 @@
+"""
+©AngelaMos | 2025
+test_cache.py
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+import config
+from config import Language
+from core import cache as cache_module
+from core.cache import (
+    LocalCache,
+    ResponseCache,
+    cached_response,
+    etag_matches,
+    make_etag,
+)
+from project.schemas import ProjectNavResponse
+
+
+@asynccontextmanager
+async def fake_session() -> AsyncIterator[object]:
+    """
+    Stand in for a session of the factory, the loaders here never query
+    """
+    yield object()
+
+
+def test_build_key_is_namespaced_and_versioned():
+    """
+    Keys carry prefix, version, namespace and enum values
+    """
+    key = ResponseCache.build_key(
+        config.CACHE_NS_PROJECTS,
+        "list",
+        Language.SPANISH,
+        0,
+        100,
+    )
+
+    assert key == (
+        f"{config.CACHE_PREFIX}:{config.CACHE_VERSION}:"
+        f"{config.CACHE_NS_PROJECTS}:list:es:0:100"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_without_redis_serializes_loader_result():
+    """
+    Unconfigured cache falls through to the loader and returns JSON bytes
+    """
+    cache = ResponseCache()
+    calls = 0
+
+    async def loader(_db: object) -> ProjectNavResponse:
+        nonlocal calls
+        calls += 1
+        return ProjectNavResponse(items = [], total = 0)
+
+    body = await cache.get_or_set(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("nav", Language.ENGLISH),
+        loader,
+        fake_session,
+    )
+
+    assert calls == 1
+    assert json.loads(body) == {"items": [], "total": 0}
+
+
+@pytest.mark.asyncio
+async def test_current_key_carries_snapshot_version(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Keys of a worker serving a snapshot name its version after the
+    generation, so stale snapshots never fill fresh keys
+    """
+    cache = ResponseCache()
+
+    async def generation(_namespace: str) -> int:
+        return 3
+
+    monkeypatch.setattr(cache, "generation", generation)
+    plain = await cache.current_key(config.CACHE_NS_PROJECTS, ("nav", ))
+    cache.content_version = "abc"
+    versioned = await cache.current_key(config.CACHE_NS_PROJECTS, ("nav", ))
+
+    assert plain == ResponseCache.build_key(
+        config.CACHE_NS_PROJECTS,
+        "g3",
+        "nav",
+    )
+    assert versioned == ResponseCache.build_key(
+        config.CACHE_NS_PROJECTS,
+        "g3",
+        "sabc",
+        "nav",
+    )
+
+
+class CounterRedis:
+    """
+    In memory stand in for the Redis commands behind generation counters
+    """
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: int, nx: bool = False) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = int(value)
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest.mark.asyncio
+async def test_generation_does_not_restart_after_flush():
+    """
+    Keys and so ETags handed out before Redis lost its counters never
+    come back once the counters are gone
+    """
+    cache = ResponseCache()
+    redis = CounterRedis()
+    cache._client = redis  # type: ignore[assignment]
+    namespace = config.CACHE_NS_PROJECTS
+
+    before = await cache.current_key(namespace, ("nav", ))
+    await cache.bump_generation(namespace)
+    bumped = await cache.current_key(namespace, ("nav", ))
+    redis.values.clear()
+    await cache.bump_generation(namespace)
+    flushed = await cache.current_key(namespace, ("nav", ))
+
+    assert len({before, bumped, flushed}) == 3
+    assert await cache.generations([namespace]) == (
+        await cache.generation(namespace),
+    )
+    assert make_etag(flushed.encode()) not in {
+        make_etag(before.encode()),
+        make_etag(bumped.encode()),
+    }
+
+
+def test_local_cache_evicts_least_recently_used():
+    """
+    A full local cache drops the entry touched longest ago
+    """
+    cache: LocalCache[int] = LocalCache(maxsize = 2, ttl = 60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_local_cache_expires_entries():
+    """
+    Entries past their TTL are treated as misses
+    """
+    cache: LocalCache[int] = LocalCache(maxsize = 2, ttl = 0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    """
+    If-None-Match matches any listed tag, weak or strong, or *
+    """
+    etag = make_etag(b"payload")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+@pytest.mark.asyncio
+async def test_cached_response_not_modified_skips_loader(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    A matching ETag is answered from the generation key alone
+    """
+    key = "portfolio:v1:projects:g3:nav:en"
+    calls = 0
+
+    async def current_key(*_: object) -> str:
+        return key
+
+    async def loader(_db: object) -> ProjectNavResponse:
+        nonlocal calls
+        calls += 1
+        return ProjectNavResponse(items = [], total = 0)
+
+    monkeypatch.setattr(
+        cache_module.responsecache,
+        "current_key",
+        current_key,
+    )
+    response = await cached_response(
+        config.CACHE_NS_PROJECTS,
+        config.CACHE_TTL_PROJECTS,
+        ("nav", Language.ENGLISH),
+        loader,
+        fake_session,
+        make_etag(key.encode()),
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == make_etag(key.encode())
+    assert response.headers["surrogate-key"] == config.CACHE_NS_PROJECTS
+    assert calls == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_run_loader_once():
+    """
+    Requests missing the same key together share a single fill
+    """
+    cache = ResponseCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def loader(_db: object) -> ProjectNavResponse:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return ProjectNavResponse(items = [], total = 0)
+
+    requests = [
+        asyncio.create_task(
+            cache.get_or_load(
+                "portfolio:v1:projects:g0:nav:en",
+                config.CACHE_TTL_PROJECTS,
+                loader,
+                fake_session,
+            )
+        ) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    bodies = await asyncio.gather(*requests)
+
+    assert calls == 1
+    assert len(set(bodies)) == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_fill_keeps_its_own_session_after_first_request_cancels():
+    """
+    The shared fill loads through a session it opened itself, which stays
+    open until the fill is done even when its first request went away
+    """
+    cache = ResponseCache()
+    release = asyncio.Event()
+    open_sessions: list[object] = []
+    loaded_with: list[object] = []
+
+    @asynccontextmanager
+    async def sessions() -> AsyncIterator[object]:
+        session = object()
+        open_sessions.append(session)
+        try:
+            yield session
+        finally:
+            open_sessions.remove(session)
+
+    async def loader(db: object) -> ProjectNavResponse:
+        await release.wait()
+        assert db in open_sessions
+        loaded_with.append(db)
+        return ProjectNavResponse(items = [], total = 0)
+
+    key = "portfolio:v1:projects:g0:nav:en"
+    first = asyncio.create_task(
+        cache.get_or_load(key, config.CACHE_TTL_PROJECTS, loader, sessions)
+    )
+    second = asyncio.create_task(
+        cache.get_or_load(key, config.CACHE_TTL_PROJECTS, loader, sessions)
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    body = await second
+
+    assert json.loads(body) == {"items": [], "total": 0}
+    assert len(loaded_with) == 1
+    assert open_sessions == []
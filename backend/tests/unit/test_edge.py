@@ -0,0 +1,73 @@
+"""
+©AngelaMos | 2025
+test_edge.py
+"""
+
+import httpx
+import pytest
+
+import config
+from core.edge import (
+    EdgePurger,
+    surrogate_keys,
+)
+from core.events import (
+    ContentChanged,
+    eventbus,
+)
+
+
+PURGE_URL = "http://nginx:8081/purge"
+
+
+def test_content_change_also_purges_search():
+    """
+    Search results embed content, so they are purged with it
+    """
+    assert surrogate_keys(config.CACHE_NS_BLOGS) == (
+        config.CACHE_NS_BLOGS,
+        config.CACHE_NS_SEARCH,
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_content_change_posts_purge():
+    """
+    Local changes purge their keys, relayed remote ones are left alone
+    """
+    purged: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        purged.append(request.headers["surrogate-key"])
+        return httpx.Response(204)
+
+    purger = EdgePurger()
+    purger.init(PURGE_URL, transport = httpx.MockTransport(handler))
+    try:
+        await eventbus.publish(
+            ContentChanged(namespace = config.CACHE_NS_PROJECTS),
+            ContentChanged(
+                namespace = config.CACHE_NS_BLOGS,
+                remote = True,
+            ),
+        )
+    finally:
+        await purger.close()
+
+    assert purged == [f"{config.CACHE_NS_PROJECTS} {config.CACHE_NS_SEARCH}"]
+
+
+@pytest.mark.asyncio
+async def test_failed_purge_is_swallowed():
+    """
+    An unreachable edge never fails the write that changed content
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request = request)
+
+    purger = EdgePurger()
+    purger.init(PURGE_URL, transport = httpx.MockTransport(handler))
+    try:
+        await purger.purge(config.CACHE_NS_PROJECTS)
+    finally:
+        await purger.close()
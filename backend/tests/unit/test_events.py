@@ -0,0 +1,58 @@
+"""
+©AngelaMos | 2025
+test_events.py
+"""
+
+import pytest
+
+import config
+from core.events import (
+    ContentChanged,
+    EventBus,
+)
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_later_handlers():
+    """
+    A broken subscriber is logged and the remaining ones still run
+    """
+    bus = EventBus()
+    delivered: list[ContentChanged] = []
+
+    async def broken(event: ContentChanged) -> None:
+        raise RuntimeError(event.namespace)
+
+    async def working(event: ContentChanged) -> None:
+        delivered.append(event)
+
+    bus.subscribe(ContentChanged, broken)
+    bus.subscribe(ContentChanged, working)
+    event = ContentChanged(namespace = config.CACHE_NS_PROJECTS)
+
+    await bus.publish(event)
+
+    assert delivered == [event]
+
+
+@pytest.mark.asyncio
+async def test_remote_subscribers_are_tracked():
+    """
+    Only handlers subscribed as remote ask for relayed events
+    """
+    bus = EventBus()
+
+    async def local(_event: ContentChanged) -> None:
+        return None
+
+    async def per_process(_event: ContentChanged) -> None:
+        return None
+
+    bus.subscribe(ContentChanged, local)
+    assert not bus.has_remote_subscribers(ContentChanged)
+
+    bus.subscribe(ContentChanged, per_process, remote = True)
+    assert bus.has_remote_subscribers(ContentChanged)
+
+    bus.unsubscribe(ContentChanged, per_process)
+    assert not bus.has_remote_subscribers(ContentChanged)
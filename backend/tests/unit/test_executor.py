@@ -0,0 +1,39 @@
+"""
+©AngelaMos | 2025
+test_executor.py
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from core.exceptions import ServiceBusy
+from core.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_rejects_when_queue_is_full():
+    """
+    Jobs beyond workers + queue size fail fast with ServiceBusy
+    """
+    executor = BoundedExecutor(workers = 1, queue_size = 1, retry_after = 3)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        queued = asyncio.ensure_future(executor.run(sum, [1, 2]))
+        await asyncio.sleep(0)
+        assert executor.pending == 2
+
+        with pytest.raises(ServiceBusy) as busy:
+            await executor.run(sum, [3])
+        assert busy.value.status_code == 503
+        assert busy.value.retry_after == 3
+
+        release.set()
+        assert await running is True
+        assert await queued == 3
+        assert executor.pending == 0
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,93 @@
+"""
+©AngelaMos | 2025
+test_importtime.py
+
+Cold start cost of importing the application, as a worker pays it on
+every boot and every --max-requests recycle
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+APP_DIR = Path(__file__).parent.parent.parent / "app"
+
+COLD_IMPORT_BUDGET_SECONDS = 3.0
+REPORT_SLOWEST = 15
+
+COUNT_ARGON2_HASHES = """
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+calls = []
+original = Argon2Hasher.hash
+
+
+def counting(self, *args, **kwargs):
+    calls.append(1)
+    return original(self, *args, **kwargs)
+
+
+Argon2Hasher.hash = counting
+import factory
+print(len(calls))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """
+    Fresh interpreter in the app directory, nothing imported yet
+    """
+    # Runs this interpreter on fixed arguments, no untrusted input
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        cwd = APP_DIR,
+        env = {
+            **os.environ,
+            "PYTHONDONTWRITEBYTECODE": "1",
+        },
+        capture_output = True,
+        text = True,
+        check = True,
+    )
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    """
+    (self us, cumulative us, module) rows of python -X importtime
+    """
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:"
+                                                         ).split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def test_app_import_within_budget():
+    """
+    Importing the app stays under the cold start budget
+    """
+    rows = import_times("factory")
+    total = sum(self_us for self_us, _, _ in rows) / 1_000_000
+
+    slowest = sorted(rows, reverse = True)[:REPORT_SLOWEST]
+    report = "\n".join(
+        f"{self_us / 1000:8.1f} ms  {name}" for self_us, _, name in slowest
+    )
+    assert total < COLD_IMPORT_BUDGET_SECONDS, (
+        f"import took {total:.2f}s, slowest modules by self time:\n{report}"
+    )
+
+
+def test_app_import_hashes_no_passwords():
+    """
+    The dummy hash is computed on first use, never at import
+    """
+    result = run_python("-c", COUNT_ARGON2_HASHES)
+
+    assert result.stdout.strip() == "0"
@@ -0,0 +1,38 @@
+"""
+©AngelaMos | 2025
+test_instrumentation.py
+"""
+
+from sqlalchemy import (
+    create_engine,
+    text,
+)
+
+from core.instrumentation import (
+    instrument_engine,
+    track_queries,
+)
+
+
+def test_engine_hooks_count_queries_of_current_request():
+    """
+    Every statement run after track_queries lands in its stats
+    """
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    stats = track_queries()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert stats.count == 2
+    assert stats.duration_ms > 0
+    assert stats.server_timing().endswith('desc="2 queries"')
+
+    fresh = track_queries()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 3"))
+
+    assert fresh.count == 1
+    assert stats.count == 2
@@ -0,0 +1,112 @@
+"""
+©AngelaMos | 2025
+test_metrics.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.metrics import (
+    RETAINED_SNAPSHOT,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsExporter,
+    MetricsRegistry,
+)
+
+
+def test_render_merges_processes_and_drops_dead_gauges():
+    """
+    Counters and histograms sum every snapshot, gauges only live ones
+    """
+    registry = MetricsRegistry()
+    requests = registry.register(
+        Counter("requests_total", "Requests", ("route", ))
+    )
+    in_flight = registry.register(Gauge("in_flight", "In flight"))
+    latency = registry.register(
+        Histogram("latency_seconds", "Latency", buckets = (0.1, 1.0))
+    )
+
+    requests.inc("/v1/projects/{slug}")
+    in_flight.inc()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    own = registry.snapshot()
+
+    text = registry.render([own, own], [own])
+
+    assert 'requests_total{route="/v1/projects/{slug}"} 2' in text
+    assert "in_flight 1" in text
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+    assert "# TYPE latency_seconds histogram" in text
+
+
+def worker_registry() -> tuple[MetricsRegistry, Counter, Gauge]:
+    registry = MetricsRegistry()
+    requests = registry.register(Counter("requests_total", "Requests"))
+    in_flight = registry.register(Gauge("in_flight", "In flight"))
+    return registry, requests, in_flight
+
+
+def write_worker_snapshot(directory: Path, pid: int, requests: int) -> None:
+    registry, counter, gauge = worker_registry()
+    counter.inc(amount = requests)
+    gauge.inc()
+    (directory / f"{pid}.json").write_text(json.dumps(registry.snapshot()))
+
+
+def exited_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+@pytest.mark.asyncio
+async def test_exited_worker_is_retired_into_retained_totals(tmp_path: Path):
+    """
+    An exited worker's file is removed, its counters live on and its
+    gauges stop counting
+    """
+    pid = exited_pid()
+    write_worker_snapshot(tmp_path, pid, 2)
+    registry, requests, _ = worker_registry()
+    requests.inc()
+    exporter = MetricsExporter(registry)
+
+    exporter.mark_process_dead(pid, tmp_path)
+    exporter.init(tmp_path)
+    text = exporter.exposition()
+    await exporter.close()
+
+    assert not (tmp_path / f"{pid}.json").exists()
+    assert (tmp_path / RETAINED_SNAPSHOT).exists()
+    assert "requests_total 3" in text
+    assert "in_flight 1" not in text
+
+
+@pytest.mark.asyncio
+async def test_reused_pid_keeps_totals_of_previous_worker(tmp_path: Path):
+    """
+    A file left under this worker's pid by an earlier worker is retired
+    before this one overwrites it
+    """
+    write_worker_snapshot(tmp_path, os.getpid(), 5)
+    registry, requests, _ = worker_registry()
+    requests.inc()
+    exporter = MetricsExporter(registry)
+
+    exporter.init(tmp_path)
+    exporter.flush()
+    text = exporter.exposition()
+    await exporter.close()
+
+    assert "requests_total 6" in text
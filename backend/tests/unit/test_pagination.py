@@ -0,0 +1,46 @@
+"""
+©AngelaMos | 2025
+test_pagination.py
+"""
+
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+import pytest
+
+from core.exceptions import InvalidCursor
+from core.pagination import (
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    """
+    Values come back with their column types
+    """
+    key = (3, uuid4())
+
+    cursor = encode_cursor(key)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, (int, UUID)) == key
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "bogus",
+        encode_cursor([1]),
+        encode_cursor(["x", str(uuid4())]),
+        encode_cursor([1, "not-a-uuid"]),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor: str):
+    """
+    Anything that is not a well typed key raises InvalidCursor
+    """
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, (int, UUID))
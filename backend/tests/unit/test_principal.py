@@ -0,0 +1,100 @@
+"""
+©AngelaMos | 2025
+test_principal.py
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from config import UserRole
+from core.cache import ResponseCache
+from core.events import (
+    eventbus,
+    pending_events,
+    record_event,
+)
+from core.principal import (
+    Principal,
+    PrincipalCache,
+    UserChanged,
+    decode_principal,
+    encode_principal,
+)
+
+
+def make_principal(**overrides) -> Principal:
+    values = {
+        "id": uuid4(),
+        "role": UserRole.USER,
+        "is_active": True,
+        "token_version": 0,
+    }
+    values.update(overrides)
+    return Principal(**values)
+
+
+def test_principal_round_trips_through_redis_payload():
+    """
+    Encoded principals decode unchanged, tombstones decode to None
+    """
+    principal = make_principal(role = UserRole.ADMIN, token_version = 3)
+
+    assert decode_principal(
+        principal.id,
+        encode_principal(principal),
+    ) == principal
+    assert decode_principal(principal.id, encode_principal(None)) is None
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_serves_hits_and_follows_changes():
+    """
+    Lookups after the first skip the loader until the user changes
+    """
+    cache = PrincipalCache(ResponseCache())
+    principal = make_principal()
+    loads = []
+
+    async def load() -> Principal | None:
+        loads.append(principal.id)
+        return principal
+
+    assert await cache.get_or_load(principal.id, load) == principal
+    assert len(loads) == 1
+
+    cache.init()
+    try:
+        await cache.get_or_load(principal.id, load)
+        assert await cache.get_or_load(principal.id, load) == principal
+        assert len(loads) == 2
+
+        revoked = make_principal(id = principal.id, token_version = 1)
+        await eventbus.publish(UserChanged(principal.id, revoked))
+        assert await cache.get_or_load(principal.id, load) == revoked
+        assert len(loads) == 2
+
+        await eventbus.publish(UserChanged(principal.id, None))
+        await cache.get_or_load(principal.id, load)
+        assert len(loads) == 3
+    finally:
+        cache.close()
+
+
+def test_pending_events_keep_the_last_state_of_a_user():
+    """
+    Repeated events are delivered at their last position
+    """
+    session = SimpleNamespace(info = {})
+    before = make_principal()
+    after = make_principal(id = before.id, is_active = False)
+
+    record_event(session, UserChanged(before.id, before))
+    record_event(session, UserChanged(before.id, after))
+    record_event(session, UserChanged(before.id, before))
+
+    assert pending_events(session) == [
+        UserChanged(before.id, after),
+        UserChanged(before.id, before),
+    ]
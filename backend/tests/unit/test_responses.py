@@ -0,0 +1,55 @@
+"""
+©AngelaMos | 2025
+test_responses.py
+"""
+
+import json
+from datetime import (
+    UTC,
+    datetime,
+)
+from uuid import uuid4
+
+from config import UserRole
+from core.responses import FastJSONResponse
+from user.schemas import (
+    UserListResponse,
+    UserResponse,
+)
+
+
+def _users() -> UserListResponse:
+    user = UserResponse(
+        id = uuid4(),
+        created_at = datetime.now(UTC),
+        email = "fast@test.com",
+        full_name = "Zoë Fast",
+        is_active = True,
+        is_verified = False,
+        role = UserRole.USER,
+    )
+    return UserListResponse(items = [user], total = 1, page = 1, size = 20)
+
+
+def test_fast_json_matches_model_dump_json():
+    """
+    A model renders to the same bytes as its own JSON serializer
+    """
+    users = _users()
+
+    response = FastJSONResponse(users)
+
+    assert response.body == users.model_dump_json().encode()
+    assert response.media_type == "application/json"
+
+
+def test_fast_json_matches_stock_json_for_plain_content():
+    """
+    Plain content decodes to what JSONResponse would have sent
+    """
+    content = {"detail": "Zoë", "items": [1, 2.5, None, True]}
+
+    response = FastJSONResponse(content)
+
+    assert json.loads(response.body) == content
+    assert "Zoë".encode() in response.body
@@ -0,0 +1,83 @@
+"""
+©AngelaMos | 2025
+test_search_cache.py
+"""
+
+import pytest
+
+from config import Language
+from core.cache import ResponseCache
+from search.cache import (
+    SearchCache,
+    normalize_query,
+)
+from search.schemas import SearchResultItem
+
+
+def test_normalize_query_ignores_case_order_and_repeats():
+    """
+    Stemmed language queries differing in case, order or repeated terms
+    share one key
+    """
+    assert normalize_query("  Python   Security ", Language.ENGLISH) == (
+        normalize_query("security python PYTHON", Language.ENGLISH)
+    )
+
+
+def test_normalize_query_keeps_order_for_trigram_languages():
+    """
+    Substring matched languages keep their term order
+    """
+    assert normalize_query("任务 调度", Language.MANDARIN) != (
+        normalize_query("调度 任务", Language.MANDARIN)
+    )
+
+
+def test_normalize_query_keeps_whitespace_for_trigram_languages():
+    """
+    Trigram queries are ILIKE patterns, whitespace changes what they match
+    """
+    assert normalize_query("任务  调度", Language.MANDARIN) == "任务  调度"
+    assert normalize_query(" 任务 调度", Language.MANDARIN) != (
+        normalize_query("任务 调度", Language.MANDARIN)
+    )
+
+
+def test_normalize_query_does_not_stem():
+    """
+    Inflected variants are not merged, the database answers each of them
+    """
+    assert normalize_query("securing", Language.ENGLISH) != (
+        normalize_query("security", Language.ENGLISH)
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_cache_without_redis_counts_misses():
+    """
+    Without Redis every lookup runs the search and nothing is kept
+    """
+    cache = SearchCache(ResponseCache())
+    results = [
+        SearchResultItem(
+            title = "Python",
+            url = "/projects/python",
+            type = "project",
+        )
+    ]
+
+    async def search() -> list[SearchResultItem]:
+        return results
+
+    for _ in range(2):
+        found = await cache.get_or_search(
+            "python",
+            Language.ENGLISH,
+            20,
+            True,
+            search,
+        )
+        assert found == results
+
+    assert cache.stats.misses == 2
+    assert cache.local_size == 0
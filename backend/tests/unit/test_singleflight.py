@@ -0,0 +1,77 @@
+"""
+©AngelaMos | 2025
+test_singleflight.py
+"""
+
+import asyncio
+
+import pytest
+
+from core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run():
+    """
+    Callers arriving while a call runs get its result without rerunning it
+    """
+    flight: SingleFlight[int] = SingleFlight()
+    release = asyncio.Event()
+    runs = 0
+
+    async def call() -> int:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return 42
+
+    callers = [
+        asyncio.create_task(flight.do("key", call)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert runs == 1
+    assert sorted(results) == [(42, False), (42, True), (42, True)]
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_call_running():
+    """
+    A caller that goes away does not cancel the call for the others
+    """
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", call))
+    second = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == ("done", True)
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_calls_after_completion_run_again():
+    """
+    Only concurrent calls are coalesced, results are not kept
+    """
+    flight: SingleFlight[int] = SingleFlight()
+    runs = 0
+
+    async def call() -> int:
+        nonlocal runs
+        runs += 1
+        return runs
+
+    assert await flight.do("key", call) == (1, False)
+    assert await flight.do("key", call) == (2, False)
@@ -0,0 +1,163 @@
+"""
+©AngelaMos | 2025
+test_snapshot.py
+"""
+
+from types import SimpleNamespace
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+)
+
+from config import (
+    BlogCategory,
+    Language,
+)
+from core.events import ContentChanged
+from core.notify import (
+    decode_change,
+    encode_change,
+)
+from snapshot import ContentIndex
+from snapshot.loader import snapshot_version
+
+
+class Item(BaseModel):
+    model_config = ConfigDict(from_attributes = True)
+
+    id: object
+    title: str
+
+
+def _row(
+    title: str,
+    language: Language = Language.ENGLISH,
+    *,
+    visible: bool = True,
+    featured: bool = False,
+    category: BlogCategory | None = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id = uuid4(),
+        title = title,
+        language = language,
+        is_visible = visible,
+        is_featured = featured,
+        category = category,
+    )
+
+
+def test_content_index_keeps_order_and_filters_views():
+    """
+    Views hold visible rows in input order, by_id holds every row
+    """
+    rows = [
+        _row("first", featured = True),
+        _row("hidden", visible = False),
+        _row("second", category = BlogCategory.TUTORIAL),
+        _row("spanish", Language.SPANISH),
+    ]
+
+    index = ContentIndex.build(
+        rows,
+        Item,
+        visible = lambda r: r.is_visible,
+        featured = lambda r: r.is_featured,
+        slug = lambda r: r.title,
+        category = lambda r: r.category,
+    )
+    view = index.language(Language.ENGLISH)
+
+    assert [i.title for i in view.visible] == ["first", "second"]
+    assert [i.title for i in view.featured] == ["first"]
+    assert [i.title for i in view.page(1, 10)] == ["second"]
+    assert view.by_slug["second"].title == "second"
+    assert [i.title for i in view.category(BlogCategory.TUTORIAL)] == [
+        "second"
+    ]
+    assert len(index.by_id) == 4
+    assert index.language(Language.HINDI).visible == ()
+
+
+class OrderedItem(BaseModel):
+    model_config = ConfigDict(from_attributes = True)
+
+    id: UUID
+    display_order: int
+
+
+def test_view_cursor_continues_after_last_row():
+    """
+    A cursor resumes after its (display_order, id) key, like the
+    repositories, and the last page has no cursor
+    """
+    rows = sorted(
+        (
+            SimpleNamespace(
+                id = uuid4(),
+                display_order = order,
+                language = Language.ENGLISH,
+            ) for order in (1, 1, 2, 3, 3)
+        ),
+        key = lambda r: (r.display_order, r.id),
+    )
+    view = ContentIndex.build(
+        rows,
+        OrderedItem,
+        visible = lambda _: True,
+        featured = lambda _: False,
+    ).language(Language.ENGLISH)
+
+    first, cursor = view.paginate(0, 2)
+    second, cursor = view.paginate(0, 2, cursor)
+    third, cursor = view.paginate(0, 2, cursor)
+
+    assert [i.id for i in first + second + third] == [r.id for r in rows]
+    assert cursor is None
+
+
+def test_snapshot_version_follows_content():
+    """
+    Equal rows give equal versions in every worker, any change a new one
+    """
+    rows = [_row("first"), _row("second")]
+
+    def build(source: list[SimpleNamespace]) -> ContentIndex[Item]:
+        return ContentIndex.build(
+            source,
+            Item,
+            visible = lambda r: r.is_visible,
+            featured = lambda r: r.is_featured,
+        )
+
+    version = snapshot_version(build(rows))
+    assert snapshot_version(build(rows)) == version
+
+    rows[1].title = "renamed"
+    renamed = snapshot_version(build(rows))
+    assert renamed != version
+
+    rows[1].is_visible = False
+    assert snapshot_version(build(rows)) != renamed
+
+
+def test_notify_payload_ignores_own_changes():
+    """
+    A process skips its own notifications, remote ones are flagged
+    """
+    event = ContentChanged("projects", Language.FRENCH)
+
+    assert decode_change(encode_change(event)) is None
+
+    foreign = encode_change(event).replace('"origin": "', '"origin": "x')
+    relayed = decode_change(foreign)
+    assert relayed == ContentChanged(
+        "projects",
+        Language.FRENCH,
+        remote = True,
+    )
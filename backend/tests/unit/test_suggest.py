@@ -0,0 +1,81 @@
+"""
+©AngelaMos | 2025
+test_suggest.py
+"""
+
+from config import Language
+from search.schemas import SuggestionItem
+from search.suggest import (
+    SuggestEntry,
+    SuggestIndex,
+)
+
+
+def _index() -> SuggestIndex:
+    index = SuggestIndex()
+    index.load(
+        [
+            SuggestEntry(
+                Language.ENGLISH,
+                SuggestionItem(
+                    text = "Kubernetes Operator",
+                    type = "project",
+                    url = "/projects/kube-op",
+                ),
+                ("Kubernetes Operator",
+                 "kube op"),
+            ),
+            SuggestEntry(
+                Language.ENGLISH,
+                SuggestionItem(text = "Python",
+                               type = "tech"),
+                ("Python", ),
+            ),
+            SuggestEntry(
+                Language.ENGLISH,
+                SuggestionItem(text = "python",
+                               type = "tech"),
+                ("python", ),
+            ),
+            SuggestEntry(
+                Language.MANDARIN,
+                SuggestionItem(text = "任务调度系统",
+                               type = "project"),
+                ("任务调度系统", ),
+            ),
+        ]
+    )
+    return index
+
+
+def test_suggest_matches_word_prefixes_case_insensitively():
+    """
+    Any word start of a title is a valid prefix
+    """
+    index = _index()
+
+    assert [s.text for s in index.suggest("KUB", Language.ENGLISH, 5)] == [
+        "Kubernetes Operator"
+    ]
+    assert [s.text for s in index.suggest("oper", Language.ENGLISH, 5)] == [
+        "Kubernetes Operator"
+    ]
+
+
+def test_suggest_deduplicates_and_isolates_languages():
+    """
+    Repeated terms collapse into one suggestion per language
+    """
+    index = _index()
+
+    assert len(index.suggest("py", Language.ENGLISH, 5)) == 1
+    assert index.suggest("py", Language.SPANISH, 5) == []
+
+
+def test_suggest_matches_inside_unsegmented_scripts():
+    """
+    Languages without word boundaries match from any character
+    """
+    index = _index()
+
+    assert len(index.suggest("调度", Language.MANDARIN, 5)) == 1
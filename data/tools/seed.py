@@ -35,13 +35,28 @@ load_dotenv(Path(__file__).parent.parent.parent / ".env")
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend" / "app"))
 
 from config import (
+    CACHE_NS_BLOGS,
+    CACHE_NS_CERTIFICATIONS,
+    CACHE_NS_EXPERIENCES,
+    CACHE_NS_PROJECTS,
     BlogCategory,
     CertificationCategory,
     EmploymentType,
     Language,
     ProjectStatus,
+    settings,
 )
 from core.Base import Base
+from core.cache import responsecache
+from core.edge import edgepurger
+from core.events import (
+    ContentChanged,
+    discard_pending_events,
+    publish_pending_events,
+    record_event,
+)
+from core.notify import notify_pending_events
+from auth.MaintenanceRun import MaintenanceRun  # noqa: F401
 from auth.RefreshToken import RefreshToken  # noqa: F401
 from user.User import User  # noqa: F401
 from project.Project import Project
@@ -55,6 +70,7 @@ SEED_PATH = Path(__file__).parent.parent / "data"
 DOMAIN_CONFIG = {
     "projects": {
         "model": Project,
+        "namespace": CACHE_NS_PROJECTS,
         "folder": "projects",
         "enums": {
             "language": Language,
@@ -65,6 +81,7 @@ DOMAIN_CONFIG = {
     },
     "experiences": {
         "model": Experience,
+        "namespace": CACHE_NS_EXPERIENCES,
         "file": "experience.json",
         "enums": {
             "language": Language,
@@ -74,6 +91,7 @@ DOMAIN_CONFIG = {
     },
     "certifications": {
         "model": Certification,
+        "namespace": CACHE_NS_CERTIFICATIONS,
         "file": "certifications.json",
         "enums": {
             "language": Language,
@@ -83,6 +101,7 @@ DOMAIN_CONFIG = {
     },
     "blogs": {
         "model": Blog,
+        "namespace": CACHE_NS_BLOGS,
         "file": "blogs.json",
         "enums": {
             "language": Language,
@@ -217,6 +236,7 @@ async def seed_domain(
 
     if clear and not dry_run:
         await session.execute(delete(model))
+        record_event(session, ContentChanged(namespace=config["namespace"]))
         print(f"  {color('yellow', 'Cleared existing records')}")
 
     inserted = 0
@@ -256,6 +276,14 @@ async def seed_domain(
                             record = model(**transformed)
                             session.add(record)
 
+                        record_event(
+                            session,
+                            ContentChanged(
+                                namespace=config["namespace"],
+                                language=transformed.get("language"),
+                            ),
+                        )
+
                     inserted += 1
 
                 except TypeError as e:
@@ -299,6 +327,11 @@ async def main():
 
     engine = create_async_engine(db_url, echo=False)
 
+    if settings.REDIS_URL and not dry_run:
+        responsecache.init(str(settings.REDIS_URL))
+    if settings.EDGE_PURGE_URL and not dry_run:
+        edgepurger.init(str(settings.EDGE_PURGE_URL))
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -323,13 +356,20 @@ async def main():
             total_errors += errors
 
         if not dry_run and total_errors == 0:
+            await notify_pending_events(session)
             await session.commit()
+            await publish_pending_events(session)
             print(f"\n{color('green', '✓ Committed to database')}")
         elif total_errors > 0:
+            discard_pending_events(session)
             await session.rollback()
             print(f"\n{color('red', '✗ Rolled back due to errors')}")
 
     await engine.dispose()
+    if edgepurger.is_enabled:
+        await edgepurger.close()
+    if responsecache.is_available:
+        await responsecache.close()
 
     print(f"\n{color('bold', '━━━ Summary ━━━')}")
     print(f"Inserted: {total_inserted} | Errors: {total_errors}")